@@ -0,0 +1,53 @@
+"""Per-record cost of normalize_os in full vs lean mode and under field projections.
+
+Run: uv run python benchmarks/bench_lean.py [rounds]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from os_normalizer import NormalizeOptions, normalize_os
+
+SAMPLES = [
+    ("Windows NT 10.0 build 22631 Enterprise x64", None),
+    ("Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9", None),
+    ("Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T", None),
+    ("Linux host 5.15.0-122-generic x86_64", {"os_release": "ID=ubuntu\nVERSION_ID=22.04"}),
+    ("Darwin 24.0.0 arm64", None),
+    ("Huawei VRP V800R012C00SPC500 S5720-28X-SI-AC", None),
+]
+
+
+MODES = [
+    ("full", None),
+    ("lazy os_key", "lazy"),
+    ("lean", "lean"),
+    ("fields=family,version", NormalizeOptions(fields={"family", "product", "version_major", "version_minor"})),
+    ("fields=family,arch", NormalizeOptions(fields={"family", "arch"})),
+    ("fields=family", NormalizeOptions(fields={"family"})),
+]
+
+
+def measure(options, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text, data in SAMPLES:
+            normalize_os(text, data, options)
+    return 1e6 * (time.perf_counter() - start) / (rounds * len(SAMPLES))
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    measure(None, rounds // 10)  # warm-up
+    print(f"records: {rounds * len(SAMPLES)}")
+    full = None
+    for label, options in MODES:
+        cost = measure(options, rounds)
+        full = full or cost
+        print(f"{label:<24}: {cost:6.2f} us/record ({100 * (1 - cost / full):5.1f}% saved)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measure resident bytes per OSData record.
+
+Compares the slotted OSData (lazy evidence/like_distros) against an equivalent
+regular dataclass with eagerly allocated containers, which is how OSData was
+laid out before it became slotted.
+
+Run: uv run python benchmarks/bench_memory.py [records]
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+
+from os_normalizer import normalize_os
+from os_normalizer.helpers import copy_osdata
+from os_normalizer.models import OSData
+
+SAMPLES = [
+    ("Windows NT 10.0 build 22631 Enterprise x64", None),
+    ("Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9", None),
+    ("Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T", None),
+    ("Linux host 5.15.0-122-generic x86_64", {"os_release": "ID=ubuntu\nVERSION_ID=22.04"}),
+    ("Darwin 24.0.0 arm64", None),
+]
+
+LegacyOSData = make_dataclass(
+    "LegacyOSData",
+    [
+        (f.name, object, field(default_factory=dict if f.name == "evidence" else list))
+        if f.name in ("evidence", "like_distros")
+        else (f.name, object, field(default=None))
+        for f in fields(OSData)
+    ],
+)
+
+
+def _legacy(p: OSData) -> object:
+    values = {f.name: getattr(p, f.name) for f in fields(OSData)}
+    values["evidence"] = dict(values["evidence"])
+    values["like_distros"] = list(values["like_distros"])
+    return LegacyOSData(**values)
+
+
+def measure(build, n: int) -> float:
+    parsed = [normalize_os(text, data) for text, data in SAMPLES]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = [build(parsed[i % len(parsed)]) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return (after - before) / n
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    # Copies share field values with the template, so only the per-instance overhead is counted
+    legacy = measure(_legacy, n)
+    slotted = measure(copy_osdata, n)
+    print(f"records: {n}")
+    print(f"dict-based dataclass, eager containers : {legacy:7.1f} bytes/record")
+    print(f"slotted OSData, lazy containers        : {slotted:7.1f} bytes/record")
+    print(f"saving                                 : {100 * (1 - slotted / legacy):6.1f}%")
+
+
+if __name__ == "__main__":
+    main()
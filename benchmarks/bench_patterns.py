@@ -0,0 +1,56 @@
+"""Rank the package's compiled regexes by cost on a corpus (PatternProfiler).
+
+Run: uv run python benchmarks/bench_patterns.py [corpus.txt] [rounds]
+
+corpus.txt holds one input per line; the built-in samples are used without it.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from os_normalizer import normalize_os
+from os_normalizer.profiling import PatternProfiler
+
+SAMPLES = [
+    "Windows NT 10.0 build 22631 Enterprise x64",
+    "Microsoft Windows Server 2019 Datacenter 10.0.17763",
+    "Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9, c9300-universalk9.17.09.04a.SPA.bin",
+    "Cisco Nexus Operating System (NX-OS) Software nxos.9.3.5.bin N9K-C93180YC-FX",
+    "Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T",
+    "FortiGate-100F v7.2.7 build1600 (GA) FGT_7.2.7-build1600",
+    "Huawei VRP V800R012C00SPC500 S5720-28X-SI-AC",
+    "NETGEAR Firmware V1.0.9.88_10.2.88 R7000",
+    "Linux host 5.15.0-122-generic x86_64",
+    "Darwin Mac-Studio.local 24.6.0 Darwin Kernel Version 24.6.0: Mon Jul 14 11:30:40 PDT 2025; arm64",
+    "FreeBSD 13.2-RELEASE amd64",
+    "SunOS 5.11 11.4.42.111.0 i86pc",
+    "VMware ESXi 8.0.2 build-22380479",
+    "Android 14",
+]
+
+
+def main() -> None:
+    corpus = SAMPLES
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as fh:
+            corpus = [line.rstrip("\n") for line in fh if line.strip()]
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    with PatternProfiler() as profiler:
+        for _ in range(rounds):
+            for text in corpus:
+                normalize_os(text)
+
+    print(f"inputs: {rounds * len(corpus)}")
+    print(f"{'pattern':<62} {'scans':>8} {'hit %':>6} {'mean us':>8} {'total ms':>9}")
+    for s in profiler.report():
+        hit = 100 * s.matches / s.scans if s.scans else 0.0
+        print(f"{s.name:<62} {s.scans:>8} {hit:>6.1f} {1e6 * s.mean:>8.2f} {1e3 * s.seconds:>9.2f}")
+    dead = profiler.dead()
+    if dead:
+        print("\nscanned but never matched:", ", ".join(s.name.rpartition(".")[2] for s in dead))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compare pickled size and pickle/unpickle time for OSData.
+
+"default" is the stock slotted-dataclass pickle (every slot shipped by name,
+enum members by value), which is what OSData used before its compact __reduce__.
+
+Run: uv run python benchmarks/bench_pickle.py [records]
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+import time
+
+from os_normalizer import normalize_os
+from os_normalizer.models import OSData
+
+SAMPLES = [
+    ("Windows NT 10.0 build 22631 Enterprise x64", None),
+    ("Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9", None),
+    ("Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T", None),
+    ("Linux host 5.15.0-122-generic x86_64", {"os_release": "ID=ubuntu\nVERSION_ID=22.04"}),
+    ("Darwin 24.0.0 arm64", None),
+]
+
+
+class StockOSData(OSData):
+    """OSData with the stock object.__reduce__ (slot state pickled by name)."""
+
+    __slots__ = ()
+    __reduce__ = object.__reduce__
+
+
+def _stock(p: OSData) -> StockOSData:
+    return StockOSData(**{name: getattr(p, name) for name in OSData.__dataclass_fields__})
+
+
+def measure(records: list[OSData], label: str) -> None:
+    start = time.perf_counter()
+    blob = pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+    mid = time.perf_counter()
+    pickle.loads(blob)
+    end = time.perf_counter()
+    n = len(records)
+    print(f"{label:<10} {len(blob) / n:10.1f} {1e6 * (mid - start) / n:10.2f} {1e6 * (end - mid) / n:10.2f}")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    # Distinct suffixes defeat pickle's memo so every record is encoded in full
+    records = [normalize_os(f"{SAMPLES[i % len(SAMPLES)][0]} {i}", SAMPLES[i % len(SAMPLES)][1]) for i in range(n)]
+    print(f"records: {n}")
+    print(f"{'pickle':<10} {'bytes/rec':>10} {'dump us':>10} {'load us':>10}")
+    measure([_stock(p) for p in records], "default")
+    measure(records, "compact")
+
+
+if __name__ == "__main__":
+    main()
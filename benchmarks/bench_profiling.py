@@ -0,0 +1,47 @@
+"""Overhead of per-stage timing on normalize_os, disabled vs enabled.
+
+Run: uv run python benchmarks/bench_profiling.py [rounds]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from os_normalizer import normalize_os
+from os_normalizer.profiling import StageTimer
+
+SAMPLES = [
+    ("Windows NT 10.0 build 22631 Enterprise x64", None),
+    ("Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9", None),
+    ("Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T", None),
+    ("Linux host 5.15.0-122-generic x86_64", {"os_release": "ID=ubuntu\nVERSION_ID=22.04"}),
+    ("Darwin 24.0.0 arm64", None),
+    ("Huawei VRP V800R012C00SPC500 S5720-28X-SI-AC", None),
+]
+
+
+def measure(rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text, data in SAMPLES:
+            normalize_os(text, data)
+    return 1e6 * (time.perf_counter() - start) / (rounds * len(SAMPLES))
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    measure(rounds // 10)  # warm-up
+    print(f"records: {rounds * len(SAMPLES)}")
+    off = measure(rounds)
+    with StageTimer() as timer:
+        on = measure(rounds)
+    print(f"timing disabled: {off:6.2f} us/record")
+    print(f"timing enabled : {on:6.2f} us/record ({100 * (on / off - 1):+5.1f}%)")
+    print()
+    for stage, stats in timer.snapshot().items():
+        print(f"{stage:<16} calls={stats.calls:>8}  mean={1e6 * stats.mean:6.2f} us  total={stats.seconds:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare OSData serializers by encode/decode time and payload size.
+
+Run: uv run python benchmarks/bench_serialize.py [records]
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import sys
+import time
+from dataclasses import asdict
+
+from os_normalizer import normalize_os
+from os_normalizer.models import OSData
+
+SAMPLES = [
+    ("Windows NT 10.0 build 22631 Enterprise x64", None),
+    ("Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9", None),
+    ("Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T", None),
+    ("Linux host 5.15.0-122-generic x86_64", {"os_release": "ID=ubuntu\nVERSION_ID=22.04"}),
+    ("Darwin 24.0.0 arm64", None),
+]
+
+
+def _asdict_json(p: OSData) -> bytes:
+    return json.dumps(asdict(p), separators=(",", ":"), default=str).encode()
+
+
+def _to_dict_json(p: OSData) -> bytes:
+    return json.dumps(p.to_dict(), separators=(",", ":")).encode()
+
+
+CODECS = [
+    ("asdict + json", _asdict_json, lambda b: OSData.from_dict(json.loads(b))),
+    ("to_dict + json", _to_dict_json, lambda b: OSData.from_dict(json.loads(b))),
+    ("to_bytes", OSData.to_bytes, OSData.from_bytes),
+    (
+        "to_tuple + pickle",
+        lambda p: pickle.dumps(p.to_tuple(), protocol=5),
+        lambda b: OSData.from_tuple(pickle.loads(b)),
+    ),
+]
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    parsed = [normalize_os(text, data) for text, data in SAMPLES]
+    records = [parsed[i % len(parsed)] for i in range(n)]
+    print(f"records: {n}")
+    print(f"{'codec':<20} {'encode us':>10} {'decode us':>10} {'bytes/rec':>10}")
+    for name, encode, decode in CODECS:
+        start = time.perf_counter()
+        blobs = [encode(p) for p in records]
+        mid = time.perf_counter()
+        for b in blobs:
+            decode(b)
+        end = time.perf_counter()
+        size = sum(len(b) for b in blobs) / n
+        print(f"{name:<20} {1e6 * (mid - start) / n:10.2f} {1e6 * (end - mid) / n:10.2f} {size:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,18 @@
-from .models import OSData
+from .batch import normalize_many, normalize_stream
+from .cache import NormalizeCache
+from .models import FrozenOSData, OSData
+from .options import NormalizeOptions
 from .os_normalizer import choose_best_fact, normalize_os, merge_os, update_os
 
 __all__ = [
+    "FrozenOSData",
+    "NormalizeCache",
+    "NormalizeOptions",
     "OSData",
     "choose_best_fact",
+    "normalize_many",
     "normalize_os",
+    "normalize_stream",
     "merge_os",
     "update_os",
 ]
@@ -0,0 +1,126 @@
+"""Asyncio front end that keeps normalization off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from typing import Any
+
+from os_normalizer.batch import Record, normalize_many
+from os_normalizer.models import OSData
+from os_normalizer.os_normalizer import normalize_os
+
+
+async def normalize_async(text: str, data: dict | None = None, executor: Executor | None = None) -> OSData:
+    """Run normalize_os in an executor (the loop's default thread pool when None)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, normalize_os, text, data)
+
+
+async def normalize_many_async(
+    records: Iterable[Record],
+    executor: Executor | None = None,
+    errors: str = "return",
+) -> list[OSData | Exception]:
+    """Run normalize_many over a batch of records in an executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, normalize_many, list(records), errors)
+
+
+class AsyncNormalizer:
+    """Coalesce concurrent normalize requests into micro-batches.
+
+    Requests wait in a bounded queue; once `max_queue` requests are pending,
+    callers of normalize() are suspended until the batcher catches up. The batcher
+    collects up to `max_batch` requests (waiting at most `max_delay` seconds after
+    the first one) and runs them through normalize_many in the executor, so
+    duplicate inputs arriving in a burst are parsed once.
+
+    Use as an async context manager, or call start()/close() explicitly.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_batch: int = 256,
+        max_delay: float = 0.002,
+        max_queue: int = 4096,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_queue = max_queue
+        self._queue: asyncio.Queue[tuple[str, dict | None, asyncio.Future]] | None = None
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> AsyncNormalizer:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Start the background batching task on the running loop."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Drain pending requests and stop the batching task."""
+        if self._task is None or self._queue is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self._queue = None
+
+    async def normalize(self, text: str, data: dict | None = None) -> OSData:
+        """Queue one input and wait for its parsed result."""
+        if self._queue is None:
+            raise RuntimeError("AsyncNormalizer is not started")
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, data, fut))
+        return await fut
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+            try:
+                await self._dispatch(loop, batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _dispatch(self, loop: asyncio.AbstractEventLoop, batch: list[tuple[str, dict | None, Any]]) -> None:
+        records = [(text, data) for text, data, _ in batch]
+        try:
+            results = await loop.run_in_executor(self.executor, normalize_many, records)
+        except Exception as exc:
+            results = [exc] * len(batch)
+        for (_, _, fut), result in zip(batch, results, strict=True):
+            if fut.done():
+                continue
+            if isinstance(result, Exception):
+                fut.set_exception(result)
+            else:
+                fut.set_result(result)
@@ -0,0 +1,210 @@
+"""Batch normalization APIs layered on top of normalize_os."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any
+
+from os_normalizer.helpers import copy_osdata, input_key
+from os_normalizer.models import OSData
+from os_normalizer.options import NormalizeOptions
+from os_normalizer.os_normalizer import normalize_os
+
+# A record is either raw text, a (text, data) pair, or a mapping with "text"/"data" keys.
+Record = str | tuple[str, dict | None] | Mapping[str, Any]
+
+# Default number of recent distinct inputs remembered by normalize_stream
+DEFAULT_STREAM_WINDOW = 4096
+
+# Upper bound on records shipped to a worker process per task
+MAX_CHUNK_SIZE = 2048
+
+
+def split_record(record: Record) -> tuple[str, dict | None]:
+    """Return the (text, data) pair described by a batch record.
+
+    Raises TypeError when the record has no text (a missing "text" key or None).
+    """
+    if isinstance(record, str):
+        return record, None
+    if isinstance(record, Mapping):
+        text, data = record.get("text"), record.get("data")
+    else:
+        text, data = record
+    if text is None:
+        raise TypeError("batch record has no text")
+    return text, data
+
+
+def normalize_many(
+    records: Iterable[Record],
+    errors: str = "return",
+    workers: int | None = None,
+    chunksize: int | None = None,
+    options: NormalizeOptions | str | None = None,
+) -> list[OSData | Exception]:
+    """Normalize a batch of records, parsing each distinct (text, data) input once.
+
+    Results are returned in input order. Duplicate inputs receive independent copies
+    of the first parse so callers can mutate them freely. With errors="return" a
+    record that fails to normalize yields the raised exception in its slot instead
+    of aborting the batch; errors="raise" re-raises the first failure.
+
+    Set workers > 1 to spread the distinct inputs over a process pool. Chunks are
+    sized automatically unless chunksize is given, and results keep input order.
+    options is passed through to normalize_os.
+    """
+    if errors not in ("return", "raise"):
+        raise ValueError(f"Unknown errors mode: {errors!r}")
+    opts = NormalizeOptions.resolve(options) if options is not None else None
+
+    # Collapse the batch to distinct inputs; slots holds an index into `distinct`
+    # or the exception raised while reading a malformed record.
+    distinct: list[tuple[str, dict | None]] = []
+    index_by_key: dict[Any, int] = {}
+    slots: list[int | Exception] = []
+    for record in records:
+        try:
+            text, data = split_record(record)
+        except (TypeError, ValueError) as exc:
+            if errors == "raise":
+                raise
+            slots.append(exc)
+            continue
+
+        try:
+            key = input_key(text, data)
+        except TypeError:
+            # Unhashable supplemental data: normalize without deduplication
+            key = None
+
+        idx = index_by_key.get(key) if key is not None else None
+        if idx is None:
+            idx = len(distinct)
+            distinct.append((text, data))
+            if key is not None:
+                index_by_key[key] = idx
+        slots.append(idx)
+
+    if workers is not None and workers > 1 and len(distinct) > 1:
+        results = _normalize_parallel(distinct, workers, chunksize, opts)
+    else:
+        results = [_normalize_one(text, data, opts) for text, data in distinct]
+
+    out: list[OSData | Exception] = []
+    handed_out = [False] * len(results)
+    for slot in slots:
+        if isinstance(slot, Exception):
+            out.append(slot)
+            continue
+        result = results[slot]
+        if isinstance(result, Exception):
+            if errors == "raise":
+                raise result
+            out.append(result)
+        elif handed_out[slot]:
+            out.append(copy_osdata(result))
+        else:
+            handed_out[slot] = True
+            out.append(result)
+    return out
+
+
+def normalize_stream(
+    records: Iterable[Any],
+    window: int = DEFAULT_STREAM_WINDOW,
+    keyed: bool = False,
+    errors: str = "return",
+    options: NormalizeOptions | str | None = None,
+) -> Iterator[Any]:
+    """Lazily normalize an iterable of records, yielding results as input arrives.
+
+    Duplicate inputs seen within the last `window` distinct inputs are served from
+    a bounded LRU window instead of being re-parsed, so memory stays bounded
+    regardless of input size. Every yielded OSData is an independent object.
+
+    With keyed=True each item must be a (key, record) pair and (key, result)
+    pairs are yielded, letting callers carry row identifiers through the stream;
+    an item that is not a pair yields (None, error). Error handling and options
+    follow normalize_many().
+    """
+    if errors not in ("return", "raise"):
+        raise ValueError(f"Unknown errors mode: {errors!r}")
+    if window < 0:
+        raise ValueError("window must be >= 0")
+    opts = NormalizeOptions.resolve(options) if options is not None else None
+
+    recent: OrderedDict[Any, OSData | Exception] = OrderedDict()
+    for item in records:
+        row_key = None
+        try:
+            if keyed:
+                row_key, record = item
+            else:
+                record = item
+            text, data = split_record(record)
+        except (TypeError, ValueError) as exc:
+            if errors == "raise":
+                raise
+            yield (row_key, exc) if keyed else exc
+            continue
+
+        try:
+            key = input_key(text, data) if window else None
+        except TypeError:
+            key = None
+
+        cached = recent.get(key) if key is not None else None
+        if cached is not None:
+            recent.move_to_end(key)
+            result = copy_osdata(cached) if isinstance(cached, OSData) else cached
+        else:
+            result = _normalize_one(text, data, opts)
+            if key is not None:
+                # Keep a private copy so callers mutating the yielded object cannot corrupt the window
+                recent[key] = copy_osdata(result) if isinstance(result, OSData) else result
+                if len(recent) > window:
+                    recent.popitem(last=False)
+
+        if errors == "raise" and isinstance(result, Exception):
+            raise result
+        yield (row_key, result) if keyed else result
+
+
+def _normalize_one(text: str, data: dict | None, opts: NormalizeOptions | None = None) -> OSData | Exception:
+    try:
+        return normalize_os(text, data) if opts is None else normalize_os(text, data, opts)
+    except Exception as exc:
+        return exc
+
+
+# ============================================================
+# Process-pool support
+# ============================================================
+
+
+def _normalize_parallel(
+    inputs: list[tuple[str, dict | None]], workers: int, chunksize: int | None, opts: NormalizeOptions | None
+) -> list[OSData | Exception]:
+    size = chunksize or _auto_chunksize(len(inputs), workers)
+    chunks = [inputs[i : i + size] for i in range(0, len(inputs), size)]
+    out: list[OSData | Exception] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for results in pool.map(partial(_normalize_chunk, opts=opts), chunks):
+            out.extend(results)
+    return out
+
+
+def _auto_chunksize(n: int, workers: int) -> int:
+    """Aim for ~4 chunks per worker so stragglers do not idle the pool."""
+    return max(1, min(MAX_CHUNK_SIZE, -(-n // (workers * 4))))
+
+
+def _normalize_chunk(
+    chunk: list[tuple[str, dict | None]], opts: NormalizeOptions | None = None
+) -> list[OSData | Exception]:
+    """Worker entry point: normalize a chunk (results travel via OSData's compact pickle)."""
+    return [_normalize_one(text, data, opts) for text, data in chunk]
@@ -0,0 +1,235 @@
+"""Opt-in memoization layer in front of normalize_os."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from os_normalizer.canonical import canonicalize_text
+from os_normalizer.helpers import copy_osdata, input_key
+from os_normalizer.models import OSData
+from os_normalizer.os_normalizer import normalize_os
+from os_normalizer.store import input_digest_bytes
+
+DEFAULT_CACHE_SIZE = 65536
+DEFAULT_NEGATIVE_CAPACITY = 1_000_000
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+
+
+class CacheInfo(NamedTuple):
+    """Hit/miss statistics, mirroring functools.lru_cache's cache_info()."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class NormalizeCache:
+    """Bounded LRU cache of normalize_os results.
+
+    Keys combine the stripped input text with a canonical frozen form of the
+    supplemental data (including an `os_release` string or dict). Cached entries
+    are private: every lookup returns an independent copy, so callers can mutate
+    the returned OSData (evidence, like_distros, ...) without corrupting the cache.
+    Inputs whose data cannot be frozen are parsed without caching.
+
+    With canonicalize=True the text part of the key is passed through
+    canonicalize_text(), so banners differing only in node name or build
+    timestamp share one entry.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, canonicalize: bool = False) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self.maxsize = maxsize
+        self.canonicalize = canonicalize
+        self._entries: OrderedDict[Any, OSData] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, text: str, data: dict | None = None) -> OSData:
+        return self.normalize(text, data)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def normalize(self, text: str, data: dict | None = None) -> OSData:
+        """Return normalize_os(text, data), served from the cache when possible."""
+        try:
+            key = self.key_for(text, data)
+        except TypeError:
+            key = None
+
+        if key is not None:
+            with self._lock:
+                hit = self._entries.get(key)
+                if hit is not None:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return copy_osdata(hit)
+                self._misses += 1
+        else:
+            with self._lock:
+                self._misses += 1
+
+        result = normalize_os(text, data)
+        if key is not None and self.maxsize:
+            with self._lock:
+                self._entries[key] = copy_osdata(result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return result
+
+    def key_for(self, text: str, data: dict | None) -> Any:
+        """Return the cache key for an input pair (raises TypeError if unhashable)."""
+        if isinstance(text, str):
+            text = canonicalize_text(text) if self.canonicalize else text.strip()
+        return input_key(text, data)
+
+    def cache_info(self) -> CacheInfo:
+        """Report hits, misses, maxsize and current size."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+# ============================================================
+# Negative cache for inputs that resolve to UNKNOWN
+# ============================================================
+
+
+class NegativeCacheInfo(NamedTuple):
+    """Statistics for NegativeCache; skip_rate is skipped / lookups."""
+
+    lookups: int
+    skipped: int
+    parsed: int
+    added: int
+    resets: int
+    currsize: int
+    capacity: int
+    skip_rate: float
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over byte-string keys."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self._bits[i >> 3] & (1 << (i & 7)) for i in self._indexes(key))
+
+    def add(self, key: bytes) -> None:
+        for i in self._indexes(key):
+            self._bits[i >> 3] |= 1 << (i & 7)
+        self.count += 1
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
+
+    def _indexes(self, key: bytes) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing over a 128-bit digest
+        h1 = int.from_bytes(key[:8], "little")
+        h2 = int.from_bytes(key[8:16], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+
+class NegativeCache:
+    """Bloom-filter short-circuit for inputs known to resolve to nothing.
+
+    Inputs whose parse yields the blank UNKNOWN result (no family, no arch,
+    nothing extracted) are remembered in a Bloom filter; later occurrences skip
+    detect_family, the parsers and CPE generation and receive a copy of that
+    shared result. A false positive returns UNKNOWN for a parseable input at
+    roughly `error_rate`, so pick the rate accordingly. The filter is cleared
+    once `capacity` inputs have been added, which bounds both memory and the
+    effective false-positive rate.
+
+    Misses are delegated to `normalizer` (normalize_os by default), so this can
+    sit in front of a NormalizeCache.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_NEGATIVE_CAPACITY,
+        error_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+        normalizer: Callable[[str, dict | None], OSData] | None = None,
+        canonicalize: bool = False,
+    ) -> None:
+        self.normalizer = normalizer if normalizer is not None else normalize_os
+        self.canonicalize = canonicalize
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._unknown = normalize_os("")
+        self._lock = threading.Lock()
+        self._lookups = 0
+        self._skipped = 0
+        self._added = 0
+        self._resets = 0
+
+    def __call__(self, text: str, data: dict | None = None) -> OSData:
+        return self.normalize(text, data)
+
+    def normalize(self, text: str, data: dict | None = None) -> OSData:
+        """Return the shared UNKNOWN result for known junk, else delegate."""
+        try:
+            key = input_digest_bytes(text, data, self.canonicalize)
+        except (TypeError, AttributeError):
+            return self.normalizer(text, data)
+
+        with self._lock:
+            self._lookups += 1
+            if key in self._bloom:
+                self._skipped += 1
+                return copy_osdata(self._unknown)
+
+        result = self.normalizer(text, data)
+        if result == self._unknown and result.os_key == self._unknown.os_key:
+            with self._lock:
+                if self._bloom.count >= self._bloom.capacity:
+                    self._bloom.clear()
+                    self._resets += 1
+                self._bloom.add(key)
+                self._added += 1
+        return result
+
+    def cache_info(self) -> NegativeCacheInfo:
+        with self._lock:
+            return NegativeCacheInfo(
+                lookups=self._lookups,
+                skipped=self._skipped,
+                parsed=self._lookups - self._skipped,
+                added=self._added,
+                resets=self._resets,
+                currsize=self._bloom.count,
+                capacity=self._bloom.capacity,
+                skip_rate=self._skipped / self._lookups if self._lookups else 0.0,
+            )
+
+    def clear(self) -> None:
+        """Forget all known-junk inputs and reset statistics."""
+        with self._lock:
+            self._bloom.clear()
+            self._lookups = self._skipped = self._added = self._resets = 0
@@ -0,0 +1,106 @@
+"""Cache-key canonicalization for volatile banner tokens.
+
+uname-style banners embed a node name and a build timestamp that never influence
+the parsed result, yet make otherwise identical inputs unique. canonicalize_text()
+masks those tokens so caches can share one entry between them.
+
+Masking is conservative: a token is only replaced when it sits in a position the
+parsers never read from and contains nothing any detection or parsing pattern
+could match. Otherwise the text is returned unchanged.
+"""
+
+from __future__ import annotations
+
+import re
+
+from os_normalizer.constants import CISCO_TRAIN_NAMES, MACOS_ALIASES, MACOS_DARWIN_MAP
+from os_normalizer.helpers import ARCH_TEXT_RE
+
+NODE_PLACEHOLDER = "host"
+DATE_PLACEHOLDER = "<date>"
+
+# uname -a shapes: "<sysname> <nodename> <release> <rest...>"
+UNAME_RE = re.compile(
+    r"^(Linux|Darwin|SunOS|VMkernel)([ \t]+)(\S+)([ \t]+\d+\.\d+\S*)(.*)\Z",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Build timestamps as printed by uname -v, e.g. "Mon Jul 14 11:30:40 PDT 2025"
+TIMESTAMP_RE = re.compile(
+    r"\b(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+"
+    r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+"
+    r"\d{1,2}\s+\d{1,2}:\d{2}:\d{2}(?:\s+[A-Z]{2,5})?\s+\d{4}\b",
+)
+
+# Substrings that detect_family or a parser reacts to; a node name containing any of them is kept.
+_SIGNAL_TOKENS: tuple[str, ...] = (
+    "harmonyos",
+    "cisco",
+    "nx-os",
+    "nexus",
+    "ios",
+    "junos",
+    "forti",
+    "huawei",
+    "vrp",
+    "netgear",
+    "firmware",
+    "vmkernel",
+    "vmware",
+    "esxi",
+    "sunos",
+    "solaris",
+    "generic",
+    "linux",
+    "kernel",
+    "uname",
+    "windows",
+    "nt ",
+    "macos",
+    "os x",
+    "darwin",
+    "android",
+    "bsd",
+    *MACOS_ALIASES,
+    *(code.lower() for _, _, code in MACOS_DARWIN_MAP.values()),
+    *(train.lower() for train in CISCO_TRAIN_NAMES),
+)
+
+
+def canonicalize_text(text: str) -> str:
+    """Return text with parser-irrelevant volatile tokens masked.
+
+    For "<sysname> <nodename> <release> ..." banners the node name is replaced by
+    NODE_PLACEHOLDER when it is provably inert, and build timestamps after the
+    release token are replaced by DATE_PLACEHOLDER. The result parses to the same
+    OSData as the original text; anything unrecognised is returned stripped but
+    otherwise untouched.
+    """
+    text = text.strip()
+    m = UNAME_RE.match(text)
+    if not m:
+        return text
+    sysname, sep, node, release, rest = m.groups()
+    if _node_is_inert(node, darwin=sysname.lower() == "darwin"):
+        node = NODE_PLACEHOLDER
+    rest = TIMESTAMP_RE.sub(_mask_timestamp, rest)
+    return f"{sysname}{sep}{node}{release}{rest}"
+
+
+def _mask_timestamp(m: re.Match[str]) -> str:
+    stamp = m.group(0)
+    return stamp if _has_signal(stamp) else DATE_PLACEHOLDER
+
+
+def _has_signal(token: str) -> bool:
+    padded = f" {token.lower()} "
+    return any(t in padded for t in _SIGNAL_TOKENS) or ARCH_TEXT_RE.search(token) is not None
+
+
+def _node_is_inert(node: str, darwin: bool) -> bool:
+    if _has_signal(node):
+        return False
+    # DARWIN_RE takes the first digit run after "darwin"; other parsers need a dotted version
+    if darwin:
+        return not any(ch.isdigit() for ch in node)
+    return re.search(r"\d\.\d", node) is None
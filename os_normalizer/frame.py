@@ -0,0 +1,305 @@
+"""Columnar (struct-of-arrays) storage for large sets of parse results."""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from os_normalizer.constants import OSFamily, PrecisionLevel
+from os_normalizer.models import OSData
+
+# Stored value for None in every integer/code column
+NULL = -1
+
+# Largest value of the array('q') version columns; wider numbers saturate
+INT_MAX = (1 << 63) - 1
+
+INT_COLUMNS = ("version_major", "version_minor", "version_patch")
+ENUM_COLUMNS = ("family", "precision")
+STRING_COLUMNS = (
+    "vendor",
+    "product",
+    "edition",
+    "codename",
+    "channel",
+    "version_build",
+    "kernel_name",
+    "kernel_version",
+    "arch",
+    "distro",
+    "pretty_name",
+    "hw_model",
+    "build_id",
+    "os_key",
+)
+COLUMNS = (*ENUM_COLUMNS, *INT_COLUMNS, *STRING_COLUMNS, "confidence", "version_key")
+
+_ENUM_TYPES: dict[str, type] = {"family": OSFamily, "precision": PrecisionLevel}
+_ENUMS: dict[str, tuple] = {name: tuple(enum) for name, enum in _ENUM_TYPES.items()}
+_ENUM_CODES: dict[str, dict[Any, int]] = {name: {m: i for i, m in enumerate(ms)} for name, ms in _ENUMS.items()}
+
+
+class OSDataFrame:
+    """Column-wise store of OSData results.
+
+    family and precision are kept as enum ordinals (array('b')), the version
+    numbers as array('q') (saturating at INT_MAX), confidence as array('d'),
+    and the string fields as array('i') codes into a per-column dictionary.
+    None is stored as NULL (-1).
+    A derived version_key column (array('Q'), see OSData.version_key) supports
+    version ordering and range filters.
+    evidence and like_distros are not kept, so row() returns those empty.
+
+    Failed records (exceptions in normalize_many output) become all-NULL rows
+    so positions keep lining up with the input; row() returns None for them.
+
+    Frames derived via filter/sort/take share dictionaries with their source.
+    """
+
+    def __init__(self) -> None:
+        self._enums = {name: array("b") for name in ENUM_COLUMNS}
+        self._ints = {name: array("q") for name in INT_COLUMNS}
+        self._codes = {name: array("i") for name in STRING_COLUMNS}
+        self._dicts: dict[str, list[str]] = {name: [] for name in STRING_COLUMNS}
+        self._index: dict[str, dict[str, int]] = {name: {} for name in STRING_COLUMNS}
+        self._confidence = array("d")
+        self._version_keys = array("Q")
+
+    @classmethod
+    def from_results(cls, results: Iterable[OSData | Exception | None]) -> OSDataFrame:
+        """Build a frame from OSData results (e.g. normalize_many output)."""
+        frame = cls()
+        for p in results:
+            frame.append(p)
+        return frame
+
+    def __len__(self) -> int:
+        return len(self._confidence)
+
+    def __iter__(self) -> Iterator[OSData | None]:
+        return (self.row(i) for i in range(len(self)))
+
+    def append(self, p: OSData | Exception | None) -> None:
+        """Add one result; anything that is not an OSData becomes a NULL row."""
+        if not isinstance(p, OSData):
+            for col in (*self._enums.values(), *self._ints.values(), *self._codes.values()):
+                col.append(NULL)
+            self._confidence.append(0.0)
+            self._version_keys.append(0)
+            return
+        # Convert everything first so a bad value leaves every column untouched
+        enums = [_enum_code(name, getattr(p, name)) for name in self._enums]
+        ints = [_int_value(getattr(p, name)) for name in self._ints]
+        confidence = float(p.confidence)
+        version_key = p.version_key()
+        for col, code in zip(self._enums.values(), enums, strict=True):
+            col.append(code)
+        for col, value in zip(self._ints.values(), ints, strict=True):
+            col.append(value)
+        for name, col in self._codes.items():
+            col.append(self._encode(name, getattr(p, name)))
+        self._confidence.append(confidence)
+        self._version_keys.append(version_key)
+
+    def row(self, i: int) -> OSData | None:
+        """Rebuild row i as an OSData (None for a failed record)."""
+        precision = self._enums["precision"][i]
+        if precision == NULL:
+            return None
+        kwargs: dict[str, Any] = {"precision": _ENUMS["precision"][precision], "confidence": self._confidence[i]}
+        family = self._enums["family"][i]
+        if family != NULL:
+            kwargs["family"] = _ENUMS["family"][family]
+        for name, col in self._ints.items():
+            if col[i] != NULL:
+                kwargs[name] = col[i]
+        for name, col in self._codes.items():
+            if col[i] != NULL:
+                kwargs[name] = self._dicts[name][col[i]]
+        return OSData(**kwargs)
+
+    def column(self, name: str) -> list[Any]:
+        """Return a column decoded to Python values (None for NULL)."""
+        if name == "confidence":
+            return self._confidence.tolist()
+        if name == "version_key":
+            return self._version_keys.tolist()
+        if name in self._ints:
+            return [None if v == NULL else v for v in self._ints[name]]
+        if name in self._enums:
+            members = _ENUMS[name]
+            return [None if v == NULL else members[v] for v in self._enums[name]]
+        values = self._dicts[_string_column(name)]
+        return [None if v == NULL else values[v] for v in self._codes[name]]
+
+    def dictionary(self, name: str) -> list[str]:
+        """Return the code -> string table of a dictionary-encoded column."""
+        return self._dicts[_string_column(name)]
+
+    def buffers(self) -> dict[str, memoryview]:
+        """Return zero-copy views of every column's backing array.
+
+        Each view can be wrapped without copying, e.g. numpy.frombuffer(view,
+        dtype=view.format) or pyarrow.py_buffer(view). String columns hold codes;
+        decode them with dictionary(name). Views pin the arrays, so release them
+        before appending to the frame.
+        """
+        out = {name: memoryview(col) for name, col in self._enums.items()}
+        out.update((name, memoryview(col)) for name, col in self._ints.items())
+        out.update((name, memoryview(col)) for name, col in self._codes.items())
+        out["confidence"] = memoryview(self._confidence)
+        out["version_key"] = memoryview(self._version_keys)
+        return out
+
+    # ------------------------------------------------------------
+    # Relational operations
+    # ------------------------------------------------------------
+
+    def take(self, indices: Iterable[int]) -> OSDataFrame:
+        """Return a new frame holding the given rows, in the given order."""
+        idx = list(indices)
+        out = self._derive()
+        for name, col in self._enums.items():
+            out._enums[name] = array(col.typecode, [col[i] for i in idx])
+        for name, col in self._ints.items():
+            out._ints[name] = array(col.typecode, [col[i] for i in idx])
+        for name, col in self._codes.items():
+            out._codes[name] = array(col.typecode, [col[i] for i in idx])
+        out._confidence = array("d", [self._confidence[i] for i in idx])
+        out._version_keys = array("Q", [self._version_keys[i] for i in idx])
+        return out
+
+    def filter(self, **conditions: Any) -> OSDataFrame:
+        """Return rows whose columns equal the given values.
+
+        A condition value may be a single value or a set/list/tuple of accepted
+        values; None matches NULL. Matching is done on the stored codes, e.g.
+        frame.filter(family="linux", version_major={20, 22}).
+        """
+        tests: list[tuple[Any, frozenset[Any]]] = []
+        for name, wanted in conditions.items():
+            values = wanted if isinstance(wanted, (set, frozenset, list, tuple)) else (wanted,)
+            col, codes = self._stored(name), frozenset(self._code_of(name, v) for v in values)
+            tests.append((col, codes))
+        idx = [i for i in range(len(self)) if all(col[i] in codes for col, codes in tests)]
+        return self.take(idx)
+
+    def between(self, name: str, low: Any = None, high: Any = None) -> OSDataFrame:
+        """Return rows with low <= value <= high (either bound optional; NULLs never match).
+
+        Works on the integer columns, confidence and version_key; pass
+        OSData.version_key() values as bounds for version ranges.
+        """
+        if name in self._codes or name in self._enums:
+            raise KeyError(f"Range filters need a numeric column, not {name!r}")
+        col, ok = self._stored(name), self._enums["precision"]
+        # Smallest stored value that is not NULL (version_key 0 means "no version")
+        floor = {"version_key": 1, "confidence": float("-inf")}.get(name, NULL + 1)
+        lo = floor if low is None else max(floor, low)
+        idx = [i for i, v in enumerate(col) if v >= lo and (high is None or v <= high) and ok[i] != NULL]
+        return self.take(idx)
+
+    def group_count(self, *names: str) -> dict[Any, int]:
+        """Count rows per distinct value (or tuple of values for several columns).
+
+        Keys are decoded Python values, ordered by descending count.
+        """
+        if not names:
+            raise ValueError("group_count() needs at least one column")
+        cols = [self._stored(name) for name in names]
+        counts = Counter(zip(*cols, strict=True)) if len(cols) > 1 else Counter(cols[0])
+        out: dict[Any, int] = {}
+        for key, n in counts.most_common():
+            if len(cols) > 1:
+                out[tuple(self._decode(name, c) for name, c in zip(names, key, strict=True))] = n
+            else:
+                out[self._decode(names[0], key)] = n
+        return out
+
+    def sort(self, *names: str, reverse: bool = False) -> OSDataFrame:
+        """Return a new frame sorted by the given columns (NULL sorts first).
+
+        String columns sort by their decoded text and enum columns by declaration
+        order; only codes are compared while sorting.
+        """
+        keys = [self._sort_keys(name) for name in names]
+        idx = sorted(range(len(self)), key=lambda i: tuple(k[i] for k in keys), reverse=reverse)
+        return self.take(idx)
+
+    # ------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------
+
+    def _derive(self) -> OSDataFrame:
+        out = OSDataFrame()
+        out._dicts = self._dicts
+        out._index = self._index
+        return out
+
+    def _encode(self, name: str, value: str | None) -> int:
+        if value is None:
+            return NULL
+        index = self._index[name]
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(self._dicts[name])
+            self._dicts[name].append(value)
+        return code
+
+    def _stored(self, name: str) -> array:
+        if name == "confidence":
+            return self._confidence
+        if name == "version_key":
+            return self._version_keys
+        for group in (self._enums, self._ints, self._codes):
+            if name in group:
+                return group[name]
+        raise KeyError(f"Unknown column: {name!r}")
+
+    def _code_of(self, name: str, value: Any) -> Any:
+        """Translate a Python value to its stored code (None for an unseen string)."""
+        if value is None:
+            return NULL
+        if name in self._enums:
+            return _ENUM_CODES[name][_ENUM_TYPES[name](value)]
+        if name in self._codes:
+            return self._index[name].get(value)
+        return value
+
+    def _decode(self, name: str, code: Any) -> Any:
+        if name in ("confidence", "version_key"):
+            return code
+        if code == NULL:
+            return None
+        if name in self._enums:
+            return _ENUMS[name][code]
+        if name in self._codes:
+            return self._dicts[name][code]
+        return code
+
+    def _sort_keys(self, name: str) -> Any:
+        col = self._stored(name)
+        if name not in self._codes:
+            return col
+        # Rank dictionary entries by text once, then sort on ranks
+        values = self._dicts[name]
+        rank = [0] * len(values)
+        for r, code in enumerate(sorted(range(len(values)), key=values.__getitem__)):
+            rank[code] = r
+        return [NULL if c == NULL else rank[c] for c in col]
+
+
+def _enum_code(name: str, value: Any) -> int:
+    return NULL if value is None else _ENUM_CODES[name][_ENUM_TYPES[name](value)]
+
+
+def _int_value(value: int | None) -> int:
+    return NULL if value is None else min(value, INT_MAX)
+
+
+def _string_column(name: str) -> str:
+    if name not in STRING_COLUMNS:
+        raise KeyError(f"Not a dictionary-encoded column: {name!r}")
+    return name
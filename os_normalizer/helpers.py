@@ -1,10 +1,12 @@
 """Utility functions shared across the OS fingerprinting package."""
 
+import copy
 import re
+from dataclasses import replace
 from typing import Any
 
 from .constants import ARCH_SYNONYMS, ARCHITECTURE_TOKENS, PrecisionLevel
-from .models import OSData
+from .models import LazyKey, OSData, SpanEvidence, raw_container, raw_os_key
 
 
 def norm_arch(s: str | None) -> str | None:
@@ -60,11 +62,61 @@ def canonical_key(p: OSData) -> str:
     return f"{vendor}:{product}:{version}:{edition}:{codename}"
 
 
+def freeze_data(obj: Any) -> Any:
+    """Return a hashable, order-independent form of a supplemental data value.
+
+    Dicts become sorted tuples of (key, value) pairs, lists/tuples become tuples and
+    sets become frozensets; nested containers are frozen recursively. Keys keep
+    their type ({1: x} and {"1": x} differ); mixed-type keys are ordered by type
+    name and repr. Raises TypeError when a leaf value is not hashable.
+    """
+    if isinstance(obj, dict):
+        items = [(k, freeze_data(v)) for k, v in obj.items()]
+        try:
+            items.sort(key=_first)
+        except TypeError:
+            items.sort(key=_typed_key)
+        return tuple(items)
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze_data(v) for v in obj)
+    if isinstance(obj, (set, frozenset)):
+        return frozenset(freeze_data(v) for v in obj)
+    hash(obj)
+    return obj
+
+
+def _first(kv: tuple[Any, Any]) -> Any:
+    return kv[0]
+
+
+def _typed_key(kv: tuple[Any, Any]) -> tuple[str, str]:
+    return type(kv[0]).__name__, repr(kv[0])
+
+
+def input_key(text: str, data: dict | None) -> tuple[str, Any]:
+    """Build the deduplication key for a (text, data) input pair."""
+    return (text, freeze_data(data or {}))
+
+
+def copy_osdata(p: OSData) -> OSData:
+    """Return a copy of an OSData instance that shares no mutable containers."""
+    # Empty containers stay unallocated on the copy (OSData creates them lazily)
+    ev, like, key = raw_container(p, "evidence"), raw_container(p, "like_distros"), raw_os_key(p)
+    if type(key) is LazyKey:
+        key = key.copy()
+    if ev:
+        # Nested values (evidence["truncated"], merge conflicts) are copied too; strings are shared
+        ev = {k: copy.deepcopy(v) if isinstance(v, (list, dict)) else v for k, v in ev.items()}
+    return replace(p, evidence=ev or None, like_distros=list(like) if like else None, os_key=key)
+
+
 # Regex for extracting an architecture token from free-form text
 _ARCH_PATTERN = "|".join(
     sorted((re.escape(token) for token in ARCHITECTURE_TOKENS), key=len, reverse=True)
 )
-ARCH_TEXT_RE = re.compile(rf"\b({_ARCH_PATTERN})\b", re.IGNORECASE)
+# The lookahead on possible first letters lets the scan skip most positions without trying every token
+_ARCH_FIRST = "".join(sorted({re.escape(token[0].lower()) for token in ARCHITECTURE_TOKENS}))
+ARCH_TEXT_RE = re.compile(rf"\b(?=[{_ARCH_FIRST}])({_ARCH_PATTERN})\b", re.IGNORECASE)
 
 
 def extract_arch_from_text(text: str) -> str | None:
@@ -95,6 +147,19 @@ def parse_os_release(blob_text: str) -> dict[str, Any]:
     return out
 
 
+def record_match(p: OSData, key: str, m: re.Match[str], group: int = 1) -> None:
+    """Record a regex group as evidence.
+
+    With span evidence enabled (and m run over the same input string) only the
+    group's offsets are stored; otherwise the matched substring is.
+    """
+    ev = p.evidence
+    if type(ev) is SpanEvidence and m.string is ev.source:
+        ev.set_span(key, *m.span(group))
+    else:
+        ev[key] = m.group(group)
+
+
 def update_confidence(p: OSData, precision: PrecisionLevel | str) -> None:
     """Boost confidence based on the determined precision level.
 
@@ -0,0 +1,66 @@
+"""Hash-consing of parse results into shared immutable instances."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from dataclasses import fields, replace
+
+from os_normalizer.models import FrozenOSData, OSData
+from os_normalizer.os_normalizer import normalize_os
+
+# String fields worth interning (repeated across most records)
+_STRING_FIELDS = tuple(f.name for f in fields(FrozenOSData) if f.type == "str | None")
+
+
+class ResultInterner:
+    """Return one shared FrozenOSData per structurally identical result.
+
+    Millions of records that parse to, say, "Ubuntu 22.04 x86_64" end up pointing
+    at a single immutable instance instead of each holding its own OSData,
+    evidence dict and like_distros list. With intern_strings=True the string
+    fields of each canonical instance are also passed through sys.intern.
+
+    The table grows with the number of distinct results; call clear() to drop it.
+    """
+
+    def __init__(self, intern_strings: bool = True) -> None:
+        self.intern_strings = intern_strings
+        self._table: dict[FrozenOSData, FrozenOSData] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __call__(self, p: OSData | FrozenOSData) -> FrozenOSData:
+        return self.intern(p)
+
+    def intern(self, p: OSData | FrozenOSData) -> FrozenOSData:
+        """Return the shared instance equal to p (registering p if new)."""
+        frozen = p if isinstance(p, FrozenOSData) else p.freeze()
+        with self._lock:
+            shared = self._table.get(frozen)
+            if shared is not None and shared.os_key == frozen.os_key:
+                return shared
+            if self.intern_strings:
+                frozen = _intern_strings(frozen)
+            self._table[frozen] = frozen
+            return frozen
+
+    def normalize(self, text: str, data: dict | None = None) -> FrozenOSData:
+        """Normalize an input and return the shared instance for its result."""
+        return self.intern(normalize_os(text, data))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._table.clear()
+
+
+def _intern_strings(p: FrozenOSData) -> FrozenOSData:
+    changes: dict[str, object] = {}
+    for name in _STRING_FIELDS:
+        value = getattr(p, name)
+        if type(value) is str:
+            changes[name] = sys.intern(value)
+    changes["like_distros"] = tuple(sys.intern(v) if type(v) is str else v for v in p.like_distros)
+    return replace(p, **changes)
@@ -2,17 +2,36 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from dataclasses import dataclass, field
 from dataclasses import fields as dataclass_fields
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 from .constants import OSFamily, PrecisionLevel
 
+# Fields left out of fingerprint() by default: scoring metadata and the derived os_key
+FINGERPRINT_EXCLUDE = frozenset({"confidence", "evidence", "os_key"})
 
-@dataclass
+# Version tag leading every to_tuple()/to_bytes() encoding; bump when the layout changes
+SCHEMA_VERSION = 1
+
+_FAMILIES = tuple(OSFamily)
+_PRECISIONS = tuple(PrecisionLevel)
+_FAMILY_ORDINALS = {m: i for i, m in enumerate(_FAMILIES)}
+_PRECISION_ORDINALS = {m: i for i, m in enumerate(_PRECISIONS)}
+
+
+@dataclass(slots=True)
 class OSData:
-    """Structured representation of a parsed operating system."""
+    """Structured representation of a parsed operating system.
+
+    Instances are slotted (no per-instance __dict__), and the evidence and
+    like_distros containers are only allocated the first time they are touched.
+    """
 
     # Core identity
     family: OSFamily | None = None  # windows, linux, macos, ios, android, bsd, solaris, esxi, network-os
@@ -33,7 +52,7 @@ class OSData:
     kernel_version: str | None = None
     arch: str | None = None
     distro: str | None = None
-    like_distros: list[str] = field(default_factory=list)
+    like_distros: list[str] = None  # type: ignore[assignment]  # allocated lazily, see _lazy_container
     pretty_name: str | None = None
 
     # Network device extras
@@ -43,7 +62,7 @@ class OSData:
     # Meta information
     precision: PrecisionLevel = PrecisionLevel.UNKNOWN  # family|product|major|minor|patch|build
     confidence: float = 0.0
-    evidence: dict[str, Any] = field(default_factory=dict)
+    evidence: dict[str, Any] = None  # type: ignore[assignment]  # allocated lazily, see _lazy_container
 
     # Canonical key for deduplication / indexing
     os_key: str | None = field(default=None, compare=False)
@@ -132,7 +151,7 @@ class OSData:
         rows: list[tuple[str, str]] = []
         for f in dataclass_fields(self):
             name = f.name
-            val = getattr(self, name)
+            val = _field_value(self, name)
             if val is None:
                 sval = none_str
             elif name == "confidence" and isinstance(val, (int, float)):
@@ -153,6 +172,391 @@ class OSData:
         lines = [f"{name:<{width}} : {sval}" for name, sval in rows]
         return "\n".join(lines)
 
+    def to_dict(self, omit_none: bool = True) -> dict[str, Any]:
+        """Return a JSON-ready dict (enums as their string values).
+
+        Unlike dataclasses.asdict this does not recurse or deep-copy: evidence and
+        like_distros are shallow copies. With omit_none=True, None-valued fields
+        and empty containers are left out.
+        """
+        out: dict[str, Any] = {}
+        for name in _FIELD_NAMES:
+            if name in _RAW_SLOTS:
+                value = raw_container(self, name)
+                if not value:
+                    if omit_none:
+                        continue
+                    value = {} if name == "evidence" else []
+                else:
+                    value = dict(value) if name == "evidence" else list(value)
+                out[name] = value
+                continue
+            value = getattr(self, name)
+            if value is None:
+                if omit_none:
+                    continue
+            elif isinstance(value, Enum):
+                value = value.value
+            out[name] = value
+        return out
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> OSData:
+        """Build an OSData from to_dict() output; unknown keys are ignored."""
+        kwargs = {k: v for k, v in d.items() if k in _FIELD_SET}
+        return _coerce_enums(cls(**kwargs))
+
+    def to_tuple(self) -> tuple:
+        """Return a compact positional encoding: (SCHEMA_VERSION, *fields).
+
+        family and precision are stored by enum ordinal and empty containers as
+        None. Decode with OSData.from_tuple().
+        """
+        values: list[Any] = [SCHEMA_VERSION]
+        for name in _FIELD_NAMES:
+            if name in ("evidence", "like_distros"):
+                value = raw_container(self, name) or None
+                values.append(dict(value) if type(value) is SpanEvidence else value)
+                continue
+            value = getattr(self, name)
+            if name == "family" and isinstance(value, OSFamily):
+                value = _FAMILY_ORDINALS[value]
+            elif name == "precision" and isinstance(value, PrecisionLevel):
+                value = _PRECISION_ORDINALS[value]
+            values.append(value)
+        return tuple(values)
+
+    @classmethod
+    def from_tuple(cls, t: tuple | list) -> OSData:
+        """Inverse of to_tuple(); raises ValueError on a schema mismatch."""
+        if not t or t[0] != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported OSData schema version: {t[0] if t else None!r}")
+        p = cls(*t[1:])
+        if type(p.family) is int:
+            p.family = _FAMILIES[p.family]
+        if type(p.precision) is int:
+            p.precision = _PRECISIONS[p.precision]
+        return p
+
+    def to_bytes(self) -> bytes:
+        """Return to_tuple() as compact UTF-8 JSON."""
+        return json.dumps(self.to_tuple(), separators=(",", ":"), default=str).encode()
+
+    @classmethod
+    def from_bytes(cls, b: bytes | str) -> OSData:
+        """Inverse of to_bytes()."""
+        return cls.from_tuple(json.loads(b))
+
+    def __reduce__(self) -> tuple:
+        # Compact pickle: a bitmask of non-default fields plus their values, enums by ordinal
+        mask = 0
+        values: list[Any] = []
+        for bit, name in enumerate(_FIELD_NAMES):
+            value = raw_container(self, name) if name in _RAW_SLOTS else getattr(self, name)
+            if value is None or (not value and name in _EMPTY_DEFAULTS):
+                continue
+            if name == "family" and isinstance(value, OSFamily):
+                value = _FAMILY_ORDINALS[value]
+            elif name == "precision" and isinstance(value, PrecisionLevel):
+                if value is PrecisionLevel.UNKNOWN:
+                    continue
+                value = _PRECISION_ORDINALS[value]
+            mask |= 1 << bit
+            values.append(value)
+        return (_unpickle_osdata, (mask, *values))
+
+    def freeze(self) -> FrozenOSData:
+        """Return an immutable snapshot of this result."""
+        return FrozenOSData(**{name: _freeze_value(_field_value(self, name)) for name in _FIELD_NAMES})
+
+    def version_key(self) -> int:
+        """Return a packed 64-bit key ordering versions of one product by vendor semantics.
+
+        See os_normalizer.versions for the layout.
+        """
+        from .versions import version_key
+
+        return version_key(self)
+
+    def fingerprint(self, bits: int = 64, exclude: Iterable[str] = FINGERPRINT_EXCLUDE) -> int:
+        """Return a stable content hash over the identity and version fields.
+
+        The value is identical across processes and runs for equal content, so it
+        can be stored and joined on. bits may be 64 or 128; fields named in
+        exclude (confidence, evidence and os_key by default) are ignored.
+        """
+        return _fingerprint(self, bits, exclude)
+
+
+def _lazy_container(name: str, factory: type) -> property:
+    """Wrap a slot so an empty container is only created when first accessed."""
+    slot = OSData.__dict__[name]
+
+    def get(self: OSData) -> Any:
+        value = slot.__get__(self, OSData)
+        if value is None:
+            value = factory()
+            slot.__set__(self, value)
+        return value
+
+    # The slot's own setter: no Python frame on the hot __init__ path
+    return property(get, slot.__set__, doc=f"{name} (allocated on first access)")
+
+
+_RAW_SLOTS = {name: OSData.__dict__[name] for name in ("evidence", "like_distros")}
+OSData.evidence = _lazy_container("evidence", dict)
+OSData.like_distros = _lazy_container("like_distros", list)
+
+
+class SpanEvidence(MutableMapping):
+    """Evidence mapping that keeps matched text as offsets into the input.
+
+    set_span() records (start, end) against a retained reference to the parsed
+    input instead of copying the substring; the substring is only built when
+    the entry is read. Ordinary values can be stored alongside. Copies, pickles
+    and serializers see a plain dict of materialized values.
+    """
+
+    __slots__ = ("source", "_items")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        # Span entries are stored as slice objects over source
+        self._items: dict[str, Any] = {}
+
+    def set_span(self, key: str, start: int, end: int) -> None:
+        self._items[key] = slice(start, end)
+
+    def spans(self) -> dict[str, tuple[int, int]]:
+        """Return the (start, end) offsets of span entries without materializing them."""
+        return {k: (v.start, v.stop) for k, v in self._items.items() if type(v) is slice}
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._items[key]
+        return self.source[value] if type(value) is slice else value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._items[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._items[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def __reduce__(self) -> tuple:
+        return (dict, (dict(self),))
+
+
+# Fields a derived os_key depends on; changing any of them invalidates a cached LazyKey
+KEY_INPUTS = (
+    "family",
+    "vendor",
+    "product",
+    "edition",
+    "codename",
+    "channel",
+    "version_major",
+    "version_minor",
+    "version_patch",
+    "version_build",
+    "kernel_name",
+    "kernel_version",
+    "arch",
+    "distro",
+    "hw_model",
+    "build_id",
+)
+
+
+class LazyKey:
+    """Placeholder stored in os_key that derives the key on first read.
+
+    The computed value is cached together with a snapshot of KEY_INPUTS and
+    recomputed whenever those fields have changed since, so mutating a result
+    (e.g. update_os(inplace=True)) never serves a stale key. builder failures
+    yield None, like the eager path in normalize_os.
+    """
+
+    __slots__ = ("builder", "src", "value")
+
+    def __init__(self, builder: Callable[[OSData], str | None]) -> None:
+        self.builder = builder
+        self.src: tuple | None = None
+        self.value: str | None = None
+
+    def resolve(self, p: OSData) -> str | None:
+        src = tuple([getattr(p, name) for name in KEY_INPUTS])
+        if src != self.src:
+            try:
+                self.value = self.builder(p)
+            except Exception:
+                self.value = None
+            self.src = src
+        return self.value
+
+    def __copy__(self) -> LazyKey:
+        other = LazyKey(self.builder)
+        other.src, other.value = self.src, self.value
+        return other
+
+    copy = __copy__
+
+
+def _lazy_key() -> property:
+    slot = OSData.__dict__["os_key"]
+
+    def get(self: OSData) -> str | None:
+        value = slot.__get__(self, OSData)
+        if type(value) is LazyKey:
+            return value.resolve(self)
+        return value
+
+    return property(get, slot.__set__, doc="os_key (derived on first read when set to a LazyKey)")
+
+
+_OS_KEY_SLOT = OSData.__dict__["os_key"]
+OSData.os_key = _lazy_key()
+
+
+def raw_os_key(p: OSData) -> str | LazyKey | None:
+    """Read os_key without resolving a pending LazyKey."""
+    return _OS_KEY_SLOT.__get__(p, OSData)
+
+
+_FIELD_NAMES = tuple(f.name for f in dataclass_fields(OSData))
+_FIELD_SET = frozenset(_FIELD_NAMES)
+_DEFAULT_ROW = tuple(f.default for f in dataclass_fields(OSData))
+_FAMILY_POS = _FIELD_NAMES.index("family")
+_PRECISION_POS = _FIELD_NAMES.index("precision")
+
+
+# Fields whose falsy value is the default and can be omitted from pickles
+_EMPTY_DEFAULTS = frozenset({"confidence", "evidence", "like_distros"})
+
+
+def _unpickle_osdata(mask: int, *values: Any) -> OSData:
+    """Rebuild an OSData from OSData.__reduce__ output."""
+    row = list(_DEFAULT_ROW)
+    for value in values:
+        low = mask & -mask
+        row[low.bit_length() - 1] = value
+        mask ^= low
+    if type(row[_FAMILY_POS]) is int:
+        row[_FAMILY_POS] = _FAMILIES[row[_FAMILY_POS]]
+    if type(row[_PRECISION_POS]) is int:
+        row[_PRECISION_POS] = _PRECISIONS[row[_PRECISION_POS]]
+    return OSData(*row)
+
+
+def raw_container(p: OSData, name: str) -> Any:
+    """Read evidence or like_distros without allocating it (None when untouched)."""
+    return _RAW_SLOTS[name].__get__(p, OSData)
+
+
+def _field_value(p: OSData | FrozenOSData, name: str) -> Any:
+    """getattr() that reads an untouched lazy container as a temporary empty one."""
+    if name in _RAW_SLOTS and isinstance(p, OSData):
+        value = raw_container(p, name)
+        if value is None:
+            return {} if name == "evidence" else []
+        return value
+    return getattr(p, name)
+
+
+def _coerce_enums(p: OSData) -> OSData:
+    if p.family is not None and not isinstance(p.family, OSFamily):
+        p.family = OSFamily(p.family)
+    if not isinstance(p.precision, PrecisionLevel):
+        p.precision = PrecisionLevel(p.precision)
+    return p
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenOSData:
+    """Immutable, hashable counterpart of OSData, safe to share between many holders.
+
+    Containers are frozen too: like_distros is a tuple and evidence a read-only
+    mapping (nested dicts/lists included). Use OSData.freeze() to build one and
+    thaw() to get a mutable copy back. Instances can be used in sets and as dict
+    keys; equality matches OSData (os_key ignored) and evidence is left out of
+    the hash. For persistent keys use fingerprint().
+    """
+
+    family: OSFamily | None = None
+    vendor: str | None = None
+    product: str | None = None
+    edition: str | None = None
+    codename: str | None = None
+    channel: str | None = None
+    version_major: int | None = None
+    version_minor: int | None = None
+    version_patch: int | None = None
+    version_build: str | None = None
+    kernel_name: str | None = None
+    kernel_version: str | None = None
+    arch: str | None = None
+    distro: str | None = None
+    like_distros: tuple[str, ...] = ()
+    pretty_name: str | None = None
+    hw_model: str | None = None
+    build_id: str | None = None
+    precision: PrecisionLevel = PrecisionLevel.UNKNOWN
+    confidence: float = 0.0
+    evidence: MappingProxyType = field(default_factory=lambda: MappingProxyType({}), hash=False)
+    os_key: str | None = field(default=None, compare=False)
+
+    __str__ = OSData.__str__
+    full = OSData.full
+    version_key = OSData.version_key
+
+    def __repr__(self) -> str:  # pragma: no cover - formatting helper
+        return f"FrozenOSData({str(self)})"
+
+    def thaw(self) -> OSData:
+        """Return a mutable OSData copy."""
+        return OSData(**{f.name: _thaw_value(getattr(self, f.name)) for f in dataclass_fields(self)})
+
+    def __reduce__(self) -> tuple:
+        # mappingproxy is not picklable; ship the thawed form and refreeze
+        return (OSData.freeze, (self.thaw(),))
+
+    def fingerprint(self, bits: int = 64, exclude: Iterable[str] = FINGERPRINT_EXCLUDE) -> int:
+        """Return the same stable content hash as OSData.fingerprint()."""
+        return _fingerprint(self, bits, exclude)
+
+
+def _fingerprint(p: OSData | FrozenOSData, bits: int, exclude: Iterable[str]) -> int:
+    if bits not in (64, 128):
+        raise ValueError("bits must be 64 or 128")
+    skip = frozenset(exclude)
+    # Canonical JSON: enums by value, containers as lists/sorted dicts
+    payload = [(name, _thaw_value(_field_value(p, name))) for name in _FIELD_NAMES if name not in skip]
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return int.from_bytes(hashlib.blake2b(blob, digest_size=bits // 8).digest(), "big")
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, (dict, SpanEvidence)):
+        return MappingProxyType({k: _freeze_value(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_value(v) for v in value)
+    return value
+
+
+def _thaw_value(value: Any) -> Any:
+    if isinstance(value, (MappingProxyType, SpanEvidence)):
+        return {k: _thaw_value(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw_value(v) for v in value]
+    return value
+
 
 def _format_windows(p: OSData) -> str:
     parts = [
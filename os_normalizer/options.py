@@ -0,0 +1,140 @@
+"""Per-call options controlling how much work normalize_os does."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from dataclasses import fields as dataclass_fields
+from time import perf_counter
+
+from os_normalizer.models import OSData
+
+# Default NormalizeOptions.max_scan, in characters
+DEFAULT_MAX_SCAN = 65536
+
+FIELD_NAMES = frozenset(f.name for f in dataclass_fields(OSData))
+
+# Fields a projection implicitly needs to compute the requested ones
+_FIELD_DEPENDENCIES: dict[str, frozenset[str]] = {
+    "confidence": frozenset({"precision"}),
+    # The CPE key is built from nearly every other field
+    "os_key": FIELD_NAMES,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizeOptions:
+    """Switches for optional output of normalize_os.
+
+    evidence: keep the evidence dict (family hit, raw version strings, ...).
+    cpe: build the CPE 2.3 os_key.
+    display: keep display-only fields (pretty_name).
+    spans: record matched evidence as offsets into the input (SpanEvidence)
+        rather than copied substrings.
+    lazy: defer the os_key until it is first read (see models.LazyKey).
+    fields: project the result onto these OSData fields (None = all). Parser
+        passes whose outputs are not needed are skipped and every other field
+        is left at its default; {"family"} or {"family", "arch"} skip the
+        family parsers entirely.
+    budget_ms: per-call time budget. Once it is spent, optional stages (model,
+        edition and image extraction, the macOS codename fallback, the arch
+        fallback and CPE generation) are skipped, the result so far is returned
+        and the skipped stages are listed in evidence["truncated"]. The budget
+        is checked between stages (a running stage is never interrupted) and
+        applies to each record of a batch separately.
+    max_scan: inputs longer than this many characters are cut down to the
+        relevant region for the detected family (anchor lines topped up with
+        head text) before parsing (see window.relevant_region);
+        evidence["windowed"] is then set to True. None scans the whole
+        input.
+
+    The defaults produce the full result. LEAN turns evidence, cpe and display
+    off for hot ingest paths that only need identity and version fields.
+    """
+
+    evidence: bool = True
+    cpe: bool = True
+    display: bool = True
+    spans: bool = False
+    lazy: bool = False
+    fields: frozenset[str] | None = None
+    budget_ms: float | None = None
+    max_scan: int | None = DEFAULT_MAX_SCAN
+    # fields plus their dependencies; what parsers consult via wants()
+    needs: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+    # perf_counter() deadline of the call in progress; set by start_budget()
+    deadline: float | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.budget_ms is not None and self.budget_ms < 0:
+            raise ValueError("budget_ms must be >= 0")
+        if self.max_scan is not None and self.max_scan < 1:
+            raise ValueError("max_scan must be >= 1")
+        if self.fields is None:
+            return
+        requested = frozenset(self.fields)
+        unknown = requested - FIELD_NAMES
+        if unknown:
+            raise ValueError(f"Unknown OSData fields: {', '.join(sorted(unknown))}")
+        needs = set(requested)
+        for name in requested:
+            needs |= _FIELD_DEPENDENCIES.get(name, frozenset())
+        object.__setattr__(self, "fields", requested)
+        object.__setattr__(self, "needs", frozenset(needs))
+
+    @classmethod
+    def resolve(cls, options: NormalizeOptions | str | None) -> NormalizeOptions:
+        """Accept an options object, a mode name ("full"/"lean"/"lazy") or None (full)."""
+        if options is None:
+            return FULL
+        if isinstance(options, NormalizeOptions):
+            return options
+        try:
+            return MODES[options]
+        except (KeyError, TypeError):
+            raise ValueError(f"Unknown normalize mode: {options!r}") from None
+
+    def project(self, fields: Iterable[str]) -> NormalizeOptions:
+        """Return a copy restricted to the given fields (memoized per distinct projection)."""
+        key = (self, frozenset(fields))
+        projected = _PROJECTIONS.get(key)
+        if projected is None:
+            projected = replace(self, fields=key[1])
+            if len(_PROJECTIONS) < _MAX_PROJECTIONS:
+                _PROJECTIONS[key] = projected
+        return projected
+
+    def wants(self, *names: str) -> bool:
+        """True if any of the named fields is needed for the result."""
+        return self.needs is None or not self.needs.isdisjoint(names)
+
+    def start_budget(self) -> NormalizeOptions:
+        """Return a per-call copy whose deadline is budget_ms from now (self if there is no budget)."""
+        if self.budget_ms is None:
+            return self
+        # Slot-by-slot copy: replace() would re-run __post_init__ on every call
+        timed = object.__new__(NormalizeOptions)
+        for get, put in _SLOT_ACCESSORS:
+            put(timed, get(self))
+        _DEADLINE_SLOT.__set__(timed, perf_counter() + self.budget_ms / 1000)
+        return timed
+
+    def in_budget(self, p: OSData, stage: str) -> bool:
+        """True if there is time left for an optional stage; otherwise record it as truncated on p."""
+        if self.deadline is None or perf_counter() < self.deadline:
+            return True
+        p.evidence.setdefault("truncated", []).append(stage)
+        return False
+
+
+_SLOTS = [NormalizeOptions.__dict__[name] for name in NormalizeOptions.__slots__]
+_SLOT_ACCESSORS = [(slot.__get__, slot.__set__) for slot in _SLOTS]
+_DEADLINE_SLOT = NormalizeOptions.__dict__["deadline"]
+
+_MAX_PROJECTIONS = 256
+_PROJECTIONS: dict[tuple[NormalizeOptions, frozenset[str]], NormalizeOptions] = {}
+
+FULL = NormalizeOptions()
+LEAN = NormalizeOptions(evidence=False, cpe=False, display=False)
+LAZY = NormalizeOptions(lazy=True)
+MODES = {"full": FULL, "lean": LEAN, "lazy": LAZY}
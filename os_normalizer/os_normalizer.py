@@ -1,13 +1,17 @@
 import copy
+import re
 from collections.abc import Iterable
-from dataclasses import fields, replace
+from dataclasses import fields as dataclass_fields
+from dataclasses import replace
 from datetime import UTC, datetime
 from typing import Any
 
+from os_normalizer import profiling
 from os_normalizer.constants import PRECISION_ORDER, OSFamily, PrecisionLevel
 from os_normalizer.cpe import build_cpe23
 from os_normalizer.helpers import extract_arch_from_text, precision_from_parts, update_confidence
-from os_normalizer.models import OSData
+from os_normalizer.models import LazyKey, OSData, SpanEvidence, raw_os_key
+from os_normalizer.options import NormalizeOptions
 from os_normalizer.parsers.bsd import parse_bsd
 from os_normalizer.parsers.esxi import parse_esxi
 from os_normalizer.parsers.linux import parse_linux
@@ -16,21 +20,17 @@ from os_normalizer.parsers.mobile import parse_mobile
 from os_normalizer.parsers.network import parse_network
 from os_normalizer.parsers.solaris import parse_solaris
 from os_normalizer.parsers.windows import parse_windows
+from os_normalizer.window import relevant_region
 
 
 # ============================================================
 # Family detection (orchestrator logic)
 # ============================================================
-def detect_family(text: str, data: dict[str, Any]) -> tuple[OSFamily | None, float, dict[str, Any]]:
-    t = text.lower()
-    ev = {}
-    if OSFamily.HARMONYOS.value in t:
-        ev["hit"] = OSFamily.HARMONYOS
-        return OSFamily.HARMONYOS, 0.6, ev
-    # Obvious network signals first
-    if any(
-        x in t
-        for x in [
+# Substrings that mark a network OS banner, matched in one regex pass
+_NETWORK_HINTS_RE = re.compile(
+    "|".join(
+        re.escape(x)
+        for x in (
             "cisco",
             "nx-os",
             "ios xe",
@@ -42,10 +42,27 @@ def detect_family(text: str, data: dict[str, Any]) -> tuple[OSFamily | None, flo
             "vrp",
             "netgear",
             "firmware v",
-        ]
-    ):
+        )
+    )
+)
+
+# Top-level os-release keys that identify Linux supplemental data
+_OS_RELEASE_KEYS = frozenset({"ID", "ID_LIKE", "PRETTY_NAME", "VERSION_ID", "VERSION_CODENAME"})
+
+
+def detect_family(text: str, data: dict[str, Any]) -> tuple[OSFamily | None, float, dict[str, Any]]:
+    return _detect_family_lowered(text.lower(), data)
+
+
+def _detect_family_lowered(t: str, data: dict[str, Any]) -> tuple[OSFamily | None, float, dict[str, Any]]:
+    ev = {}
+    if OSFamily.HARMONYOS in t:
+        ev["hit"] = OSFamily.HARMONYOS
+        return OSFamily.HARMONYOS, 0.6, ev
+    # Obvious network signals first
+    if _NETWORK_HINTS_RE.search(t):
         # Special handling for 'ios' - if it's just 'ios' without 'cisco', treat as mobile, not network
-        if f"{OSFamily.IOS.value} " in t and "cisco" not in t:
+        if f"{OSFamily.IOS} " in t and "cisco" not in t:
             ev["hit"] = OSFamily.IOS
             return OSFamily.IOS, 0.6, ev
 
@@ -60,29 +77,22 @@ def detect_family(text: str, data: dict[str, Any]) -> tuple[OSFamily | None, flo
         ev["hit"] = OSFamily.SOLARIS
         return OSFamily.SOLARIS, 0.65, ev
     # Linux
-    if OSFamily.LINUX.value in t or any(
-        k in data for k in ("ID", "ID_LIKE", "PRETTY_NAME", "VERSION_ID", "VERSION_CODENAME")
-    ):
+    if OSFamily.LINUX in t or (data and not _OS_RELEASE_KEYS.isdisjoint(data)):
         ev["hit"] = OSFamily.LINUX
         return OSFamily.LINUX, 0.6, ev
     # Windows
-    if (
-        OSFamily.WINDOWS.value in t
-        or "nt " in t
-        or t.startswith("win")
-        or data.get("os", "").lower() == OSFamily.WINDOWS.value
-    ):
+    if OSFamily.WINDOWS in t or "nt " in t or t.startswith("win") or data.get("os", "").lower() == OSFamily.WINDOWS:
         ev["hit"] = OSFamily.WINDOWS
         return OSFamily.WINDOWS, 0.6, ev
     # Apple
-    if OSFamily.MACOS.value in t or "os x" in t or "darwin" in t:
+    if OSFamily.MACOS in t or "os x" in t or "darwin" in t:
         ev["hit"] = OSFamily.MACOS
         return OSFamily.MACOS, 0.6, ev
-    if OSFamily.IOS.value in t or "ipados" in t:
+    if OSFamily.IOS in t or "ipados" in t:
         ev["hit"] = OSFamily.IOS
         return OSFamily.IOS, 0.6, ev
     # Android
-    if OSFamily.ANDROID.value in t:
+    if OSFamily.ANDROID in t:
         ev["hit"] = OSFamily.ANDROID
         return OSFamily.ANDROID, 0.6, ev
     # BSD
@@ -92,25 +102,66 @@ def detect_family(text: str, data: dict[str, Any]) -> tuple[OSFamily | None, flo
     return None, 0.0, ev
 
 
-def normalize_os(text: str, data: dict | None = None) -> OSData:
-    text = text.strip()
-    data = data or {}
-    t = text.lower()
+def normalize_os(
+    text: str,
+    data: dict | None = None,
+    options: NormalizeOptions | str | None = None,
+    fields: Iterable[str] | None = None,
+    budget_ms: float | None = None,
+) -> OSData:
+    """Parse free text plus optional supplemental data into an OSData.
 
-    p = OSData()
+    options is a NormalizeOptions or a mode name; "lean" skips evidence,
+    display-only fields and CPE generation, "lazy" builds os_key on first read. fields projects the result onto
+    the named OSData fields (see NormalizeOptions.fields). budget_ms bounds the time spent on optional stages
+    (see NormalizeOptions.budget_ms).
+    """
+    rec = profiling.StageRecorder(profiling.OBSERVERS) if profiling.OBSERVERS else None
+    opts = NormalizeOptions.resolve(options)
+    if fields is not None:
+        opts = opts.project(fields)
+    if budget_ms is not None:
+        opts = replace(opts, budget_ms=budget_ms)
+    opts = opts.start_budget()
+    # source is the whole stripped input; text may be narrowed to a window below
+    source = text = text.strip()
+    data = data or {}
 
     # Family detection
-    fam, base_conf, ev = detect_family(t, data)
+    lowered = text.lower()
+    fam, base_conf, ev = _detect_family_lowered(lowered, data)
+    if opts.max_scan is not None and len(source) > opts.max_scan:
+        # Oversized input: parse only the region the family's parser needs
+        text = relevant_region(source, fam, opts.max_scan, lowered)
+    if rec:
+        rec.lap("detect")
+    if opts.needs is not None and opts.needs.isdisjoint(_PARSER_FIELDS):
+        # Routing-only projection: nothing below detect_family is needed
+        p = OSData(family=fam if opts.wants("family") else None)
+        if opts.wants("arch") and opts.in_budget(p, "arch"):
+            p.arch = extract_arch_from_text(text)
+        if rec:
+            rec.lap("arch")
+            rec.finish(source, data)
+        return p
+
+    p = OSData()
     p.family = fam
     p.confidence = max(p.confidence, base_conf)
-    p.evidence.update(ev)
+    if opts.spans and opts.evidence:
+        p.evidence = SpanEvidence(text)
+    if ev and opts.evidence:
+        p.evidence.update(ev)
+    if text is not source and opts.evidence:
+        # A flag, not the length: results are shared between canonically equal inputs
+        p.evidence["windowed"] = True
 
     if fam == OSFamily.NETWORK:
-        p = parse_network(text, data, p)
+        p = parse_network(text, data, p, opts)
     elif fam == OSFamily.WINDOWS:
-        p = parse_windows(text, data, p)
+        p = parse_windows(text, data, p, opts)
     elif fam == OSFamily.MACOS:
-        p = parse_macos(text, data, p)
+        p = parse_macos(text, data, p, opts)
     elif fam == OSFamily.LINUX:
         p = parse_linux(text, data, p)
     elif fam == OSFamily.SOLARIS:
@@ -123,21 +174,76 @@ def normalize_os(text: str, data: dict | None = None) -> OSData:
         p = parse_bsd(text, data, p)
     else:
         p.precision = PrecisionLevel.UNKNOWN
+    if rec and fam is not None:
+        rec.lap(_PARSE_STAGES[fam])
 
     # Fallback arch from text if not already set elsewhere
-    if not p.arch:
+    if not p.arch and opts.wants("arch") and opts.in_budget(p, "arch"):
         p.arch = extract_arch_from_text(text)
+        if rec:
+            rec.lap("arch")
 
-    # Populate canonical os_key as CPE 2.3
-    try:
-        p.os_key = build_cpe23(p)
-    except Exception:
-        # Be resilient: leave unset on any unexpected error
-        p.os_key = None
+    if not opts.evidence:
+        # Parsers record a few raw strings as they go; drop them in one step
+        truncated = _truncated(p, opts)
+        p.evidence = {"truncated": truncated} if truncated else None
+    if not opts.display:
+        p.pretty_name = None
 
+    # Populate canonical os_key as CPE 2.3
+    if opts.cpe and opts.lazy and opts.wants("os_key"):
+        p.os_key = LazyKey(build_cpe23)
+    elif opts.cpe and opts.wants("os_key") and opts.in_budget(p, "cpe"):
+        try:
+            p.os_key = build_cpe23(p)
+        except Exception:
+            # Be resilient: leave unset on any unexpected error
+            p.os_key = None
+        if rec:
+            rec.lap("cpe")
+
+    if opts.fields is not None:
+        truncated = _truncated(p, opts)
+        _apply_projection(p, opts.fields)
+        if truncated:
+            # Keep the budget marker even when evidence is projected away
+            p.evidence["truncated"] = truncated
+    if rec:
+        rec.finish(source, data)
     return p
 
 
+# Timing stage names, one per family parser
+_PARSE_STAGES = {
+    OSFamily.NETWORK: "parse.network",
+    OSFamily.WINDOWS: "parse.windows",
+    OSFamily.MACOS: "parse.macos",
+    OSFamily.LINUX: "parse.linux",
+    OSFamily.SOLARIS: "parse.solaris",
+    OSFamily.ESXI: "parse.esxi",
+    OSFamily.ANDROID: "parse.mobile",
+    OSFamily.IOS: "parse.mobile",
+    OSFamily.HARMONYOS: "parse.mobile",
+    OSFamily.BSD: "parse.bsd",
+}
+
+# Fields only a family parser can fill in (family and arch come from the orchestrator)
+_PARSER_FIELDS = frozenset(f.name for f in dataclass_fields(OSData)) - {"family", "arch"}
+_DEFAULTS = {f.name: f.default for f in dataclass_fields(OSData)}
+
+
+def _truncated(p: OSData, opts: NormalizeOptions) -> list[str] | None:
+    """Stages skipped for lack of budget (evidence is only touched when a budget is set)."""
+    return p.evidence.get("truncated") if opts.deadline is not None else None
+
+
+def _apply_projection(p: OSData, keep: frozenset[str]) -> None:
+    """Reset every field outside the projection to its default."""
+    for name, default in _DEFAULTS.items():
+        if name not in keep:
+            setattr(p, name, default)
+
+
 def choose_best_fact(candidates: list[OSData]) -> OSData:
     if not candidates:
         raise ValueError("No candidates")
@@ -186,7 +292,8 @@ def merge_os(a: OSData, b: OSData, policy: str = "auto") -> OSData:
     evidence['conflicts'] and evidence['alt'].
     """
     base, other = (a, b) if _score(a) >= _score(b) else (b, a)
-    r = replace(base)
+    # os_key is rebuilt below; do not resolve a lazy key just to copy it
+    r = replace(base, os_key=None)
 
     # Ensure evidence containers exist
     r.evidence = dict(r.evidence or {})
@@ -266,7 +373,10 @@ def merge_os(a: OSData, b: OSData, policy: str = "auto") -> OSData:
     if alts:
         r.evidence["alt"] = alts
 
-    # Refresh CPE key
+    # Refresh CPE key (stays deferred if either input was lazy)
+    if type(raw_os_key(a)) is LazyKey or type(raw_os_key(b)) is LazyKey:
+        r.os_key = LazyKey(build_cpe23)
+        return r
     try:
         r.os_key = build_cpe23(r)
     except Exception:
@@ -282,13 +392,15 @@ def update_os(
 
     Set inplace=True to mutate the existing instance.
     """
-    incoming = normalize_os(text or "", data or {}) if (text or data) else OSData()
+    # Keep a lazily keyed result lazy: no need to build the incoming key eagerly
+    mode = "lazy" if type(raw_os_key(existing)) is LazyKey else None
+    incoming = normalize_os(text or "", data or {}, mode) if (text or data) else OSData()
     merged = merge_os(existing, incoming, policy=policy)
     if inplace:
         # Generic copy of dataclass fields with shallow copy for common containers
-        for f in fields(OSData):
-            val = getattr(merged, f.name)
-            if isinstance(val, (dict, list, set)):
+        for f in dataclass_fields(OSData):
+            val = raw_os_key(merged) if f.name == "os_key" else getattr(merged, f.name)
+            if isinstance(val, (dict, list, set, LazyKey)):
                 val = copy.copy(val)
             setattr(existing, f.name, val)
         return existing
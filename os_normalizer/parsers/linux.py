@@ -7,15 +7,13 @@ from os_normalizer.constants import PrecisionLevel
 from os_normalizer.helpers import parse_os_release, update_confidence
 from os_normalizer.models import OSData
 
-# Regex patterns used only by the Linux parser
-KERNEL_RE = re.compile(
-    r"\b(kernel|uname)\b.*?\b(\d+\.\d+(?:\.\d+)?(?:-\S+)?)",
-    re.IGNORECASE,
-)
-LINUX_VER_FALLBACK_RE = re.compile(
-    r"\bLinux\b[^\n]*?\b(\d+\.\d+(?:\.\d+)?(?:-[A-Za-z0-9._-]+)?)\b",
-    re.IGNORECASE,
-)
+# Regex patterns used only by the Linux parser. Each version is taken from the
+# first anchor word ("kernel"/"uname", "Linux") on a line that has one after it;
+# see _version_after().
+KERNEL_RE = re.compile(r"\b(kernel|uname)\b", re.IGNORECASE)
+KERNEL_VER_RE = re.compile(r"\b(\d+\.\d+(?:\.\d+)?(?:-\S+)?)")
+LINUX_RE = re.compile(r"\bLinux\b", re.IGNORECASE)
+LINUX_VER_FALLBACK_RE = re.compile(r"\b(\d+\.\d+(?:\.\d+)?(?:-[A-Za-z0-9._-]+)?)\b")
 
 
 def parse_linux(text: str, data: dict[str, Any], p: OSData) -> OSData:
@@ -47,12 +45,25 @@ def _coerce_os_release(obj: Any) -> dict[str, Any] | None:
 
 
 def _extract_kernel_version(text: str) -> str | None:
-    m = KERNEL_RE.search(text)
-    if m:
-        return m.group(2)
-    m2 = LINUX_VER_FALLBACK_RE.search(text)
-    if m2:
-        return m2.group(1)
+    return _version_after(KERNEL_RE, KERNEL_VER_RE, text) or _version_after(LINUX_RE, LINUX_VER_FALLBACK_RE, text)
+
+
+def _version_after(anchor: re.Pattern, version: re.Pattern, text: str) -> str | None:
+    """First version following an anchor word on the same line.
+
+    Same result as anchor + a lazy [^\\n]*? gap + version in one pattern, but
+    linear: a line whose first anchor has no version after it is skipped
+    whole, since later anchors on that line would only scan a suffix of it.
+    """
+    pos = 0
+    while m := anchor.search(text, pos):
+        eol = text.find("\n", m.end())
+        if eol == -1:
+            eol = len(text)
+        v = version.search(text, m.end(), eol)
+        if v:
+            return v.group(1)
+        pos = eol
     return None
 
 
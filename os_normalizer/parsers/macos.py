@@ -6,15 +6,16 @@ from typing import Any
 from os_normalizer.constants import MACOS_ALIASES, MACOS_DARWIN_MAP, PRECISION_ORDER, PrecisionLevel
 from os_normalizer.helpers import update_confidence
 from os_normalizer.models import OSData
+from os_normalizer.options import FULL, NormalizeOptions
 
-# Regex patterns used only by the macOS parser
-DARWIN_RE = re.compile(
-    r"\bdarwin\b[^\d\n]*?(\d+)(?:\.(\d+))?(?:\.(\d+))?\b",
-    re.IGNORECASE,
-)
+# Regex patterns used only by the macOS parser. The Darwin version is the first
+# digit run after a "darwin" word with no newline in between; see _find_darwin_version().
+DARWIN_RE = re.compile(r"\bdarwin\b", re.IGNORECASE)
+DARWIN_VER_RE = re.compile(r"(\d+)(?:\.(\d+))?(?:\.(\d+))?\b")
+_DIGIT_OR_NEWLINE_RE = re.compile(r"[\d\n]")
 MACOS_VER_FALLBACK_RE = re.compile(r"\bmacos\s?(\d+)(?:\.(\d+))?", re.IGNORECASE)
 
-def parse_macos(text: str, data: dict[str, Any], p: OSData) -> OSData:
+def parse_macos(text: str, data: dict[str, Any], p: OSData, opts: NormalizeOptions = FULL) -> OSData:
     """Populate an OSData instance with macOS-specific details."""
     t = text
     tl = t.lower()
@@ -33,7 +34,8 @@ def parse_macos(text: str, data: dict[str, Any], p: OSData) -> OSData:
     _apply_version_fallback(t, p)
 
     # 4) Fallback: detect codename from text if still missing
-    _apply_codename_fallback(tl, p)
+    if opts.wants("codename", "version_major", "precision") and opts.in_budget(p, "codename"):
+        _apply_codename_fallback(tl, p)
 
     # Confidence boost based on precision
     update_confidence(p, p.precision)
@@ -49,8 +51,28 @@ def _apply_alias_hint(tl: str, p: OSData) -> None:
                 p.precision = _max_precision(p.precision, PrecisionLevel.MAJOR)
 
 
+def _find_darwin_version(t: str) -> re.Match | None:
+    """Match DARWIN_VER_RE at the first digit run following a "darwin" word.
+
+    Equivalent to darwin + a lazy [^\\d\\n]*? gap + version in one pattern, but
+    each gap is scanned once: every "darwin" before the same digit (or newline)
+    leads to the same outcome, so the search resumes after it.
+    """
+    pos = 0
+    while m := DARWIN_RE.search(t, pos):
+        d = _DIGIT_OR_NEWLINE_RE.search(t, m.end())
+        if d is None:
+            return None
+        if d.group() != "\n":
+            v = DARWIN_VER_RE.match(t, d.start())
+            if v:
+                return v
+        pos = d.end()
+    return None
+
+
 def _apply_darwin_mapping(t: str, p: OSData) -> None:
-    m = DARWIN_RE.search(t)
+    m = _find_darwin_version(t)
     if not m:
         return
     dmaj = int(m.group(1))
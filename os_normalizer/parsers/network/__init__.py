@@ -17,6 +17,7 @@ from .netgear import NETGEAR_RE, parse_netgear
 
 from os_normalizer.constants import OSFamily, PrecisionLevel
 from os_normalizer.models import OSData
+from os_normalizer.options import FULL, NormalizeOptions
 
 __all__ = [
     # Cisco
@@ -41,19 +42,19 @@ __all__ = [
 ]
 
 
-def parse_network(text: str, data: dict | None, p: OSData) -> OSData:
+def parse_network(text: str, data: dict | None, p: OSData, opts: NormalizeOptions = FULL) -> OSData:
     """Detect vendor and delegate to the correct parser."""
     tl = text.lower()
     if "cisco" in tl or CISCO_IOS_XE_RE.search(text) or CISCO_IOS_RE.search(text) or CISCO_NXOS_RE.search(text):
-        return parse_cisco(text, p)
+        return parse_cisco(text, p, opts)
     if JUNOS_RE.search(text):
-        return parse_juniper(text, p)
+        return parse_juniper(text, p, opts)
     if FORTI_RE.search(text):
-        return parse_fortinet(text, p)
+        return parse_fortinet(text, p, opts)
     if HUAWEI_RE.search(text):
-        return parse_huawei(text, p)
+        return parse_huawei(text, p, opts)
     if NETGEAR_RE.search(text):
-        return parse_netgear(text, p)
+        return parse_netgear(text, p, opts)
 
     # Unknown network vendor; keep coarse
     p.vendor = p.vendor or "Unknown-Network"
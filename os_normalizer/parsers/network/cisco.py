@@ -3,8 +3,9 @@
 import re
 
 from os_normalizer.constants import CISCO_TRAIN_NAMES, OSFamily, PrecisionLevel
-from os_normalizer.helpers import update_confidence
+from os_normalizer.helpers import record_match, update_confidence
 from os_normalizer.models import OSData
+from os_normalizer.options import FULL, NormalizeOptions
 
 # Detection and parsing regex
 CISCO_IOS_XE_RE = re.compile(r"(ios[\s-]?xe)", re.IGNORECASE)
@@ -24,8 +25,19 @@ CISCO_EDITION_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Fields the image filename pass can set (build_id, NX-OS version fallback, BUILD precision)
+_IMAGE_FIELDS = (
+    "build_id",
+    "version_major",
+    "version_minor",
+    "version_patch",
+    "version_build",
+    "precision",
+    "confidence",
+)
+
 
-def parse_cisco(text: str, p: OSData) -> OSData:
+def parse_cisco(text: str, p: OSData, opts: NormalizeOptions = FULL) -> OSData:
     p.vendor = "Cisco"
     if not isinstance(p.family, OSFamily):
         p.family = OSFamily(p.family) if p.family in OSFamily._value2member_map_ else None
@@ -46,7 +58,7 @@ def parse_cisco(text: str, p: OSData) -> OSData:
     if vm:
         ver = vm.group(1) or vm.group(2)
         if ver:
-            p.evidence["version_raw"] = ver
+            record_match(p, "version_raw", vm, 1 if vm.group(1) else 2)
             num = re.findall(r"\d+", ver)
             if len(num) >= 1:
                 p.version_major = int(num[0])
@@ -62,7 +74,7 @@ def parse_cisco(text: str, p: OSData) -> OSData:
             )
 
     # Image filename
-    img = CISCO_IMAGE_RE.search(text)
+    img = CISCO_IMAGE_RE.search(text) if opts.wants(*_IMAGE_FIELDS) and opts.in_budget(p, "image") else None
     if img:
         p.build_id = img.group(1)
         p.precision = PrecisionLevel.BUILD
@@ -78,21 +90,22 @@ def parse_cisco(text: str, p: OSData) -> OSData:
             p.precision = PrecisionLevel.PATCH
 
     # Model
-    mm = CISCO_MODEL_RE.search(text)
+    mm = CISCO_MODEL_RE.search(text) if opts.wants("hw_model") and opts.in_budget(p, "model") else None
     if mm:
         p.hw_model = mm.group(1)
 
     # Edition (universalk9/ipbase)
-    fl = CISCO_EDITION_RE.search(text)
+    fl = CISCO_EDITION_RE.search(text) if opts.wants("edition") and opts.in_budget(p, "edition") else None
     if fl:
         p.edition = fl.group(1).lower()
 
     # Train codename
-    tl = text.lower()
-    for train in CISCO_TRAIN_NAMES:
-        if train.lower() in tl:
-            p.codename = train
-            break
+    if opts.wants("codename") and opts.in_budget(p, "codename"):
+        tl = text.lower()
+        for train in CISCO_TRAIN_NAMES:
+            if train.lower() in tl:
+                p.codename = train
+                break
 
     # Boost confidence based on precision
     update_confidence(
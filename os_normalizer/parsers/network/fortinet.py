@@ -5,6 +5,7 @@ import re
 from os_normalizer.constants import OSFamily, PrecisionLevel
 from os_normalizer.helpers import update_confidence
 from os_normalizer.models import OSData
+from os_normalizer.options import FULL, NormalizeOptions
 
 FORTI_RE = re.compile(r"\bforti(os|gate)\b", re.IGNORECASE)
 FORTI_VER_RE = re.compile(r"\bv?(\d+\.\d+(?:\.\d+)?)\b", re.IGNORECASE)
@@ -14,7 +15,7 @@ FORTI_MODEL_RE = re.compile(r"\b(FortiGate-?\d+[A-Z]?|FG-\d+[A-Z]?)\b", re.IGNOR
 FORTI_CHANNEL_RE = re.compile(r"\((GA|Patch|Beta)\)", re.IGNORECASE)
 
 
-def parse_fortinet(text: str, p: OSData) -> OSData:
+def parse_fortinet(text: str, p: OSData, opts: NormalizeOptions = FULL) -> OSData:
     p.vendor = "Fortinet"
     p.product = "FortiOS"
     if not isinstance(p.family, OSFamily):
@@ -49,7 +50,7 @@ def parse_fortinet(text: str, p: OSData) -> OSData:
         p.build_id = img.group(1)
         p.precision = PrecisionLevel.BUILD
 
-    mdl = FORTI_MODEL_RE.search(text)
+    mdl = FORTI_MODEL_RE.search(text) if opts.wants("hw_model") and opts.in_budget(p, "model") else None
     if mdl:
         p.hw_model = mdl.group(1).replace("FortiGate-", "FG-")
 
@@ -5,6 +5,7 @@ import re
 from os_normalizer.constants import OSFamily, PrecisionLevel
 from os_normalizer.helpers import update_confidence
 from os_normalizer.models import OSData
+from os_normalizer.options import FULL, NormalizeOptions
 
 HUAWEI_RE = re.compile(r"\bhuawei\b|\bvrp\b", re.IGNORECASE)
 HUAWEI_VER_RE = re.compile(r"\bV(\d{3})R(\d{3})C(\d+)(SPC\d+)?\b", re.IGNORECASE)
@@ -12,7 +13,7 @@ HUAWEI_RAWVER_RE = re.compile(r"\bV\d{3}R\d{3}C\d+(?:SPC\d+)?\b", re.IGNORECASE)
 HUAWEI_MODEL_RE = re.compile(r"\b(S\d{4}-\d{2}[A-Z-]+|CE\d{4}[A-Z-]*|AR\d{3,4}[A-Z-]*)\b", re.IGNORECASE)
 
 
-def parse_huawei(text: str, p: OSData) -> OSData:
+def parse_huawei(text: str, p: OSData, opts: NormalizeOptions = FULL) -> OSData:
     p.vendor = "Huawei"
     p.product = "VRP"
     if not isinstance(p.family, OSFamily):
@@ -31,7 +32,7 @@ def parse_huawei(text: str, p: OSData) -> OSData:
         p.version_minor = int(r)
         p.precision = PrecisionLevel.MINOR
 
-    mdl = HUAWEI_MODEL_RE.search(text)
+    mdl = HUAWEI_MODEL_RE.search(text) if opts.wants("hw_model") and opts.in_budget(p, "model") else None
     if mdl:
         p.hw_model = mdl.group(1)
 
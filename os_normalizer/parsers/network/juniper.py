@@ -3,8 +3,9 @@
 import re
 
 from os_normalizer.constants import OSFamily, PrecisionLevel
-from os_normalizer.helpers import update_confidence
+from os_normalizer.helpers import record_match, update_confidence
 from os_normalizer.models import OSData
+from os_normalizer.options import FULL, NormalizeOptions
 
 JUNOS_RE = re.compile(r"\bjunos\b", re.IGNORECASE)
 JUNOS_VER_RE = re.compile(r"\b(\d{1,2}\.\d{1,2}R\d+(?:-\w+\d+)?)\b", re.IGNORECASE)
@@ -12,7 +13,7 @@ JUNOS_PKG_RE = re.compile(r"\b(jinstall-[a-z0-9_.-]+\.tgz)\b", re.IGNORECASE)
 JUNOS_MODEL_RE = re.compile(r"\b(EX\d{3,4}-\d{2}[A-Z]?|QFX\d{3,4}\w*|SRX\d{3,4}\w*|MX\d{2,3}\w*)\b", re.IGNORECASE)
 
 
-def parse_juniper(text: str, p: OSData) -> OSData:
+def parse_juniper(text: str, p: OSData, opts: NormalizeOptions = FULL) -> OSData:
     p.vendor = "Juniper"
     p.product = "Junos"
     if not isinstance(p.family, OSFamily):
@@ -23,7 +24,7 @@ def parse_juniper(text: str, p: OSData) -> OSData:
     vm = JUNOS_VER_RE.search(text)
     if vm:
         ver = vm.group(1)
-        p.evidence["version_raw"] = ver
+        record_match(p, "version_raw", vm)
         nums = re.findall(r"\d+", ver)
         if nums:
             p.version_major = int(nums[0])
@@ -37,7 +38,7 @@ def parse_juniper(text: str, p: OSData) -> OSData:
         p.build_id = pkg.group(1)
         p.precision = PrecisionLevel.BUILD
 
-    mdl = JUNOS_MODEL_RE.search(text)
+    mdl = JUNOS_MODEL_RE.search(text) if opts.wants("hw_model") and opts.in_budget(p, "model") else None
     if mdl:
         p.hw_model = mdl.group(1)
 
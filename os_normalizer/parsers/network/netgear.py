@@ -5,13 +5,14 @@ import re
 from os_normalizer.constants import OSFamily, PrecisionLevel
 from os_normalizer.helpers import update_confidence
 from os_normalizer.models import OSData
+from os_normalizer.options import FULL, NormalizeOptions
 
 NETGEAR_RE = re.compile(r"\bnetgear\b|\bfirmware\b", re.IGNORECASE)
 NETGEAR_VER_RE = re.compile(r"\bV(\d+\.\d+\.\d+(?:\.\d+)?(?:_\d+\.\d+\.\d+)?)\b", re.IGNORECASE)
 NETGEAR_MODEL_RE = re.compile(r"\b([RN][0-9]{3,4}[A-Z]?)\b", re.IGNORECASE)
 
 
-def parse_netgear(text: str, p: OSData) -> OSData:
+def parse_netgear(text: str, p: OSData, opts: NormalizeOptions = FULL) -> OSData:
     p.vendor = "Netgear"
     p.product = "Firmware"
     if not isinstance(p.family, OSFamily):
@@ -36,7 +37,7 @@ def parse_netgear(text: str, p: OSData) -> OSData:
             else (PrecisionLevel.MINOR if p.version_minor is not None else PrecisionLevel.MAJOR)
         )
 
-    mdl = NETGEAR_MODEL_RE.search(text)
+    mdl = NETGEAR_MODEL_RE.search(text) if opts.wants("hw_model") and opts.in_budget(p, "model") else None
     if mdl:
         p.hw_model = mdl.group(1)
 
@@ -15,6 +15,7 @@ from os_normalizer.constants import (
     PrecisionLevel,
 )
 from os_normalizer.helpers import extract_arch_from_text, update_confidence
+from os_normalizer.options import FULL, NormalizeOptions
 
 if TYPE_CHECKING:
     from os_normalizer.models import OSData
@@ -87,14 +88,16 @@ class VersionState:
     explicit: bool = False
 
 
-def parse_windows(text: str, data: dict[str, Any], p: OSData) -> OSData:
+def parse_windows(text: str, data: dict[str, Any], p: OSData, opts: NormalizeOptions = FULL) -> OSData:
     """Populate an OSData instance with Windows-specific details."""
     tl = text.lower()
 
     p.vendor = "Microsoft"
     p.kernel_name = "nt"
-    p.arch = extract_arch_from_text(tl)
-    p.edition = _detect_edition(tl)
+    if opts.wants("arch"):
+        p.arch = extract_arch_from_text(tl)
+    if opts.wants("edition") and opts.in_budget(p, "edition"):
+        p.edition = _detect_edition(tl)
 
     product = _detect_product(tl)
     server_hint = _initial_server_hint(tl, product)
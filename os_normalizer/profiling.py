@@ -0,0 +1,384 @@
+"""Opt-in instrumentation of the normalize_os pipeline.
+
+Stage timing: while an observer (e.g. StageTimer) is attached, normalize_os
+reports each call's stage timings to it:
+
+    detect          family detection (including input strip/lower)
+    parse.<family>  the family parser, e.g. parse.network, parse.windows
+    arch            architecture fallback from the raw text
+    cpe             os_key generation
+
+With no observer attached the pipeline only tests one module attribute per
+call. Observers see calls made in this process; process-pool workers used by
+normalize_many(workers=...) report to observers in their own process.
+
+Slow inputs: SlowInputSampler is an observer keeping the N slowest inputs
+with their stage timings, so latency outliers can be replayed offline.
+
+Pattern counters: PatternProfiler is a debug mode that swaps the package's
+module-level compiled regexes for counting stand-ins, to rank patterns by
+cost and find ones that never match on a corpus.
+"""
+
+from __future__ import annotations
+
+import heapq
+import linecache
+import re
+import sys
+import threading
+from collections.abc import Iterable, Iterator
+from time import perf_counter, time
+from types import ModuleType
+from typing import Any, NamedTuple, Protocol
+
+# Attached observers; replaced (never mutated) so readers need no lock
+OBSERVERS: tuple[Observer, ...] = ()
+
+_attach_lock = threading.Lock()
+
+_PACKAGE = __name__.rpartition(".")[0]
+
+
+class Observer(Protocol):
+    def observe(self, text: str, data: dict, stages: dict[str, float], total: float) -> None: ...
+
+
+def attach(observer: Observer) -> None:
+    """Start reporting normalize_os timings to observer."""
+    global OBSERVERS
+    with _attach_lock:
+        if observer not in OBSERVERS:
+            OBSERVERS = (*OBSERVERS, observer)
+
+
+def detach(observer: Observer) -> None:
+    """Stop reporting to observer (no-op if it is not attached)."""
+    global OBSERVERS
+    with _attach_lock:
+        OBSERVERS = tuple(o for o in OBSERVERS if o is not observer)
+
+
+class StageRecorder:
+    """Collects the stage laps of one normalize_os call."""
+
+    __slots__ = ("observers", "stages", "start", "last")
+
+    def __init__(self, observers: tuple[Observer, ...]) -> None:
+        self.observers = observers
+        self.stages: dict[str, float] = {}
+        self.start = self.last = perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """Charge the time since the previous lap to stage."""
+        now = perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + now - self.last
+        self.last = now
+
+    def finish(self, text: str, data: dict) -> None:
+        total = perf_counter() - self.start
+        for observer in self.observers:
+            observer.observe(text, data, self.stages, total)
+
+
+class StageStats(NamedTuple):
+    """Cumulative figures for one stage."""
+
+    calls: int
+    seconds: float
+
+    @property
+    def mean(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+class StageTimer:
+    """Cumulative time and call counts per normalize_os stage.
+
+    Use as a context manager around the code to measure, or call start() and
+    stop() to keep one attached for the life of a process. The "total" entry
+    covers whole normalize_os calls, so its calls count is the number of inputs.
+
+        with StageTimer() as timer:
+            normalize_many(records)
+        metrics.export(timer.snapshot())
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, int] = {}
+        self._seconds: dict[str, float] = {}
+
+    def __enter__(self) -> StageTimer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        attach(self)
+
+    def stop(self) -> None:
+        detach(self)
+
+    def observe(self, text: str, data: dict, stages: dict[str, float], total: float) -> None:
+        with self._lock:
+            for stage, seconds in (*stages.items(), ("total", total)):
+                self._calls[stage] = self._calls.get(stage, 0) + 1
+                self._seconds[stage] = self._seconds.get(stage, 0.0) + seconds
+
+    def snapshot(self) -> dict[str, StageStats]:
+        """Return {stage: StageStats(calls, seconds)}, slowest stage first."""
+        with self._lock:
+            stats = {stage: StageStats(calls, self._seconds[stage]) for stage, calls in self._calls.items()}
+        return dict(sorted(stats.items(), key=lambda item: item[1].seconds, reverse=True))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls.clear()
+            self._seconds.clear()
+
+
+class SlowInput(NamedTuple):
+    """One sampled normalize_os call."""
+
+    seconds: float
+    text: str
+    data: dict | None
+    stages: dict[str, float]
+    when: float  # wall-clock time of the call (time.time())
+
+
+class SlowInputSampler:
+    """Keep the N slowest normalize_os inputs seen while attached.
+
+    Entries live in a bounded min-heap, so memory stays at N inputs however
+    long the sampler runs; calls faster than threshold (seconds) or than the
+    fastest kept entry are dropped after one comparison. Texts longer than
+    max_chars are stored truncated (and will no longer reproduce exactly).
+
+        sampler = SlowInputSampler(size=50, threshold=0.001)
+        sampler.start()
+        ...
+        for entry in sampler.dump():
+            log.info("slow input %.1f ms: %r", 1e3 * entry.seconds, entry.text)
+    """
+
+    def __init__(self, size: int = 100, threshold: float = 0.0, max_chars: int | None = None) -> None:
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.size = size
+        self.threshold = threshold
+        self.max_chars = max_chars
+        self._lock = threading.Lock()
+        self._heap: list[tuple[float, int, SlowInput]] = []
+        self._seq = 0
+        # Fastest kept time once the heap is full; only written under the lock
+        self._floor = float("-inf")
+
+    def __enter__(self) -> SlowInputSampler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def start(self) -> None:
+        attach(self)
+
+    def stop(self) -> None:
+        detach(self)
+
+    def observe(self, text: str, data: dict, stages: dict[str, float], total: float) -> None:
+        # Unlocked pre-check against a snapshot; the heap itself is only read under the lock
+        if total < self.threshold or total <= self._floor:
+            return
+        if self.max_chars is not None and len(text) > self.max_chars:
+            text = text[: self.max_chars]
+        entry = SlowInput(total, text, dict(data) if data else None, dict(stages), time())
+        with self._lock:
+            heap = self._heap
+            self._seq += 1
+            if len(heap) < self.size:
+                heapq.heappush(heap, (total, self._seq, entry))
+            elif total > heap[0][0]:
+                heapq.heapreplace(heap, (total, self._seq, entry))
+            if len(heap) >= self.size:
+                self._floor = heap[0][0]
+
+    def dump(self) -> list[SlowInput]:
+        """Return the sampled calls, slowest first."""
+        with self._lock:
+            return [entry for _, _, entry in sorted(self._heap, reverse=True)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap.clear()
+            self._floor = float("-inf")
+
+
+# ============================================================
+# Per-pattern counters
+# ============================================================
+
+
+class PatternStats(NamedTuple):
+    """Usage of one module-level compiled pattern."""
+
+    name: str  # module.ATTRIBUTE where the pattern is defined
+    scans: int
+    matches: int
+    seconds: float
+
+    @property
+    def mean(self) -> float:
+        return self.seconds / self.scans if self.scans else 0.0
+
+
+class CountingPattern:
+    """Stand-in for a compiled pattern that counts scans, matches and time."""
+
+    __slots__ = ("pattern_obj", "name", "scans", "matches", "seconds")
+
+    def __init__(self, pattern_obj: re.Pattern, name: str) -> None:
+        self.pattern_obj = pattern_obj
+        self.name = name
+        self.scans = 0
+        self.matches = 0
+        self.seconds = 0.0
+
+    def __getattr__(self, attr: str) -> Any:
+        # pattern, flags, groups, groupindex, ...
+        return getattr(self.pattern_obj, attr)
+
+    def __repr__(self) -> str:
+        return f"CountingPattern({self.pattern_obj!r})"
+
+    def _timed(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        result = getattr(self.pattern_obj, method)(*args, **kwargs)
+        self.seconds += perf_counter() - start
+        self.scans += 1
+        return result
+
+    def search(self, *args: Any, **kwargs: Any) -> re.Match | None:
+        m = self._timed("search", *args, **kwargs)
+        self.matches += m is not None
+        return m
+
+    def match(self, *args: Any, **kwargs: Any) -> re.Match | None:
+        m = self._timed("match", *args, **kwargs)
+        self.matches += m is not None
+        return m
+
+    def fullmatch(self, *args: Any, **kwargs: Any) -> re.Match | None:
+        m = self._timed("fullmatch", *args, **kwargs)
+        self.matches += m is not None
+        return m
+
+    def findall(self, *args: Any, **kwargs: Any) -> list[Any]:
+        found = self._timed("findall", *args, **kwargs)
+        self.matches += bool(found)
+        return found
+
+    def finditer(self, *args: Any, **kwargs: Any) -> Iterator[re.Match]:
+        # Collected eagerly so the scan is timed as a whole
+        found = list(self._timed("finditer", *args, **kwargs))
+        self.matches += bool(found)
+        return iter(found)
+
+    def sub(self, repl: Any, string: str, count: int = 0) -> str:
+        out, n = self._timed("subn", repl, string, count)
+        self.matches += n > 0
+        return out
+
+    def subn(self, repl: Any, string: str, count: int = 0) -> tuple[str, int]:
+        out, n = self._timed("subn", repl, string, count)
+        self.matches += n > 0
+        return out, n
+
+    def split(self, *args: Any, **kwargs: Any) -> list[Any]:
+        parts = self._timed("split", *args, **kwargs)
+        self.matches += len(parts) > 1
+        return parts
+
+
+class PatternProfiler:
+    """Debug mode that counts every use of the package's module-level regexes.
+
+    While active, each re.Pattern bound at module level in a loaded
+    os_normalizer module is swapped for a CountingPattern (a pattern shared by
+    several modules through imports gets one counter). Patterns built inline
+    with re.search(r"...") are not covered. Counters are not locked; profile
+    from a single thread.
+
+        with PatternProfiler() as profiler:
+            for text in corpus:
+                normalize_os(text)
+        for stats in profiler.report():
+            print(stats.name, stats.scans, stats.matches, stats.seconds)
+    """
+
+    def __init__(self, modules: Iterable[ModuleType] | None = None) -> None:
+        self._modules = list(modules) if modules is not None else None
+        self._patched: list[tuple[ModuleType, str, re.Pattern]] = []
+        self._counters: dict[int, CountingPattern] = {}
+
+    def __enter__(self) -> PatternProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Swap in counting patterns (counters start at zero)."""
+        if self._patched:
+            raise RuntimeError("PatternProfiler is already active")
+        found = [
+            (module, attr, value)
+            for module in (self._modules if self._modules is not None else _package_modules())
+            for attr, value in list(vars(module).items())
+            if isinstance(value, re.Pattern)
+        ]
+        # Name each pattern after the module that assigns it, not the ones importing it
+        owners: dict[int, str] = {}
+        for module, attr, value in found:
+            if id(value) not in owners or _assigns(module, attr):
+                owners[id(value)] = f"{module.__name__}.{attr}"
+        self._counters = {id(v): CountingPattern(v, owners[id(v)]) for _, _, v in found}
+        for module, attr, value in found:
+            setattr(module, attr, self._counters[id(value)])
+            self._patched.append((module, attr, value))
+
+    def stop(self) -> None:
+        """Put the original compiled patterns back; counters are kept for report()."""
+        for module, attr, value in self._patched:
+            setattr(module, attr, value)
+        self._patched = []
+
+    def report(self) -> list[PatternStats]:
+        """Return per-pattern stats, most expensive first."""
+        stats = [PatternStats(c.name, c.scans, c.matches, c.seconds) for c in self._counters.values()]
+        return sorted(stats, key=lambda s: (-s.seconds, -s.scans, s.name))
+
+    def dead(self) -> list[PatternStats]:
+        """Patterns that were scanned but never matched."""
+        return [s for s in self.report() if s.scans and not s.matches]
+
+
+def _package_modules() -> list[ModuleType]:
+    """Every loaded os_normalizer module."""
+    return [m for name, m in list(sys.modules.items()) if name == _PACKAGE or name.startswith(f"{_PACKAGE}.")]
+
+
+def _assigns(module: ModuleType, attr: str) -> bool:
+    """True if the module's source binds attr with a top-level assignment."""
+    source = getattr(module, "__file__", None)
+    if not source:
+        return False
+    return any(line.startswith((f"{attr} =", f"{attr}: ")) for line in linecache.getlines(source))
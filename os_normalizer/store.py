@@ -0,0 +1,420 @@
+"""Persistent result caches: a sqlite3 store and a read-only mmap table.
+
+Entries are keyed by a digest of the (text, data) input and stamped with the
+library version plus a fingerprint of the knowledge tables and parsing modules.
+A store whose stamp differs from the running code is never served from, so
+results never outlive the logic that produced them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import sqlite3
+import struct
+from collections.abc import Iterable
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from os_normalizer import constants
+from os_normalizer.batch import Record, normalize_many, split_record
+from os_normalizer.canonical import canonicalize_text
+from os_normalizer.models import OSData
+from os_normalizer.os_normalizer import normalize_os
+
+DEFAULT_BATCH_SIZE = 1000
+
+# mmap table layout: header, stamp, open-addressed slot array, payload region
+MMAP_MAGIC = b"OSNMMAP1"
+_MMAP_HEADER = struct.Struct("<8sIQQI")  # magic, stamp length, slot count, entry count, slots offset
+_MMAP_SLOT = struct.Struct("<16sQI4x")  # input digest, payload offset (0 = empty), payload length
+
+# Modules whose source determines parse results or cache keys (relative to the package root)
+_LOGIC_MODULES = (
+    "canonical.py",
+    "constants.py",
+    "cpe.py",
+    "helpers.py",
+    "models.py",
+    "options.py",
+    "os_normalizer.py",
+    "parsers",
+    "window.py",
+)
+
+# Lookup tables baked into the fingerprint by value
+_KNOWLEDGE_TABLES = (
+    "ARCHITECTURE_TOKENS",
+    "ARCH_SYNONYMS",
+    "WINDOWS_BUILD_MAP",
+    "WINDOWS_SERVER_BUILD_MAP",
+    "WINDOWS_NT_CLIENT_MAP",
+    "WINDOWS_NT_SERVER_MAP",
+    "WINDOWS_PRODUCT_PATTERNS",
+    "MACOS_ALIASES",
+    "MACOS_DARWIN_MAP",
+    "CISCO_TRAIN_NAMES",
+)
+
+
+def library_version() -> str:
+    """Return the installed os-normalizer version (or a placeholder when run from source)."""
+    try:
+        return metadata.version("os-normalizer")
+    except metadata.PackageNotFoundError:
+        return "0+unknown"
+
+
+@cache
+def knowledge_fingerprint() -> str:
+    """Return a digest of the lookup tables and parsing-module sources."""
+    h = hashlib.sha256()
+    for name in _KNOWLEDGE_TABLES:
+        h.update(name.encode())
+        h.update(_table_repr(getattr(constants, name)).encode())
+    root = Path(__file__).parent
+    for entry in _LOGIC_MODULES:
+        path = root / entry
+        for src in sorted(path.rglob("*.py")) if path.is_dir() else [path]:
+            h.update(str(src.relative_to(root)).encode())
+            h.update(src.read_bytes())
+    return h.hexdigest()
+
+
+def input_digest(text: str, data: dict | None, canonicalize: bool = False) -> str:
+    """Return a stable hex digest for a (text, data) input pair."""
+    return input_digest_bytes(text, data, canonicalize).hex()
+
+
+def input_digest_bytes(text: str, data: dict | None, canonicalize: bool = False) -> bytes:
+    """Return the raw 16-byte digest behind input_digest()."""
+    text = canonicalize_text(text) if canonicalize else text.strip()
+    return hashlib.blake2b(_stable_json([text, data or {}]).encode(), digest_size=16).digest()
+
+
+def encode_result(p: OSData) -> str:
+    """Serialize an OSData as a compact JSON array (see OSData.to_bytes)."""
+    return p.to_bytes().decode()
+
+
+def decode_result(payload: str) -> OSData:
+    """Inverse of encode_result()."""
+    return OSData.from_bytes(payload)
+
+
+class SQLiteCache:
+    """Persistent normalize_os cache stored in a SQLite database.
+
+    Writes are buffered and committed in batches of `batch_size` (and on flush()
+    or close()). Lookups decode a fresh OSData each time, so results are never
+    shared between callers.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        canonicalize: bool = False,
+    ) -> None:
+        self.path = str(path)
+        self.batch_size = max(1, batch_size)
+        self.canonicalize = canonicalize
+        self.stamp = f"{library_version()}:{knowledge_fingerprint()}"
+        self.hits = 0
+        self.misses = 0
+        self._pending: dict[str, str] = {}
+        self._conn = sqlite3.connect(self.path)
+        self._init_schema()
+
+    def __enter__(self) -> SQLiteCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __call__(self, text: str, data: dict | None = None) -> OSData:
+        return self.normalize(text, data)
+
+    def __len__(self) -> int:
+        self.flush()
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def normalize(self, text: str, data: dict | None = None) -> OSData:
+        """Return normalize_os(text, data), served from the store when possible."""
+        key = self.key_for(text, data)
+        hit = self._lookup([key]).get(key)
+        if hit is not None:
+            self.hits += 1
+            return decode_result(hit)
+        self.misses += 1
+        result = normalize_os(text, data)
+        self._store(key, encode_result(result))
+        return result
+
+    def normalize_many(self, records: Iterable[Record], workers: int | None = None) -> list[OSData | Exception]:
+        """Normalize a batch, parsing only inputs missing from the store.
+
+        Misses are handed to batch.normalize_many (optionally with workers) and
+        persisted; failures are returned in their slots and never stored.
+        """
+        out: list[OSData | Exception | None] = []
+        keys: list[str | None] = []
+        pairs: list[tuple[str, dict | None]] = []
+        for record in records:
+            try:
+                text, data = split_record(record)
+                key = self.key_for(text, data)
+            except (TypeError, ValueError, AttributeError) as exc:
+                out.append(exc)
+                keys.append(None)
+                pairs.append(("", None))
+                continue
+            out.append(None)
+            keys.append(key)
+            pairs.append((text, data))
+
+        found = self._lookup([k for k in keys if k is not None])
+        missing = [i for i, key in enumerate(keys) if key is not None and key not in found]
+        parsed = normalize_many([pairs[i] for i in missing], workers=workers)
+        for i, result in zip(missing, parsed, strict=True):
+            key = keys[i]
+            if isinstance(result, OSData) and key not in found:
+                found[key] = encode_result(result)
+                self._store(key, found[key])
+            out[i] = result
+
+        self.misses += len(missing)
+        self.hits += sum(1 for i, key in enumerate(keys) if key is not None) - len(missing)
+        return [decode_result(found[keys[i]]) if r is None else r for i, r in enumerate(out)]
+
+    def key_for(self, text: str, data: dict | None) -> str:
+        return input_digest(text, data, self.canonicalize)
+
+    def flush(self) -> None:
+        """Commit buffered writes."""
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (key, payload) VALUES (?, ?)", list(self._pending.items())
+            )
+        self._pending.clear()
+
+    def clear(self) -> None:
+        """Remove every stored result."""
+        self._pending.clear()
+        with self._conn:
+            self._conn.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        self.flush()
+        self._conn.close()
+
+    def _init_schema(self) -> None:
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, payload TEXT NOT NULL)")
+            row = self._conn.execute("SELECT value FROM meta WHERE name = 'stamp'").fetchone()
+            if row is None or row[0] != self.stamp:
+                # Library or knowledge tables changed: every stored result is stale
+                self._conn.execute("DELETE FROM results")
+                self._conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('stamp', ?)", (self.stamp,))
+
+    def _lookup(self, keys: list[str]) -> dict[str, str]:
+        found = {k: self._pending[k] for k in keys if k in self._pending}
+        todo = sorted({k for k in keys if k not in found})
+        # Stay well below SQLite's bound-parameter limit
+        for i in range(0, len(todo), 500):
+            chunk = todo[i : i + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = self._conn.execute(f"SELECT key, payload FROM results WHERE key IN ({marks})", chunk)  # noqa: S608
+            found.update(rows)
+        return found
+
+    def _store(self, key: str, payload: str) -> None:
+        self._pending[key] = payload
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+
+class MmapCache:
+    """Read-only, memory-mapped result table shared by every process on a node.
+
+    The file is produced once by build_mmap_cache() and opened by each worker;
+    pages are shared through the OS page cache, so workers start warm without
+    duplicating entries in their own heaps. Tables built by a different library
+    version or knowledge-table fingerprint are marked stale and never served from.
+    """
+
+    def __init__(self, path: str | Path, canonicalize: bool = False) -> None:
+        self.path = str(path)
+        self.canonicalize = canonicalize
+        self.hits = 0
+        self.misses = 0
+        with open(self.path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size < _MMAP_HEADER.size:
+                raise ValueError(f"{self.path} is not an os-normalizer mmap cache")
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, stamp_len, self._slots, self._entries, self._slots_at = _MMAP_HEADER.unpack_from(self._mm, 0)
+            if magic != MMAP_MAGIC:
+                raise ValueError(f"{self.path} is not an os-normalizer mmap cache")
+            size = len(self._mm)
+            if _MMAP_HEADER.size + stamp_len > size or self._slots_at + self._slots * _MMAP_SLOT.size > size:
+                raise ValueError(f"{self.path} is truncated")
+            stamp = self._mm[_MMAP_HEADER.size : _MMAP_HEADER.size + stamp_len].decode()
+        except BaseException:
+            self._mm.close()
+            raise
+        self.stale = stamp != f"{library_version()}:{knowledge_fingerprint()}"
+
+    def __enter__(self) -> MmapCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def __contains__(self, item: tuple[str, dict | None]) -> bool:
+        return self._payload(self.key_for(*item)) is not None
+
+    def __call__(self, text: str, data: dict | None = None) -> OSData:
+        return self.normalize(text, data)
+
+    def key_for(self, text: str, data: dict | None) -> bytes:
+        return input_digest_bytes(text, data, self.canonicalize)
+
+    def get(self, text: str, data: dict | None = None) -> OSData | None:
+        """Return the stored result for an input, or None when absent."""
+        payload = self._payload(self.key_for(text, data))
+        return decode_result(payload) if payload is not None else None
+
+    def normalize(self, text: str, data: dict | None = None) -> OSData:
+        """Return the stored result, falling back to normalize_os on a miss."""
+        hit = self.get(text, data)
+        if hit is not None:
+            self.hits += 1
+            return hit
+        self.misses += 1
+        return normalize_os(text, data)
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def _payload(self, digest: bytes) -> str | None:
+        if self.stale or not self._slots:
+            return None
+        mask = self._slots - 1
+        idx = int.from_bytes(digest[:8], "little") & mask
+        for _ in range(self._slots):
+            key, offset, length = _MMAP_SLOT.unpack_from(self._mm, self._slots_at + idx * _MMAP_SLOT.size)
+            if offset == 0:
+                return None
+            if key == digest:
+                return self._mm[offset : offset + length].decode()
+            idx = (idx + 1) & mask
+        return None
+
+
+def build_mmap_cache(
+    path: str | Path,
+    records: Iterable[Record],
+    canonicalize: bool = False,
+    load_factor: float = 0.5,
+    workers: int | None = None,
+) -> int:
+    """Normalize a corpus of past inputs and write an MmapCache file.
+
+    Distinct inputs are parsed once (optionally over `workers` processes);
+    records that fail to normalize are skipped. The file is written to a
+    temporary name and atomically renamed, so readers never see a partial table.
+    Returns the number of stored entries.
+    """
+    if not 0 < load_factor < 1:
+        raise ValueError("load_factor must be between 0 and 1")
+
+    payloads: dict[bytes, bytes] = {}
+    pairs: list[tuple[str, dict | None]] = []
+    digests: list[bytes] = []
+    for record in records:
+        try:
+            text, data = split_record(record)
+            digest = input_digest_bytes(text, data, canonicalize)
+        except (TypeError, ValueError, AttributeError):
+            continue
+        if digest not in payloads:
+            payloads[digest] = b""
+            pairs.append((text, data))
+            digests.append(digest)
+    for digest, result in zip(digests, normalize_many(pairs, workers=workers), strict=True):
+        if isinstance(result, OSData):
+            payloads[digest] = encode_result(result).encode()
+        else:
+            del payloads[digest]
+
+    slots = 1
+    while slots * load_factor < len(payloads):
+        slots <<= 1
+    stamp = f"{library_version()}:{knowledge_fingerprint()}".encode()
+    slots_at = -(-(_MMAP_HEADER.size + len(stamp)) // 8) * 8
+    data_at = slots_at + slots * _MMAP_SLOT.size
+
+    table = bytearray(slots * _MMAP_SLOT.size)
+    blob = bytearray()
+    mask = slots - 1
+    for digest, payload in payloads.items():
+        idx = int.from_bytes(digest[:8], "little") & mask
+        while _MMAP_SLOT.unpack_from(table, idx * _MMAP_SLOT.size)[1]:
+            idx = (idx + 1) & mask
+        _MMAP_SLOT.pack_into(table, idx * _MMAP_SLOT.size, digest, data_at + len(blob), len(payload))
+        blob += payload
+
+    header = _MMAP_HEADER.pack(MMAP_MAGIC, len(stamp), slots, len(payloads), slots_at)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(header)
+        fh.write(stamp)
+        fh.write(b"\0" * (slots_at - len(header) - len(stamp)))
+        fh.write(table)
+        fh.write(blob)
+    os.replace(tmp, path)
+    return len(payloads)
+
+
+def _table_repr(obj: Any) -> str:
+    if isinstance(obj, dict):
+        return repr(sorted(obj.items(), key=repr))
+    if isinstance(obj, (set, frozenset)):
+        return repr(sorted(obj, key=repr))
+    return repr(obj)
+
+
+def _stable_json(obj: Any) -> str:
+    try:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=_json_default)
+    except TypeError:
+        # Mixed-type keys cannot be sorted; compare them as strings (JSON object keys are strings anyway)
+        return json.dumps(_str_keys(obj), sort_keys=True, separators=(",", ":"), default=_json_default)
+
+
+def _str_keys(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {str(k): _str_keys(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_str_keys(v) for v in obj]
+    return obj
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    if isinstance(obj, tuple):
+        return list(obj)
+    return str(obj)
@@ -0,0 +1,143 @@
+"""Packed, order-preserving version keys.
+
+version_key() folds version_major/minor/patch and the vendor-specific
+version_build string into one unsigned 64-bit integer whose natural ordering
+matches the vendor's release ordering, e.g.
+
+    Junos   20.4R3 < 20.4R3-S1 < 20.4R3-S3 < 20.4R3-S3.4 < 21.1R1
+    IOS XE  17.9.4 < 17.9.4a < 17.9.5
+    VRP     V800R012C00 < V800R012C00SPC500 < V800R012C10
+    Windows 10.0.22621.4317 < 10.0.22631.3880
+
+Layout, most significant first: major (12 bits), minor (10 bits), then a
+42-bit family-specific tail. Every component is stored as value + 1 so a
+missing part (None) sorts before 0; values too wide for their slot saturate.
+Keys only order versions of the same product, so sort on (family, product,
+version_key) when mixing products. They fit numpy.uint64 for vectorized range
+filters.
+"""
+
+from __future__ import annotations
+
+import re
+
+from os_normalizer.constants import OSFamily
+from os_normalizer.models import FrozenOSData, OSData
+
+KEY_BITS = 64
+
+_MAJOR_BITS = 12
+_MINOR_BITS = 10
+_TAIL_BITS = KEY_BITS - _MAJOR_BITS - _MINOR_BITS
+
+# Junos: 20.4R3-S3.4, 12.3X48-D105.3, 21.1R1.11
+_JUNOS_RE = re.compile(r"^\d+\.\d+([A-Z])(\d+)(?:-([SD])(\d+))?(?:\.(\d+))?", re.IGNORECASE)
+_JUNOS_TYPES = {"I": 1, "B": 2, "F": 3, "R": 4, "X": 5}
+
+# Cisco: 17.9.4a, 15.2(7)E4, 12.2(55)SE12, 9.3(8)
+_CISCO_RE = re.compile(r"^\d+\.\d+(?:[.(]\d+\)?)?([a-z])?([A-Z]{1,2})?(\d+)?([a-z])?")
+
+# Huawei VRP: V800R012C00SPC500, V200R019C10SPH003, V200R010C00B100
+_VRP_RE = re.compile(r"C(\d+)(?:SPC(\d+))?(?:SPH(\d+))?(?:B(\d+))?", re.IGNORECASE)
+
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def version_key(p: OSData | FrozenOSData) -> int:
+    """Return the packed 64-bit sort key for an OSData or FrozenOSData."""
+    key = _field(p.version_major, _MAJOR_BITS)
+    key = key << _MINOR_BITS | _field(p.version_minor, _MINOR_BITS)
+    return key << _TAIL_BITS | _tail(p)
+
+
+def _field(value: int | None, bits: int) -> int:
+    """Store value + 1 (0 = missing), saturating at the slot width."""
+    if value is None:
+        return 0
+    return min(max(value, 0) + 1, (1 << bits) - 1)
+
+
+def _pack(*parts: tuple[int | None, int]) -> int:
+    key = 0
+    for value, bits in parts:
+        key = key << bits | _field(value, bits)
+    return key
+
+
+def _tail(p: OSData | FrozenOSData) -> int:
+    family = p.family
+    build = p.version_build or ""
+    if family == OSFamily.WINDOWS:
+        # Build number, then UBR (stored in version_patch by the Windows parser)
+        return _pack((_int(build), 18), (p.version_patch, 24))
+    if family == OSFamily.NETWORK:
+        vendor = (p.vendor or "").lower()
+        if vendor == "juniper":
+            return _pack((p.version_patch, 10)) << 32 | _junos(build)
+        if vendor == "cisco":
+            return _pack((p.version_patch, 12)) << 30 | _cisco(build)
+        if vendor == "huawei":
+            return _pack((p.version_patch, 12)) << 30 | _vrp(build)
+    return _pack((p.version_patch, 12)) << 30 | _generic(p, build)
+
+
+def _junos(build: str) -> int:
+    """32 bits: release type (3), release (9), service kind (2), service (12), respin (6)."""
+    m = _JUNOS_RE.match(build)
+    if not m:
+        return 0
+    kind, rel, svc_kind, svc, respin = m.groups()
+    return _pack(
+        (_JUNOS_TYPES.get(kind.upper(), 0), 3),
+        (int(rel), 9),
+        ({"S": 1, "D": 2}.get((svc_kind or "").upper()), 2),
+        (_int(svc), 12),
+        (_int(respin), 6),
+    )
+
+
+def _cisco(build: str) -> int:
+    """30 bits: rebuild letter (5), train (10), train number (10), train rebuild letter (5)."""
+    m = _CISCO_RE.match(build)
+    if not m:
+        return 0
+    rebuild, train, number, train_rebuild = m.groups()
+    return _pack((_letter(rebuild), 5), (_train(train), 10), (_int(number), 10), (_letter(train_rebuild), 5))
+
+
+def _vrp(build: str) -> int:
+    """30 bits: C release (7), SPC (10), SPH (10), B build (3, saturating)."""
+    m = _VRP_RE.search(build)
+    if not m:
+        return 0
+    return _pack(*((_int(g), bits) for g, bits in zip(m.groups(), (7, 10, 10, 3), strict=True)))
+
+
+def _generic(p: OSData | FrozenOSData, build: str) -> int:
+    """30 bits from the build's first two numeric runs (26 + 4), after any major.minor.patch echo."""
+    prefix = ".".join(str(v) for v in (p.version_major, p.version_minor, p.version_patch) if v is not None)
+    if prefix and build.startswith(prefix):
+        build = build[len(prefix) :]
+    runs = [int(d) for d in _DIGITS_RE.findall(build)[:2]]
+    if not runs:
+        return 0
+    return _pack((runs[0], 26), (runs[1] if len(runs) > 1 else None, 4))
+
+
+def _int(text: str | None) -> int | None:
+    if not text:
+        return None
+    m = _DIGITS_RE.search(text)
+    return int(m.group(0)) if m else None
+
+
+def _letter(ch: str | None) -> int | None:
+    return ord(ch.lower()) - ord("a") if ch else None
+
+
+def _train(letters: str | None) -> int | None:
+    # Base-27 over up to two uppercase letters: "E" < "EA" < ... < "SE"
+    if not letters:
+        return None
+    a, b = letters[0], letters[1] if len(letters) > 1 else None
+    return (ord(a) - ord("A") + 1) * 27 + (ord(b) - ord("A") + 1 if b else 0)
@@ -0,0 +1,160 @@
+"""Bounded scan windows for oversized inputs.
+
+Some sources send whole command outputs or concatenated logs as text. Rather
+than running every parser pattern over megabytes, normalize_os hands the
+parsers only the relevant region: the lines around family-specific anchor
+words (product names, kernel names, ...), then around architecture tokens and
+generic words ("version", "release", "build"), topped up with the head of the
+input, up to max_scan characters.
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_right
+from collections.abc import Iterator
+
+from os_normalizer.constants import ARCHITECTURE_TOKENS, CISCO_TRAIN_NAMES, MACOS_ALIASES, OSFamily
+from os_normalizer.helpers import ARCH_TEXT_RE
+
+# Characters kept on each side of an anchor when its line is very long
+LINE_CONTEXT = 256
+
+_GENERIC = ("version", "release", "build")
+
+# Architecture tokens not containing another one ("x86" also finds "x86_64");
+# each hit is confirmed with ARCH_TEXT_RE, so "arm" in "alarm" is skipped
+_ARCH_ROOTS = tuple(sorted(t for t in ARCHITECTURE_TOKENS if not any(o != t and o in t for o in ARCHITECTURE_TOKENS)))
+
+_ANCHOR_WORDS: dict[OSFamily | None, tuple[str, ...]] = {
+    OSFamily.NETWORK: (
+        "cisco",
+        "ios",
+        "nx-os",
+        "nxos",
+        "nexus",
+        "junos",
+        "jinstall",
+        "forti",
+        "fgt_",
+        "huawei",
+        "vrp",
+        "netgear",
+        "firmware",
+        "software",
+        "model",
+        ".bin",
+        *(name.lower() for name in sorted(CISCO_TRAIN_NAMES)),
+    ),
+    OSFamily.WINDOWS: ("windows", "microsoft", "nt ", "edition", "server", "kernel", "service pack"),
+    OSFamily.MACOS: ("darwin", "macos", "mac os", "os x", "xnu", *MACOS_ALIASES),
+    OSFamily.LINUX: ("linux", "kernel", "uname"),
+    OSFamily.SOLARIS: ("sunos", "solaris", "generic_"),
+    OSFamily.ESXI: ("esxi", "vmkernel", "vmware", "update"),
+    OSFamily.BSD: ("freebsd", "openbsd", "netbsd", "stable", "current"),
+    OSFamily.ANDROID: ("android",),
+    OSFamily.IOS: ("ios", "ipados", "iphone", "ipad"),
+    OSFamily.HARMONYOS: ("harmonyos",),
+    None: (),
+}
+
+
+def relevant_region(text: str, family: OSFamily | None, limit: int, lowered: str | None = None) -> str:
+    """Return at most limit characters of text that the family's parser needs.
+
+    Texts within the limit are returned unchanged. Otherwise the lines (or the
+    LINE_CONTEXT characters around the anchor, for very long lines) holding
+    the family's anchor words, then architecture tokens, then the generic
+    words are collected; budget left over is filled with text from the head of
+    the input. Pieces are joined with newlines in input order.
+
+    Anchors are located with str.find on the lowercased text (pass lowered if
+    the caller already has it), so the cost is linear in len(text) and
+    collection stops as soon as the window is full.
+    """
+    if len(text) <= limit:
+        return text
+    tl = lowered if lowered is not None else text.lower()
+    starts: list[int] = []
+    ends: list[int] = []
+    used = 0
+    tiers = (
+        heapq.merge(*(_occurrences(tl, w) for w in _ANCHOR_WORDS[family])),
+        heapq.merge(*(_arch_occurrences(tl, w) for w in _ARCH_ROOTS)),
+        heapq.merge(*(_occurrences(tl, w) for w in _GENERIC)),
+    )
+    for hits in tiers:
+        for start, end in hits:
+            used += _take_line(text, start, end, starts, ends)
+            if used >= limit:
+                break
+        if used >= limit:
+            break
+    if used < limit:
+        _fill_from_head(text, limit - used, starts, ends)
+    return "\n".join(text[a:b] for a, b in zip(starts, ends, strict=True))[:limit]
+
+
+def _occurrences(tl: str, word: str) -> Iterator[tuple[int, int]]:
+    i = tl.find(word)
+    while i != -1:
+        yield i, i + len(word)
+        i = tl.find(word, i + len(word))
+
+
+def _arch_occurrences(tl: str, root: str) -> Iterator[tuple[int, int]]:
+    for start, _ in _occurrences(tl, root):
+        m = ARCH_TEXT_RE.match(tl, start)
+        if m:
+            yield m.span()
+
+
+def _take_line(text: str, start: int, end: int, starts: list[int], ends: list[int]) -> int:
+    """Add the piece around text[start:end] unless already covered; return the characters added."""
+    i = bisect_right(starts, start)
+    if i and ends[i - 1] > start:
+        return 0
+    lo = max(ends[i - 1] if i else 0, start - LINE_CONTEXT)
+    hi = min(starts[i] if i < len(starts) else len(text), end + LINE_CONTEXT)
+    a = text.rfind("\n", lo, start) + 1 or lo
+    b = text.find("\n", end, hi)
+    if b == -1:
+        b = hi
+    starts.insert(i, a)
+    ends.insert(i, b)
+    return b - a + 1
+
+
+def _fill_from_head(text: str, room: int, starts: list[int], ends: list[int]) -> None:
+    """Fill the gaps between pieces, head first, with up to room more characters.
+
+    A gap that only partly fits is cut at a line (or word) break; pieces left
+    touching are merged so the join adds no newline inside the original text.
+    """
+    pos = 0
+    i = 0
+    while room > 0 and pos < len(text):
+        gap_end = starts[i] if i < len(starts) else len(text)
+        partial = gap_end - pos > room
+        if partial:
+            cut = text.rfind("\n", pos + 1, pos + room) - pos
+            if cut <= 0:
+                cut = text.rfind(" ", pos + 1, pos + room) - pos
+            gap_end = pos + (cut if cut > 0 else room)
+        if gap_end > pos:
+            starts.insert(i, pos)
+            ends.insert(i, gap_end)
+            room -= gap_end - pos
+            i += 1
+        if partial or i >= len(starts):
+            break
+        pos = ends[i]
+        i += 1
+    # Merge touching pieces
+    j = 1
+    while j < len(starts):
+        if starts[j] <= ends[j - 1]:
+            ends[j - 1] = max(ends[j - 1], ends.pop(j))
+            del starts[j]
+        else:
+            j += 1
@@ -0,0 +1,29 @@
+"""Shared test fixtures."""
+
+import pytest
+
+import os_normalizer.batch as batch
+
+
+class CountingNormalizer:
+    """normalize_os wrapper recording the text of every call in calls."""
+
+    def __init__(self, real) -> None:
+        self.real = real
+        self.calls: list[str] = []
+
+    def __call__(self, text, data=None):
+        self.calls.append(text)
+        return self.real(text, data)
+
+
+@pytest.fixture
+def counting(monkeypatch) -> CountingNormalizer:
+    """Count the parses done by the batch helpers (and the caches built on them).
+
+    The returned wrapper replaces batch.normalize_os for the test and can also be
+    passed wherever a normalizer callable is accepted.
+    """
+    wrapper = CountingNormalizer(batch.normalize_os)
+    monkeypatch.setattr(batch, "normalize_os", wrapper)
+    return wrapper
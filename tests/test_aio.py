@@ -0,0 +1,95 @@
+"""Tests for the asyncio front end."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from os_normalizer import normalize_os
+from os_normalizer.aio import AsyncNormalizer, normalize_async, normalize_many_async
+
+DARWIN = "Darwin 24.0.0 arm64"
+CISCO = "Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9"
+
+
+def test_normalize_async_offloads_to_executor() -> None:
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return await normalize_async(DARWIN, executor=pool)
+
+    assert asyncio.run(main()) == normalize_os(DARWIN)
+
+
+def test_normalize_many_async_preserves_order() -> None:
+    results = asyncio.run(normalize_many_async([CISCO, DARWIN, CISCO]))
+    assert [r.product for r in results] == ["IOS XE", "macOS", "IOS XE"]
+
+
+def test_async_normalizer_coalesces_and_applies_backpressure(monkeypatch) -> None:
+    import os_normalizer.aio as aio
+
+    batch_sizes: list[int] = []
+    real = aio.normalize_many
+
+    def recording(records, errors="return"):
+        batch_sizes.append(len(records))
+        return real(records, errors)
+
+    monkeypatch.setattr(aio, "normalize_many", recording)
+
+    async def main():
+        async with AsyncNormalizer(max_batch=8, max_delay=0.05, max_queue=4) as normalizer:
+            texts = [DARWIN, CISCO] * 10
+            results = await asyncio.gather(*(normalizer.normalize(t) for t in texts))
+            with pytest.raises(TypeError):
+                await normalizer.normalize(None)
+            return texts, results
+
+    texts, results = asyncio.run(main())
+    assert results == [normalize_os(t) for t in texts]
+    # Requests were grouped, and no batch exceeded the configured bounds
+    assert len(batch_sizes) < len(texts)
+    assert max(batch_sizes) <= 8
+
+
+def test_async_normalizer_blocks_producers_while_executor_stalls(monkeypatch) -> None:
+    import os_normalizer.aio as aio
+
+    release = threading.Event()
+    batch_sizes: list[int] = []
+    real = aio.normalize_many
+
+    def stalled(records, errors="return"):
+        batch_sizes.append(len(records))
+        release.wait(5)
+        return real(records, errors)
+
+    monkeypatch.setattr(aio, "normalize_many", stalled)
+
+    async def main():
+        async with AsyncNormalizer(max_batch=2, max_delay=0.01, max_queue=2) as normalizer:
+            tasks = [asyncio.create_task(normalizer.normalize(DARWIN)) for _ in range(10)]
+            try:
+                await asyncio.sleep(0.2)
+                # One batch is stuck in the executor and the queue is full, so the
+                # remaining producers are still waiting in put()
+                assert batch_sizes == [2]
+                assert normalizer._queue.qsize() == 2
+                assert not any(t.done() for t in tasks)
+            finally:
+                release.set()
+            return await asyncio.gather(*tasks)
+
+    results = asyncio.run(main())
+    assert results == [normalize_os(DARWIN)] * 10
+    assert sum(batch_sizes) == 10
+    assert max(batch_sizes) <= 2
+
+
+def test_async_normalizer_requires_start() -> None:
+    async def main():
+        await AsyncNormalizer().normalize(DARWIN)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
@@ -0,0 +1,146 @@
+"""Tests for the batch normalization API."""
+
+import pytest
+
+from os_normalizer import NormalizeOptions, normalize_many, normalize_os, normalize_stream
+
+UBUNTU_UNAME = "Linux host 5.15.0-122-generic x86_64"
+UBUNTU_OSREL = {"os_release": 'NAME="Ubuntu"\nID=ubuntu\nVERSION_ID="22.04.4"\nVERSION_CODENAME=jammy'}
+
+
+def test_normalize_many_matches_single_calls_in_order() -> None:
+    records = [
+        "Windows NT 10.0 build 22631 Enterprise x64",
+        (UBUNTU_UNAME, UBUNTU_OSREL),
+        {"text": "Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T"},
+        "Darwin 24.0.0 arm64",
+    ]
+    results = normalize_many(records)
+    assert results == [
+        normalize_os("Windows NT 10.0 build 22631 Enterprise x64"),
+        normalize_os(UBUNTU_UNAME, UBUNTU_OSREL),
+        normalize_os("Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T"),
+        normalize_os("Darwin 24.0.0 arm64"),
+    ]
+    assert [r.os_key for r in results] == [
+        normalize_os("Windows NT 10.0 build 22631 Enterprise x64").os_key,
+        normalize_os(UBUNTU_UNAME, UBUNTU_OSREL).os_key,
+        "cpe:2.3:o:juniper:junos:20.4r3-s3:*:*:*:*:*:*:*",
+        "cpe:2.3:o:apple:macos:15.0:*:*:*:*:*:arm64:*",
+    ]
+
+
+def test_normalize_many_dedupes_and_isolates_copies(counting) -> None:
+    # Same os_release content with a different key order must dedupe too
+    reordered = {"os_release": {"VERSION_ID": "39", "ID": "fedora"}}
+    original = {"os_release": {"ID": "fedora", "VERSION_ID": "39"}}
+    results = normalize_many([(UBUNTU_UNAME, original), (UBUNTU_UNAME, reordered), (UBUNTU_UNAME, original)])
+
+    assert counting.calls == [UBUNTU_UNAME]
+    assert results[0] == results[1] == results[2]
+    assert results[0] is not results[1]
+
+    results[1].evidence["mutated"] = True
+    results[1].like_distros.append("rhel")
+    assert "mutated" not in results[0].evidence
+    assert results[2].like_distros == []
+
+
+def test_copies_do_not_share_nested_evidence() -> None:
+    results = normalize_many(["Darwin 24.0.0 arm64"] * 2, options=NormalizeOptions(budget_ms=0))
+    assert results[0].evidence["truncated"] == results[1].evidence["truncated"]
+    results[0].evidence["truncated"].append("mutated")
+    assert "mutated" not in results[1].evidence["truncated"]
+
+
+def test_dedup_keeps_key_types_apart(counting) -> None:
+    results = normalize_many([(UBUNTU_UNAME, {1: "x"}), (UBUNTU_UNAME, {"1": "x"}), (UBUNTU_UNAME, {"1": "x", 2: "y"})])
+    assert counting.calls == [UBUNTU_UNAME] * 3
+    assert results[0] == results[1] == results[2]
+
+
+def test_normalize_many_isolates_errors() -> None:
+    results = normalize_many(["FreeBSD 13.2-RELEASE", None, (123, None), "Darwin 24.0.0 arm64"])
+    assert results[0].product == "FreeBSD"
+    assert isinstance(results[1], Exception)
+    assert isinstance(results[2], Exception)
+    assert results[3].product == "macOS"
+
+
+@pytest.mark.parametrize("record", [{"data": UBUNTU_OSREL}, {"text": None}, (None, None), (None, UBUNTU_OSREL)])
+def test_records_without_text_are_errors(record) -> None:
+    results = normalize_many([record, "FreeBSD 13.2-RELEASE"])
+    assert isinstance(results[0], TypeError)
+    assert results[1].product == "FreeBSD"
+    with pytest.raises(TypeError):
+        normalize_many([record], errors="raise")
+
+
+def test_normalize_many_raise_mode() -> None:
+    with pytest.raises(AttributeError):
+        normalize_many([(123, None)], errors="raise")
+
+
+def test_normalize_many_parallel_matches_serial() -> None:
+    records = [
+        "Windows NT 10.0 build 22631 Enterprise x64",
+        (UBUNTU_UNAME, UBUNTU_OSREL),
+        "Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9",
+        "Huawei VRP V800R012C00SPC500 S5720-28X-SI-AC",
+        None,
+        "FreeBSD 13.2-RELEASE amd64",
+        "N/A",
+    ] * 5
+    serial = normalize_many(records)
+    parallel = normalize_many(records, workers=2, chunksize=2)
+
+    assert len(parallel) == len(records)
+    for got, want in zip(parallel, serial, strict=True):
+        if isinstance(want, Exception):
+            assert type(got) is type(want)
+        else:
+            assert got == want
+            assert got.os_key == want.os_key
+            assert type(got.family) is type(want.family)
+            assert type(got.precision) is type(want.precision)
+
+
+def test_normalize_stream_is_lazy_and_bounded(counting) -> None:
+    def source():
+        for text in ["Darwin 24.0.0 arm64", "FreeBSD 13.2-RELEASE", "Darwin 24.0.0 arm64", "Junos: 20.4R3-S3"]:
+            yield text
+
+    stream = normalize_stream(source(), window=1)
+    assert counting.calls == []
+
+    first = next(stream)
+    assert first.product == "macOS"
+    first.evidence["mutated"] = True  # must not leak into later duplicates
+
+    rest = list(stream)
+    # window=1 evicts Darwin once FreeBSD is seen, so it is parsed again
+    assert counting.calls == ["Darwin 24.0.0 arm64", "FreeBSD 13.2-RELEASE", "Darwin 24.0.0 arm64", "Junos: 20.4R3-S3"]
+    assert "mutated" not in rest[1].evidence
+    assert [r.product for r in rest] == ["FreeBSD", "macOS", "Junos"]
+
+
+def test_normalize_stream_keyed_dedupes_within_window(counting) -> None:
+    rows = [("a", UBUNTU_UNAME), ("b", (UBUNTU_UNAME, UBUNTU_OSREL)), ("c", UBUNTU_UNAME), ("d", None)]
+    out = list(normalize_stream(rows, keyed=True))
+
+    assert counting.calls == [UBUNTU_UNAME, UBUNTU_UNAME]
+    assert [k for k, _ in out] == ["a", "b", "c", "d"]
+    assert out[0][1] == out[2][1]
+    assert out[0][1] is not out[2][1]
+    assert out[1][1].product == "Ubuntu"
+    assert isinstance(out[3][1], Exception)
+
+
+def test_normalize_stream_keyed_isolates_malformed_items() -> None:
+    out = list(normalize_stream([("a", UBUNTU_UNAME), "not a pair", None, ("b", UBUNTU_UNAME)], keyed=True))
+    assert [k for k, _ in out] == ["a", None, None, "b"]
+    assert isinstance(out[1][1], ValueError)
+    assert isinstance(out[2][1], TypeError)
+    assert out[3][1] == out[0][1]
+    with pytest.raises(TypeError):
+        list(normalize_stream([None], keyed=True, errors="raise"))
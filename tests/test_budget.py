@@ -0,0 +1,107 @@
+"""Tests for the per-call time budget (NormalizeOptions.budget_ms)."""
+
+import pytest
+
+from os_normalizer import NormalizeOptions, normalize_many, normalize_os, normalize_stream
+
+CISCO = "Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9, c9300-universalk9.17.09.04a.SPA.bin"
+
+SAMPLES = [
+    CISCO,
+    "Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T",
+    "FortiGate-100F v7.2.7 build1600 (GA) FGT_7.2.7-build1600",
+    "Huawei VRP V800R012C00SPC500 S5720-28X-SI-AC",
+    "NETGEAR Firmware V1.0.9.88_10.2.88 R7000",
+    "Windows NT 10.0 build 22631 Enterprise x64",
+    "Darwin 24.6.0 arm64",
+    "Linux host 5.15.0-122-generic x86_64",
+]
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_generous_budget_changes_nothing(text: str) -> None:
+    full = normalize_os(text)
+    assert normalize_os(text, budget_ms=60_000) == full
+    assert "truncated" not in full.evidence
+
+
+def test_spent_budget_returns_partial_result() -> None:
+    full = normalize_os(CISCO)
+    p = normalize_os(CISCO, budget_ms=0)
+    # Mandatory stages still run
+    assert (p.family, p.vendor, p.product) == (full.family, full.vendor, full.product)
+    assert (p.version_major, p.version_minor, p.version_patch) == (17, 9, 4)
+    # Optional ones are skipped and listed
+    assert p.hw_model is None
+    assert p.edition is None
+    assert p.build_id is None
+    assert p.codename is None
+    assert p.arch is None
+    assert p.os_key is None
+    assert p.evidence["truncated"] == ["image", "model", "edition", "codename", "arch", "cpe"]
+    assert p.evidence["version_raw"] == "17.9.4a"
+
+
+@pytest.mark.parametrize(
+    ("text", "stage"),
+    [
+        (SAMPLES[1], "model"),
+        (SAMPLES[2], "model"),
+        (SAMPLES[3], "model"),
+        (SAMPLES[4], "model"),
+        (SAMPLES[5], "edition"),
+        ("macOS Sequoia", "codename"),
+    ],
+)
+def test_parser_stages_are_skipped(text: str, stage: str) -> None:
+    p = normalize_os(text, budget_ms=0)
+    assert stage in p.evidence["truncated"]
+    assert p.hw_model is None
+    assert p.edition is None
+
+
+def test_truncation_survives_lean_mode() -> None:
+    p = normalize_os(CISCO, options=NormalizeOptions(evidence=False, budget_ms=0))
+    assert p.evidence == {"truncated": ["image", "model", "edition", "codename", "arch", "cpe"]}
+    assert normalize_os(CISCO, options=NormalizeOptions(evidence=False, budget_ms=60_000)).evidence == {}
+
+
+def test_routing_projection_and_lazy_key() -> None:
+    p = normalize_os("Linux x86_64", fields=["family", "arch"], budget_ms=0)
+    assert p.arch is None
+    assert p.evidence["truncated"] == ["arch"]
+    lazy = normalize_os(CISCO, options=NormalizeOptions(lazy=True, budget_ms=0))
+    # A lazy key costs nothing up front, so it is kept
+    assert "cpe" not in lazy.evidence["truncated"]
+    assert lazy.os_key is not None
+
+
+def test_batch_apis_apply_budget_per_record() -> None:
+    opts = NormalizeOptions(budget_ms=0)
+    for results in (normalize_many(SAMPLES, options=opts), list(normalize_stream(SAMPLES, options=opts))):
+        assert all("truncated" in r.evidence for r in results)
+        assert [r.family for r in results] == [normalize_os(t).family for t in SAMPLES]
+
+
+def test_budget_validation_and_deadline() -> None:
+    with pytest.raises(ValueError):
+        NormalizeOptions(budget_ms=-1)
+    opts = NormalizeOptions(budget_ms=5)
+    assert opts.deadline is None
+    timed = opts.start_budget()
+    assert timed.deadline is not None
+    assert timed == opts
+    unbudgeted = NormalizeOptions()
+    assert unbudgeted.start_budget() is unbudgeted
+
+
+def test_truncation_survives_projection() -> None:
+    p = normalize_os(CISCO, fields=["product", "hw_model"], budget_ms=0)
+    assert p.product == "IOS XE"
+    assert p.hw_model is None
+    assert p.evidence == {"truncated": ["model"]}
+    # No optional stage is needed for these fields, so nothing is skipped
+    kept = normalize_os(CISCO, fields=["product", "evidence"], budget_ms=0)
+    assert kept.evidence["version_raw"] == "17.9.4a"
+    assert "truncated" not in kept.evidence
+    assert normalize_os(CISCO, fields=["product", "hw_model"], budget_ms=60_000).evidence == {}
@@ -0,0 +1,111 @@
+"""Tests for the normalize_os memoization layer."""
+
+import pytest
+
+from os_normalizer import normalize_os
+from os_normalizer.cache import BloomFilter, CacheInfo, NegativeCache, NormalizeCache
+
+UNAME = "Linux host 5.15.0-122-generic x86_64"
+OSREL_TEXT = 'NAME="Ubuntu"\nID=ubuntu\nID_LIKE=debian\nVERSION_ID="22.04.4"\nVERSION_CODENAME=jammy'
+
+
+def test_cache_hits_and_matches_uncached_result() -> None:
+    cache = NormalizeCache(maxsize=8)
+    first = cache(UNAME, {"os_release": OSREL_TEXT})
+    second = cache.normalize("  " + UNAME + "\n", {"os_release": OSREL_TEXT})
+
+    assert first == second == normalize_os(UNAME, {"os_release": OSREL_TEXT})
+    assert second.os_key == normalize_os(UNAME, {"os_release": OSREL_TEXT}).os_key
+    assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=8, currsize=1)
+
+
+def test_cache_keys_on_os_release_content() -> None:
+    cache = NormalizeCache()
+    ubuntu = cache(UNAME, {"os_release": OSREL_TEXT})
+    fedora = cache(UNAME, {"os_release": {"ID": "fedora", "VERSION_ID": "39"}})
+    fedora_again = cache(UNAME, {"os_release": {"VERSION_ID": "39", "ID": "fedora"}})
+
+    assert ubuntu.product == "Ubuntu"
+    assert fedora.distro == fedora_again.distro == "fedora"
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().currsize == 2
+
+
+def test_cache_returns_isolated_copies() -> None:
+    cache = NormalizeCache()
+    p = cache(UNAME, {"os_release": OSREL_TEXT})
+    p.evidence["mutated"] = True
+    p.like_distros.append("corrupt")
+    p.product = "Corrupt"
+
+    q = cache(UNAME, {"os_release": OSREL_TEXT})
+    assert q.product == "Ubuntu"
+    assert q.like_distros == ["debian"]
+    assert "mutated" not in q.evidence
+
+
+def test_cache_evicts_least_recently_used_and_clears() -> None:
+    cache = NormalizeCache(maxsize=2)
+    cache("Darwin 24.0.0 arm64")
+    cache("FreeBSD 13.2-RELEASE")
+    cache("Darwin 24.0.0 arm64")  # refresh Darwin
+    cache("Junos: 20.4R3-S3")  # evicts FreeBSD
+    cache("Darwin 24.0.0 arm64")
+    cache("FreeBSD 13.2-RELEASE")
+
+    assert cache.cache_info() == CacheInfo(hits=2, misses=4, maxsize=2, currsize=2)
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_cache_rejects_negative_size() -> None:
+    with pytest.raises(ValueError):
+        NormalizeCache(maxsize=-1)
+
+
+def test_negative_cache_skips_known_junk(counting) -> None:
+    neg = NegativeCache(capacity=100, error_rate=0.01, normalizer=counting)
+    junk = ["", "N/A", "???", "N/A", "", "N/A"]
+    results = [neg(t) for t in junk]
+
+    assert counting.calls == ["", "N/A", "???"]
+    assert all(r == normalize_os("") for r in results)
+    assert all(r.os_key == normalize_os("").os_key for r in results)
+    results[-1].evidence["mutated"] = True
+    assert neg("N/A").evidence == {}
+
+    info = neg.cache_info()
+    assert (info.lookups, info.skipped, info.parsed, info.added) == (7, 4, 3, 3)
+    assert info.skip_rate == pytest.approx(4 / 7)
+
+
+def test_negative_cache_never_stores_partial_results() -> None:
+    neg = NegativeCache(capacity=100)
+    # No family, but an architecture was extracted: not the blank UNKNOWN result
+    assert neg("mystery box x86_64").arch == "x86_64"
+    assert neg("mystery box x86_64").arch == "x86_64"
+    assert neg("Darwin 24.0.0 arm64").product == "macOS"
+    assert neg.cache_info().added == 0
+
+
+def test_negative_cache_is_bounded_and_fronts_positive_cache() -> None:
+    positive = NormalizeCache(maxsize=4)
+    neg = NegativeCache(capacity=2, error_rate=0.01, normalizer=positive)
+    for t in ["a-junk", "b-junk", "c-junk", "FreeBSD 13.2-RELEASE", "FreeBSD 13.2-RELEASE"]:
+        neg(t)
+
+    info = neg.cache_info()
+    assert info.resets == 1
+    assert info.currsize == 1
+    assert positive.cache_info().hits == 1
+
+
+def test_bloom_filter_false_positive_rate() -> None:
+    import hashlib
+
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    for i in range(2000):
+        bloom.add(hashlib.blake2b(f"in-{i}".encode(), digest_size=16).digest())
+    probes = [hashlib.blake2b(f"out-{i}".encode(), digest_size=16).digest() for i in range(5000)]
+    fp = sum(p in bloom for p in probes) / len(probes)
+    assert fp < 0.03
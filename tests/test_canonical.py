@@ -0,0 +1,115 @@
+"""Tests for cache-key canonicalization of volatile banner tokens."""
+
+import pytest
+
+from os_normalizer import normalize_os
+from os_normalizer.cache import NormalizeCache
+from os_normalizer.canonical import DATE_PLACEHOLDER, NODE_PLACEHOLDER, canonicalize_text
+
+UBUNTU_OSREL = {"os_release": 'NAME="Ubuntu"\nID=ubuntu\nVERSION_ID="22.04.4"\nVERSION_CODENAME=jammy'}
+
+BANNER_TEMPLATES = [
+    "Linux {node} 5.15.0-122-generic #132-Ubuntu SMP {date} x86_64 x86_64 x86_64 GNU/Linux",
+    "Linux {node} 6.1.0-18-amd64 #1 SMP PREEMPT_DYNAMIC Debian 6.1.76-1 ({date}) aarch64",
+    "Darwin {node} 24.6.0 Darwin Kernel Version 24.6.0: {date}; root:xnu-11417.140.69~1/RELEASE_ARM64_T6041 arm64",
+    "Darwin {node} 23.1.0 Darwin Kernel Version 23.1.0: {date}; root:xnu-10002.41.9~6/RELEASE_X86_64 x86_64",
+    "SunOS {node} 5.11 11.4.42.111.0 i86pc i386 i86pc",
+    "VMkernel {node} 7.0.3 #1 SMP Release build-20036589 Mar 22 2022 x86_64 x86_64 x86_64 ESXi",
+]
+
+NODES = [
+    "host",
+    "Mac-Studio.local",
+    "web01",
+    "web-01.prod.example.com",
+    "db_primary",
+    "ip-10-0-3-17",
+    "10.0.3.17",
+    "esxi01",
+    "cisco-lab",
+    "arm-builder",
+    "mbp-client",
+    "catalina",
+    "kernel-build",
+    "Johns-MacBook-Pro-2.local",
+    "windows-jump",
+    # Longer than any fixed-width gap between "Linux"/"Darwin" and the release
+    "ci-runner-" + "abcdefgh" * 17 + ".build.example.com",
+]
+
+DATES = ["Mon Jul 14 11:30:40 PDT 2025", "Thu Aug 29 13:45:52 UTC 2024", "Sun Jan  5 01:02:03 2025"]
+
+
+def _cases():
+    for template in BANNER_TEMPLATES:
+        for node in NODES:
+            for date in DATES:
+                yield template.format(node=node, date=date)
+
+
+@pytest.mark.parametrize("raw", list(_cases()))
+def test_canonical_text_parses_identically(raw: str) -> None:
+    canonical = canonicalize_text(raw)
+    assert normalize_os(canonical) == normalize_os(raw)
+    assert normalize_os(canonical).os_key == normalize_os(raw).os_key
+    assert normalize_os(canonical, UBUNTU_OSREL) == normalize_os(raw, UBUNTU_OSREL)
+
+
+def test_inert_tokens_are_masked() -> None:
+    raw = (
+        "Darwin Mac-Studio.local 24.6.0 Darwin Kernel Version 24.6.0: Mon Jul 14 11:30:40 PDT 2025; "
+        "root:xnu-11417.140.69~1/RELEASE_ARM64_T6041 arm64"
+    )
+    assert canonicalize_text(raw) == (
+        f"Darwin {NODE_PLACEHOLDER} 24.6.0 Darwin Kernel Version 24.6.0: {DATE_PLACEHOLDER}; "
+        "root:xnu-11417.140.69~1/RELEASE_ARM64_T6041 arm64"
+    )
+    assert canonicalize_text("  Linux web-01.prod 5.15.0-122-generic x86_64 ") == (
+        f"Linux {NODE_PLACEHOLDER} 5.15.0-122-generic x86_64"
+    )
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "Linux esxi01 5.15.0-122-generic x86_64",  # " esxi" switches detection to ESXi
+        "Linux arm-builder 5.15.0-122-generic x86_64",  # arch fallback takes the first token
+        "Linux 10.0.3.17 5.15.0-122-generic x86_64",  # looks like a kernel version
+        "Darwin web01 24.6.0 arm64",  # DARWIN_RE grabs the first digit run
+        "Darwin mbp-client 24.6.0 arm64",  # "nt " is a Windows signal
+    ],
+)
+def test_signal_bearing_nodes_are_kept(raw: str) -> None:
+    assert canonicalize_text(raw) == raw
+
+
+def test_unrecognised_text_is_only_stripped() -> None:
+    assert canonicalize_text("  Windows NT 10.0 build 22631 Mon Jul 14 11:30:40 PDT 2025 ") == (
+        "Windows NT 10.0 build 22631 Mon Jul 14 11:30:40 PDT 2025"
+    )
+
+
+def test_canonicalizing_cache_shares_entries() -> None:
+    cache = NormalizeCache(canonicalize=True)
+    raws = [
+        f"Linux {node} 5.15.0-122-generic #132-Ubuntu SMP {date} x86_64"
+        for node in ("web01", "web02", "db-primary")
+        for date in DATES
+    ]
+    results = [cache(raw) for raw in raws]
+
+    assert results == [normalize_os(raw) for raw in raws]
+    info = cache.cache_info()
+    assert (info.misses, info.currsize) == (1, 1)
+
+
+def test_canonicalizing_cache_shares_windowed_entries() -> None:
+    # Oversized inputs that differ only in the node name get one identical result
+    log = "".join(f"request {i} handled status=200\n" for i in range(3000))
+    cache = NormalizeCache(canonicalize=True)
+    raws = [f"Linux {node} 5.15.0-122-generic #132-Ubuntu SMP x86_64\n{log}" for node in ("web01", "db-primary")]
+    results = [cache(raw) for raw in raws]
+
+    assert results == [normalize_os(raw) for raw in raws]
+    assert results[1].evidence["windowed"] is True
+    assert cache.cache_info().misses == 1
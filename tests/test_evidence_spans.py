@@ -0,0 +1,61 @@
+"""Tests for offset-based (span) evidence."""
+
+import pickle
+
+import pytest
+
+from os_normalizer import NormalizeOptions, merge_os, normalize_os
+from os_normalizer.helpers import copy_osdata
+from os_normalizer.models import SpanEvidence
+
+SPANS = NormalizeOptions(spans=True)
+
+SAMPLES = [
+    "Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9",
+    "Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T",
+    "Windows NT 10.0 build 22631 Enterprise x64",
+    "Darwin 24.6.0 arm64",
+]
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_span_evidence_reads_like_copied_evidence(text: str) -> None:
+    plain = normalize_os(text)
+    spanned = normalize_os(text, options=SPANS)
+    assert type(spanned.evidence) is SpanEvidence
+    assert dict(spanned.evidence) == plain.evidence
+    assert spanned == plain
+    assert spanned.fingerprint(exclude=()) == plain.fingerprint(exclude=())
+
+
+def test_version_raw_is_stored_as_offsets() -> None:
+    text = SAMPLES[1]
+    ev = normalize_os(f"  {text}\n", options=SPANS).evidence
+    start, end = ev.spans()["version_raw"]
+    assert ev.source[start:end] == "20.4R3-S3"
+    assert ev["version_raw"] == "20.4R3-S3"
+    # Non-substring evidence (the family hit) is kept as a value
+    assert "hit" not in ev.spans()
+
+
+def test_span_evidence_mapping_behaviour() -> None:
+    ev = SpanEvidence("hello world")
+    ev.set_span("word", 6, 11)
+    ev["n"] = 1
+    assert list(ev) == ["word", "n"]
+    assert ev == {"word": "world", "n": 1}
+    assert ev.get("missing") is None
+    del ev["n"]
+    assert len(ev) == 1
+    assert repr(ev) == "{'word': 'world'}"
+
+
+def test_copies_and_serializers_materialize() -> None:
+    p = normalize_os(SAMPLES[0], options=SPANS)
+    for other in (copy_osdata(p), pickle.loads(pickle.dumps(p)), type(p).from_bytes(p.to_bytes())):
+        assert type(other.evidence) is dict
+        assert other.evidence == p.evidence
+    assert type(p.to_dict()["evidence"]) is dict
+    assert dict(p.freeze().evidence) == dict(p.evidence)
+    merged = merge_os(p, normalize_os("Cisco IOS XE x86_64"))
+    assert merged.evidence["version_raw"] == "17.9.4a"
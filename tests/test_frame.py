@@ -0,0 +1,118 @@
+"""Tests for the columnar OSDataFrame."""
+
+from array import array
+from dataclasses import replace
+
+import pytest
+
+from os_normalizer import OSData, normalize_many, normalize_os
+from os_normalizer.constants import OSFamily, PrecisionLevel
+from os_normalizer.frame import INT_MAX, NULL, OSDataFrame
+
+RECORDS = [
+    "Linux host 5.15.0-122-generic x86_64",
+    "Darwin 24.6.0 arm64",
+    ("Linux a 5.4.0-1 x86_64", {"os_release": "ID=ubuntu\nVERSION_ID=20.04"}),
+    ("bad record", ["not", "a", "dict"]),
+    "Windows NT 10.0 build 22631 Enterprise x64",
+    ("Linux b 5.15.0-1 x86_64", {"os_release": "ID=ubuntu\nVERSION_ID=22.04"}),
+]
+
+
+@pytest.fixture
+def results():
+    return normalize_many(RECORDS)
+
+
+@pytest.fixture
+def frame(results):
+    return OSDataFrame.from_results(results)
+
+
+def test_rows_round_trip_without_containers(frame, results) -> None:
+    assert len(frame) == len(RECORDS)
+    for got, want in zip(frame, results, strict=True):
+        if isinstance(want, Exception):
+            assert got is None
+            continue
+        assert got == replace(want, evidence={}, like_distros=[])
+        assert got.os_key == want.os_key
+        assert isinstance(got.precision, PrecisionLevel)
+
+
+def test_dictionary_encoding_shares_codes(frame) -> None:
+    arch = frame.buffers()["arch"]
+    assert arch.format == "i"
+    assert frame.dictionary("arch") == ["x86_64", "arm64"]
+    assert arch.tolist() == [0, 1, 0, NULL, 0, 0]
+    assert frame.column("arch") == ["x86_64", "arm64", "x86_64", None, "x86_64", "x86_64"]
+    with pytest.raises(KeyError):
+        frame.dictionary("version_major")
+
+
+def test_filter(frame) -> None:
+    ubuntu = frame.filter(family="linux", distro="ubuntu")
+    assert ubuntu.column("version_major") == [20, 22]
+    assert len(frame.filter(version_major={20, 22}, distro="ubuntu")) == 2
+    assert len(frame.filter(vendor="never seen")) == 0
+    assert len(frame.filter(family=None)) == 1
+    # Derived frames share dictionaries with their source
+    assert ubuntu.dictionary("distro") is frame.dictionary("distro")
+
+
+def test_group_count(frame) -> None:
+    assert frame.group_count("family") == {OSFamily.LINUX: 3, OSFamily.MACOS: 1, None: 1, OSFamily.WINDOWS: 1}
+    by_distro = frame.group_count("family", "distro")
+    assert by_distro[(OSFamily.LINUX, "ubuntu")] == 2
+    with pytest.raises(ValueError):
+        frame.group_count()
+
+
+def test_sort(frame) -> None:
+    majors = frame.sort("version_major").column("version_major")
+    assert majors == [None, None, 10, 15, 20, 22]
+    ordered = frame.sort("family", "version_major")
+    assert ordered.column("family")[0] is None
+    products = [p for p in frame.sort("product").column("product") if p is not None]
+    assert products == sorted(products)
+    assert frame.sort("product", reverse=True).column("product")[-1] is None
+
+
+def test_buffers_are_zero_copy(frame) -> None:
+    views = frame.buffers()
+    assert set(views) >= {"family", "precision", "version_major", "vendor", "os_key", "confidence"}
+    assert views["version_major"].format == "q"
+    assert views["family"].itemsize == 1
+    assert views["confidence"].format == "d"
+    assert isinstance(views["version_major"].obj, array)
+    assert views["version_major"].obj is frame.buffers()["version_major"].obj
+
+
+def test_huge_version_numbers_saturate() -> None:
+    results = [normalize_os("macOS 99999999999.1"), normalize_os("macOS 999999999999999999999999.1")]
+    frame = OSDataFrame.from_results(results)
+    assert frame.column("version_major") == [99999999999, INT_MAX]
+    assert frame.column("version_minor") == [1, 1]
+    assert {len(view) for view in frame.buffers().values()} == {2}
+
+
+def test_failed_append_leaves_columns_aligned() -> None:
+    frame = OSDataFrame.from_results([normalize_os("FreeBSD 13.2-RELEASE")])
+    with pytest.raises(ValueError):
+        frame.append(OSData(family="not-a-family", version_major=1))
+    assert {len(view) for view in frame.buffers().values()} == {1}
+
+
+def test_version_key_column_and_between(frame, results) -> None:
+    keys = frame.column("version_key")
+    assert keys == [p.version_key() if not isinstance(p, Exception) else 0 for p in results]
+    assert frame.buffers()["version_key"].format == "Q"
+
+    ubuntu = frame.filter(distro="ubuntu")
+    low = ubuntu.row(1).version_key()
+    assert ubuntu.between("version_key", low=low).column("version_major") == [22]
+    assert frame.between("version_major", 15, 20).column("version_major") == [15, 20]
+    # Failed rows and rows without a version never match
+    assert len(frame.between("version_key")) == 4
+    with pytest.raises(KeyError):
+        frame.between("vendor", "a", "z")
@@ -0,0 +1,98 @@
+"""Tests for frozen results and result hash-consing."""
+
+import dataclasses
+import sys
+
+import pytest
+
+from os_normalizer import FrozenOSData, OSData, normalize_os
+from os_normalizer.intern import ResultInterner
+
+UNAME = "Linux host 5.15.0-122-generic x86_64"
+OSREL = {"os_release": 'NAME="Ubuntu"\nID=ubuntu\nID_LIKE=debian\nVERSION_ID="22.04.4"\nVERSION_CODENAME=jammy'}
+
+
+def test_freeze_and_thaw_round_trip() -> None:
+    p = normalize_os(UNAME, OSREL)
+    frozen = p.freeze()
+
+    assert isinstance(frozen, FrozenOSData)
+    assert frozen.like_distros == ("debian",)
+    assert frozen.thaw() == p
+    assert frozen.thaw().os_key == p.os_key
+    assert str(frozen) == str(p)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen.product = "Other"
+    with pytest.raises(TypeError):
+        frozen.evidence["hit"] = "windows"
+
+
+def test_frozen_evidence_is_deeply_immutable() -> None:
+    p = normalize_os("Junos: 20.4R3-S3")
+    p.evidence["conflicts"] = {"version_build": ["a", "b"]}
+    frozen = p.freeze()
+    with pytest.raises(TypeError):
+        frozen.evidence["conflicts"]["version_build"] = "x"
+    assert frozen.evidence["conflicts"]["version_build"] == ("a", "b")
+    assert frozen.thaw().evidence["conflicts"] == {"version_build": ["a", "b"]}
+
+
+def test_interner_shares_identical_results() -> None:
+    interner = ResultInterner()
+    a = interner.normalize(UNAME, OSREL)
+    b = interner.intern(normalize_os("Linux other 5.15.0-122-generic x86_64", OSREL))
+    c = interner.normalize("Darwin 24.0.0 arm64")
+
+    assert a is b
+    assert a is not c
+    assert len(interner) == 2
+    assert a.thaw() == normalize_os(UNAME, OSREL)
+
+
+def test_interner_interns_string_fields() -> None:
+    interner = ResultInterner()
+    vendor = "".join(["Cano", "nical"])
+    p = normalize_os(UNAME, OSREL)
+    p.vendor = vendor
+    shared = interner(p)
+    assert shared.vendor is sys.intern("Canonical")
+    assert shared.os_key is sys.intern(p.os_key)
+
+    interner.clear()
+    assert len(interner) == 0
+
+
+def test_frozen_results_are_hashable_for_dedup() -> None:
+    a = normalize_os(UNAME, OSREL).freeze()
+    b = normalize_os(UNAME, OSREL).freeze()
+    c = normalize_os("Darwin 24.0.0 arm64").freeze()
+    assert a == b
+    assert hash(a) == hash(b)
+    assert {a, b, c} == {a, c}
+    assert {a: "row-1"}[b] == "row-1"
+
+
+def test_fingerprint_is_stable_and_ignores_scoring_metadata() -> None:
+    p = normalize_os(UNAME, OSREL)
+    q = normalize_os(UNAME, OSREL)
+    q.confidence = 0.1
+    q.evidence["extra"] = "ignored"
+
+    assert p.fingerprint() == q.fingerprint() == p.freeze().fingerprint()
+    assert p.fingerprint() < 2**64
+    assert p.fingerprint(bits=128) < 2**128
+    assert p.fingerprint(bits=128) != p.fingerprint()
+    assert p.fingerprint(exclude=()) != q.fingerprint(exclude=())
+
+    q.version_minor = 10
+    assert p.fingerprint() != q.fingerprint()
+
+    # Known value: the fingerprint must not change between runs or processes
+    fixed = OSData(family="linux", vendor="Canonical", product="Ubuntu", version_major=22, version_minor=4)
+    assert fixed.fingerprint() == 0x5C79E85E791D431C
+
+
+def test_fingerprint_rejects_unsupported_width() -> None:
+    with pytest.raises(ValueError):
+        normalize_os(UNAME).fingerprint(bits=32)
@@ -0,0 +1,98 @@
+"""Tests for lazily derived os_key values."""
+
+import copy
+import pickle
+
+import pytest
+
+from os_normalizer import merge_os, normalize_many, normalize_os, update_os
+from os_normalizer.cpe import build_cpe23
+from os_normalizer.helpers import copy_osdata
+from os_normalizer.models import LazyKey, raw_os_key
+
+SAMPLES = [
+    "Windows NT 10.0 build 22631 Enterprise x64",
+    "Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9",
+    "Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T",
+    "Darwin 24.6.0 arm64",
+    "garbage",
+]
+
+
+class CountingBuilder:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, p):
+        self.calls += 1
+        return build_cpe23(p)
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_lazy_key_matches_eager(text: str) -> None:
+    lazy = normalize_os(text, options="lazy")
+    assert type(raw_os_key(lazy)) is LazyKey
+    assert lazy.os_key == normalize_os(text).os_key
+
+
+def test_key_is_built_once_and_cached() -> None:
+    p = normalize_os("Darwin 24.6.0 arm64", options="lazy")
+    builder = CountingBuilder()
+    p.os_key = LazyKey(builder)
+    assert builder.calls == 0
+    first = p.os_key
+    assert p.os_key == first
+    assert builder.calls == 1
+
+
+def test_mutating_an_input_field_invalidates() -> None:
+    p = normalize_os("Darwin 24.6.0 arm64", options="lazy")
+    before = p.os_key
+    p.version_major = 14
+    assert p.os_key != before
+    assert p.os_key == build_cpe23(p)
+    # Non-input fields do not trigger a rebuild
+    p.confidence = 0.1
+    builder = CountingBuilder()
+    p.os_key = LazyKey(builder)
+    _ = p.os_key
+    p.confidence = 0.2
+    _ = p.os_key
+    assert builder.calls == 1
+
+
+def test_update_os_inplace_refreshes_key() -> None:
+    p = normalize_os("Darwin 24.6.0", options="lazy")
+    stale = p.os_key
+    update_os(p, "Darwin 24.6.0 arm64", inplace=True)
+    assert type(raw_os_key(p)) is LazyKey
+    assert p.os_key != stale
+    assert p.os_key == normalize_os("Darwin 24.6.0 arm64").os_key
+
+
+def test_merge_stays_lazy_and_eager_stays_eager() -> None:
+    a = normalize_os("Darwin 24.6.0", options="lazy")
+    b = normalize_os("macOS arm64")
+    merged = merge_os(a, b)
+    assert type(raw_os_key(merged)) is LazyKey
+    assert merged.os_key == merge_os(normalize_os("Darwin 24.6.0"), b).os_key
+    assert type(raw_os_key(merge_os(normalize_os("Darwin 24.6.0"), b))) is str
+
+
+def test_copies_and_serialization_materialize_independently() -> None:
+    p = normalize_os("Darwin 24.6.0 arm64", options="lazy")
+    c = copy_osdata(p)
+    assert raw_os_key(c) is not raw_os_key(p)
+    c.arch = None
+    assert c.os_key != p.os_key
+    q = pickle.loads(pickle.dumps(p))
+    assert type(raw_os_key(q)) is str
+    assert q.os_key == p.os_key
+    assert p.to_dict()["os_key"] == p.os_key
+    assert copy.deepcopy(p).os_key == p.os_key
+
+
+def test_batch_lazy_mode() -> None:
+    results = normalize_many(SAMPLES * 2, options="lazy")
+    assert all(type(raw_os_key(p)) is LazyKey for p in results)
+    assert [p.os_key for p in results] == [normalize_os(t).os_key for t in SAMPLES * 2]
@@ -0,0 +1,127 @@
+"""Tests for NormalizeOptions and lean mode."""
+
+import pytest
+
+from os_normalizer import NormalizeOptions, OSData, normalize_many, normalize_os, normalize_stream
+from os_normalizer.models import raw_container
+from os_normalizer.options import FIELD_NAMES, FULL, LEAN
+
+SAMPLES = [
+    ("Windows NT 10.0 build 22631 Enterprise x64", None),
+    ("Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9", None),
+    ("Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T", None),
+    (
+        "Linux host 5.15.0-122-generic x86_64",
+        {"os_release": 'ID=ubuntu\nVERSION_ID=22.04\nPRETTY_NAME="Ubuntu 22.04 LTS"'},
+    ),
+    ("Darwin 24.6.0 arm64", None),
+    ("FreeBSD 13.2-RELEASE amd64", None),
+]
+
+IDENTITY = ("family", "vendor", "product", "version_major", "version_minor", "version_patch", "version_build", "arch")
+
+
+def test_resolve() -> None:
+    assert NormalizeOptions.resolve(None) is FULL
+    assert NormalizeOptions.resolve("lean") is LEAN
+    custom = NormalizeOptions(cpe=False)
+    assert NormalizeOptions.resolve(custom) is custom
+    with pytest.raises(ValueError):
+        NormalizeOptions.resolve("fast")
+
+
+@pytest.mark.parametrize(("text", "data"), SAMPLES)
+def test_lean_keeps_identity_fields(text, data) -> None:
+    full = normalize_os(text, data)
+    lean = normalize_os(text, data, options="lean")
+    for name in IDENTITY:
+        assert getattr(lean, name) == getattr(full, name)
+    assert lean.precision == full.precision
+    assert lean.confidence == full.confidence
+    assert lean.os_key is None
+    assert lean.pretty_name is None
+    # Evidence is never allocated
+    assert raw_container(lean, "evidence") is None
+
+
+def test_individual_switches() -> None:
+    text, data = SAMPLES[3]
+    full = normalize_os(text, data)
+    assert full.pretty_name and full.evidence and full.os_key
+
+    no_cpe = normalize_os(text, data, NormalizeOptions(cpe=False))
+    assert no_cpe.os_key is None
+    assert no_cpe.pretty_name == full.pretty_name
+    assert no_cpe.evidence == full.evidence
+
+    no_display = normalize_os(text, data, NormalizeOptions(display=False))
+    assert no_display.pretty_name is None
+    assert no_display.os_key == full.os_key
+
+
+def test_batch_apis_pass_options_through() -> None:
+    lean = normalize_many(SAMPLES * 2, options="lean")
+    assert all(p.os_key is None for p in lean)
+    assert [p.product for p in lean[: len(SAMPLES)]] == [normalize_os(t, d).product for t, d in SAMPLES]
+    assert all(p.os_key is None for p in normalize_stream(SAMPLES, options=LEAN))
+    with pytest.raises(ValueError):
+        normalize_many(SAMPLES, options="nope")
+
+
+PROJECTION_SAMPLES = [
+    *SAMPLES,
+    (
+        "Cisco IOS Software, C2960 Software (C2960-LANBASEK9-M), Version 15.2(7)E4, c2960-lanbasek9-mz.152-7.E4.bin",
+        None,
+    ),
+    ("Cisco Nexus Operating System (NX-OS) Software nxos.9.3.8.bin N9K-C93180YC-EX", None),
+    ("macOS Sonoma", None),
+    ("Windows Server 2019 Datacenter build 17763 x86_64", None),
+    ("", None),
+]
+ALL_FIELDS = sorted(FIELD_NAMES)
+
+
+@pytest.mark.parametrize(("text", "data"), PROJECTION_SAMPLES)
+@pytest.mark.parametrize("name", ALL_FIELDS)
+def test_single_field_projection_matches_full_parse(text, data, name) -> None:
+    full = normalize_os(text, data)
+    projected = normalize_os(text, data, fields=[name])
+    assert getattr(projected, name) == getattr(full, name)
+    blank = OSData()
+    for other in ALL_FIELDS:
+        if other != name:
+            assert getattr(projected, other) == getattr(blank, other), other
+
+
+@pytest.mark.parametrize(("text", "data"), PROJECTION_SAMPLES)
+def test_routing_projection(text, data) -> None:
+    full = normalize_os(text, data)
+    routed = normalize_os(text, data, fields=("family", "arch"))
+    assert (routed.family, routed.arch) == (full.family, full.arch)
+    assert routed.product is None
+    assert routed.os_key is None
+
+
+def test_projection_skips_parsers(monkeypatch) -> None:
+    import os_normalizer.os_normalizer as orchestrator
+
+    def boom(*args, **kwargs):
+        raise AssertionError("parser should not run")
+
+    monkeypatch.setattr(orchestrator, "parse_windows", boom)
+    p = normalize_os("Windows NT 10.0 build 22631 Enterprise x64", fields={"family"})
+    assert p.family == "windows"
+
+
+def test_projection_validation_and_combination() -> None:
+    with pytest.raises(ValueError):
+        normalize_os("Darwin 24.6.0 arm64", fields=["famliy"])
+    opts = LEAN.project(["product", "version_major"])
+    assert opts.fields == {"product", "version_major"}
+    assert opts.project(["product", "version_major"]) == opts
+    assert not opts.evidence
+    p = normalize_os("Darwin 24.6.0 arm64", options=opts)
+    assert (p.product, p.version_major, p.family) == ("macOS", 15, None)
+    # confidence is derived from precision, so precision is parsed but not returned
+    assert NormalizeOptions(fields={"confidence"}).wants("precision")
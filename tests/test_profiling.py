@@ -0,0 +1,191 @@
+"""Tests for per-stage timing of normalize_os."""
+
+import random
+import re
+import threading
+
+import pytest
+
+from os_normalizer import helpers, normalize_many, normalize_os, profiling
+from os_normalizer.parsers import network
+from os_normalizer.parsers.network import juniper
+from os_normalizer.profiling import CountingPattern, PatternProfiler, SlowInputSampler, StageStats, StageTimer
+
+SAMPLES = [
+    "Windows NT 10.0 build 22631 Enterprise x64",
+    "Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9",
+    "Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T",
+    "Darwin 24.6.0 arm64",
+    "Linux host 5.15.0-122-generic x86_64",
+    "Android 14",
+]
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def observe(self, text, data, stages, total) -> None:
+        self.calls.append((text, dict(stages), total))
+
+
+def test_disabled_by_default() -> None:
+    assert profiling.OBSERVERS == ()
+
+
+def test_stage_timer_counts_stages() -> None:
+    with StageTimer() as timer:
+        for text in SAMPLES:
+            normalize_os(text)
+    assert profiling.OBSERVERS == ()
+    snap = timer.snapshot()
+    assert snap["total"].calls == len(SAMPLES)
+    assert snap["detect"].calls == len(SAMPLES)
+    assert snap["cpe"].calls == len(SAMPLES)
+    assert snap["parse.network"].calls == 2
+    assert snap["parse.windows"].calls == 1
+    assert snap["parse.mobile"].calls == 1
+    assert all(isinstance(s, StageStats) and s.seconds >= 0 for s in snap.values())
+    # Stages never exceed the whole-call total, and the snapshot is sorted by cost
+    assert sum(s.seconds for name, s in snap.items() if name != "total") <= snap["total"].seconds
+    assert list(snap)[0] == "total"
+    assert snap["total"].mean == pytest.approx(snap["total"].seconds / len(SAMPLES))
+
+
+def test_skipped_stages_are_not_reported() -> None:
+    with StageTimer() as timer:
+        normalize_os("Darwin 24.6.0 arm64", options="lean")
+        normalize_os("Linux x86_64", fields=["family", "arch"])
+        normalize_os("no idea what this is", options="lean")
+    snap = timer.snapshot()
+    assert "cpe" not in snap
+    assert snap["total"].calls == 3
+    assert snap["parse.macos"].calls == 1
+    assert "parse.linux" not in snap
+
+
+def test_observers_see_each_call() -> None:
+    rec = Recorder()
+    profiling.attach(rec)
+    profiling.attach(rec)  # attaching twice is a no-op
+    try:
+        normalize_many(["  Darwin 24.6.0 arm64\n", "Windows 11", "Windows 11"])
+    finally:
+        profiling.detach(rec)
+    normalize_os("Windows 11")
+    # Duplicates are parsed once; observers see the stripped text
+    assert [text for text, _, _ in rec.calls] == ["Darwin 24.6.0 arm64", "Windows 11"]
+    text, stages, total = rec.calls[0]
+    assert set(stages) == {"detect", "parse.macos", "arch", "cpe"}
+    assert total >= sum(stages.values())
+
+
+def test_pattern_profiler_counts_and_restores() -> None:
+    original = helpers.ARCH_TEXT_RE
+    expected = [normalize_os(text) for text in SAMPLES]
+    with PatternProfiler() as profiler:
+        assert isinstance(juniper.JUNOS_MODEL_RE, CountingPattern)
+        # Re-exports share the counter of the defining module
+        assert network.JUNOS_RE is juniper.JUNOS_RE
+        assert juniper.JUNOS_RE.pattern == r"\bjunos\b"
+        assert [normalize_os(text) for text in SAMPLES] == expected
+    assert type(juniper.JUNOS_MODEL_RE) is re.Pattern
+    assert helpers.ARCH_TEXT_RE is original
+
+    stats = {s.name: s for s in profiler.report()}
+    assert "os_normalizer.parsers.network.JUNOS_RE" not in stats
+    junos_model = stats["os_normalizer.parsers.network.juniper.JUNOS_MODEL_RE"]
+    assert (junos_model.scans, junos_model.matches) == (1, 1)
+    assert stats["os_normalizer.helpers.ARCH_TEXT_RE"].scans >= len(SAMPLES) - 2
+    # Ranked by cumulative time
+    seconds = [s.seconds for s in profiler.report()]
+    assert seconds == sorted(seconds, reverse=True)
+    assert all(s.scans and not s.matches for s in profiler.dead())
+    assert "os_normalizer.parsers.network.cisco.CISCO_NXOS_RE" in {s.name for s in profiler.dead()}
+
+
+def test_counting_pattern_methods() -> None:
+    pat = CountingPattern(re.compile(r"\d+"), "digits")
+    assert pat.search("a1").group(0) == "1"
+    assert pat.match("a1") is None
+    assert pat.fullmatch("12")
+    assert pat.findall("1 2") == ["1", "2"]
+    assert [m.group(0) for m in pat.finditer("3 4")] == ["3", "4"]
+    assert pat.sub("#", "a1b2") == "a#b#"
+    assert pat.subn("#", "ab") == ("ab", 0)
+    assert pat.split("a1b") == ["a", "b"]
+    assert (pat.scans, pat.matches) == (8, 6)
+    assert pat.groups == 0
+
+
+def test_slow_input_sampler_keeps_slowest() -> None:
+    sampler = SlowInputSampler(size=3)
+    for i, seconds in enumerate([0.5, 0.1, 0.9, 0.3, 0.7]):
+        sampler.observe(f"input {i}", {}, {"detect": seconds / 2}, seconds)
+    assert len(sampler) == 3
+    dumped = sampler.dump()
+    assert [e.seconds for e in dumped] == [0.9, 0.7, 0.5]
+    assert [e.text for e in dumped] == ["input 2", "input 4", "input 0"]
+    assert dumped[0].stages == {"detect": 0.45}
+    assert dumped[0].data is None
+    sampler.clear()
+    assert sampler.dump() == []
+    sampler.observe("after clear", {}, {}, 0.01)
+    assert len(sampler) == 1
+
+
+def test_slow_input_sampler_concurrent_observers() -> None:
+    sampler = SlowInputSampler(size=10)
+    totals = [random.Random(seed).random() for seed in range(4000)]
+
+    def feed(part: list[float]) -> None:
+        for total in part:
+            sampler.observe("x", {}, {}, total)
+
+    threads = [threading.Thread(target=feed, args=(totals[i::4],)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [e.seconds for e in sampler.dump()] == sorted(totals, reverse=True)[:10]
+
+
+def test_slow_input_sampler_threshold_and_truncation() -> None:
+    sampler = SlowInputSampler(size=5, threshold=0.01, max_chars=4)
+    sampler.observe("fast input", {}, {}, 0.001)
+    stages = {"detect": 0.02}
+    sampler.observe("slow input", {"os": "windows"}, stages, 0.02)
+    stages["detect"] = 1.0  # the sampler keeps its own copy
+    (entry,) = sampler.dump()
+    assert entry.text == "slow"
+    assert entry.data == {"os": "windows"}
+    assert entry.stages == {"detect": 0.02}
+    with pytest.raises(ValueError):
+        SlowInputSampler(size=0)
+
+
+def test_slow_input_sampler_attached() -> None:
+    data = {"os_release": "ID=ubuntu\nVERSION_ID=22.04"}
+    with SlowInputSampler(size=len(SAMPLES) + 1) as sampler:
+        for text in SAMPLES:
+            normalize_os(text)
+        normalize_os("Linux host 5.15.0 x86_64 " + "x" * 20_000, data)
+    assert profiling.OBSERVERS == ()
+    dumped = sampler.dump()
+    assert len(dumped) == len(SAMPLES) + 1
+    assert [e.seconds for e in dumped] == sorted((e.seconds for e in dumped), reverse=True)
+    assert all(e.seconds >= sum(e.stages.values()) for e in dumped)
+    assert "total" not in dumped[0].stages
+    slow = next(e for e in dumped if e.text.startswith("Linux host 5.15.0"))
+    assert slow.data == data
+    assert "parse.linux" in slow.stages
+
+
+def test_slow_input_sampler_keeps_whole_windowed_input() -> None:
+    big = "noise line without anchors\n" * 5000 + "Linux host 5.15.0-122-generic x86_64"
+    with SlowInputSampler(size=1) as sampler:
+        expected = normalize_os(big)
+    (entry,) = sampler.dump()
+    assert "windowed" in expected.evidence
+    assert entry.text == big
+    assert normalize_os(entry.text) == expected
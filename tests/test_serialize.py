@@ -0,0 +1,122 @@
+"""Round-trip tests for OSData serializers."""
+
+import json
+import pickle
+
+import pytest
+
+from os_normalizer import OSData, merge_os, normalize_os
+from os_normalizer.constants import OSFamily, PrecisionLevel
+from os_normalizer.models import SCHEMA_VERSION
+
+SAMPLES = [
+    ("Windows NT 10.0 build 22631 Enterprise x64", None),
+    ("Linux host 5.15.0-122-generic x86_64", {"os_release": "ID=ubuntu\nID_LIKE=debian\nVERSION_ID=22.04"}),
+    ("Darwin 24.6.0 arm64", None),
+    ("Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9", None),
+    ("Huawei VRP V800R012C00SPC500 S5720-28X-SI-AC", None),
+    ("FreeBSD 13.2-RELEASE amd64", None),
+    ("HarmonyOS 5.0.0.107", None),
+    ("N/A", None),
+]
+
+
+def _results() -> list[OSData]:
+    out = [normalize_os(text, data) for text, data in SAMPLES]
+    out.append(merge_os(normalize_os("Junos: 20.4R3-S3"), normalize_os("Junos: 21.2R1")))
+    return out
+
+
+def _assert_same(got: OSData, want: OSData) -> None:
+    assert got == want
+    assert got.os_key == want.os_key
+    assert got.family is None or isinstance(got.family, OSFamily)
+    assert isinstance(got.precision, PrecisionLevel)
+
+
+@pytest.mark.parametrize("p", _results(), ids=lambda p: str(p)[:30])
+def test_dict_round_trip(p: OSData) -> None:
+    d = p.to_dict()
+    assert all(v is not None for v in d.values())
+    _assert_same(OSData.from_dict(json.loads(json.dumps(d))), p)
+    _assert_same(OSData.from_dict(p.to_dict(omit_none=False)), p)
+
+
+@pytest.mark.parametrize("p", _results(), ids=lambda p: str(p)[:30])
+def test_tuple_and_bytes_round_trip(p: OSData) -> None:
+    t = p.to_tuple()
+    assert t[0] == SCHEMA_VERSION
+    _assert_same(OSData.from_tuple(t), p)
+    _assert_same(OSData.from_tuple(pickle.loads(pickle.dumps(t))), p)
+    _assert_same(OSData.from_bytes(p.to_bytes()), p)
+
+
+def test_to_dict_shape() -> None:
+    p = normalize_os("Darwin 24.6.0 arm64")
+    d = p.to_dict()
+    assert d["family"] == "macos"
+    assert type(d["family"]) is str
+    assert "edition" not in d
+    assert "like_distros" not in d
+
+    full = p.to_dict(omit_none=False)
+    assert full["edition"] is None
+    assert full["like_distros"] == []
+    assert list(full) == [f for f in OSData.__dataclass_fields__]
+
+    # The dict is a copy: mutating it leaves the source untouched
+    full["evidence"]["x"] = 1
+    assert "x" not in p.evidence
+
+
+def test_from_dict_ignores_unknown_keys() -> None:
+    p = OSData.from_dict({"family": "linux", "precision": "major", "version_major": 9, "future_field": 1})
+    assert p.family is OSFamily.LINUX
+    assert p.precision is PrecisionLevel.MAJOR
+    assert p.version_major == 9
+
+
+def test_from_tuple_rejects_other_schema_versions() -> None:
+    t = normalize_os("Darwin 24.6.0 arm64").to_tuple()
+    with pytest.raises(ValueError):
+        OSData.from_tuple((SCHEMA_VERSION + 1, *t[1:]))
+
+
+@pytest.mark.parametrize("p", _results(), ids=lambda p: str(p)[:30])
+def test_pickle_round_trip(p: OSData) -> None:
+    for protocol in (2, pickle.HIGHEST_PROTOCOL):
+        _assert_same(pickle.loads(pickle.dumps(p, protocol)), p)
+
+
+def test_pickle_omits_default_fields() -> None:
+    blank = OSData()
+    q = pickle.loads(pickle.dumps(blank))
+    assert q == blank
+    assert q.precision is PrecisionLevel.UNKNOWN
+    # A default instance ships nothing but its (empty) field mask
+    assert q.__reduce__()[1] == (0,)
+
+    p = normalize_os("Darwin 24.6.0 arm64")
+    assert len(pickle.dumps(p)) < len(pickle.dumps(p.to_dict(omit_none=False)))
+
+
+def test_pickle_keeps_explicit_falsy_values() -> None:
+    p = OSData(version_major=0, vendor="", evidence={"k": 0})
+    q = pickle.loads(pickle.dumps(p))
+    assert q.version_major == 0
+    assert q.vendor == ""
+    assert q.evidence == {"k": 0}
+
+
+def test_serializers_leave_lazy_containers_unallocated() -> None:
+    from os_normalizer.helpers import copy_osdata
+    from os_normalizer.models import raw_container
+
+    p = OSData(family=OSFamily.LINUX, product="Ubuntu", version_major=22)
+    fingerprint = OSData(family=OSFamily.LINUX, product="Ubuntu", version_major=22, evidence={}).fingerprint()
+    assert p.to_dict(omit_none=False)["like_distros"] == []
+    assert p.fingerprint() == fingerprint
+    assert p.freeze().thaw().to_dict() == p.to_dict()
+    assert raw_container(copy_osdata(p), "evidence") is None
+    assert raw_container(p, "evidence") is None
+    assert raw_container(p, "like_distros") is None
@@ -0,0 +1,215 @@
+"""Tests for the persistent SQLite result cache."""
+
+import sqlite3
+
+import pytest
+
+from os_normalizer import normalize_os
+from os_normalizer.store import (
+    _LOGIC_MODULES,
+    MmapCache,
+    SQLiteCache,
+    build_mmap_cache,
+    decode_result,
+    encode_result,
+    input_digest,
+    knowledge_fingerprint,
+)
+
+UNAME = "Linux host 5.15.0-122-generic x86_64"
+OSREL = {"os_release": 'NAME="Ubuntu"\nID=ubuntu\nID_LIKE=debian\nVERSION_ID="22.04.4"\nVERSION_CODENAME=jammy'}
+
+SAMPLES = [
+    ("Windows NT 10.0 build 22631 Enterprise x64", None),
+    (UNAME, OSREL),
+    ("Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9", None),
+    ("FortiGate-100F v7.2.7 build1600 (GA) FGT_7.2.7-build1600", None),
+    ("N/A", None),
+]
+
+
+@pytest.mark.parametrize(("text", "data"), SAMPLES)
+def test_encode_decode_round_trip(text, data) -> None:
+    p = normalize_os(text, data)
+    q = decode_result(encode_result(p))
+    assert q == p
+    assert q.os_key == p.os_key
+    assert q.family is None or type(q.family) is type(p.family)
+
+
+def test_input_digest_is_order_independent() -> None:
+    a = input_digest(UNAME, {"os_release": {"ID": "fedora", "VERSION_ID": "39"}})
+    b = input_digest(" " + UNAME, {"os_release": {"VERSION_ID": "39", "ID": "fedora"}})
+    assert a == b
+    assert a != input_digest(UNAME, None)
+
+
+def test_input_digest_accepts_mixed_key_types(tmp_path) -> None:
+    data = {"os_release": "ID=ubuntu", 1: "x"}
+    assert input_digest(UNAME, data) == input_digest(UNAME, {1: "x", "os_release": "ID=ubuntu"})
+    with SQLiteCache(tmp_path / "results.sqlite") as store:
+        assert store(UNAME, data) == normalize_os(UNAME, data)
+        assert store(UNAME, data) == normalize_os(UNAME, data)
+        assert (store.hits, store.misses) == (1, 1)
+
+
+def test_results_persist_across_reopen(tmp_path, counting) -> None:
+    db = tmp_path / "results.sqlite"
+
+    with SQLiteCache(db) as store:
+        first = store.normalize_many(SAMPLES + [SAMPLES[1], None])
+    assert len(counting.calls) == len(SAMPLES)
+    assert isinstance(first[-1], Exception)
+
+    with SQLiteCache(db) as store:
+        again = store.normalize_many(SAMPLES)
+        single = store(UNAME, OSREL)
+        assert (store.hits, store.misses) == (len(SAMPLES) + 1, 0)
+    assert len(counting.calls) == len(SAMPLES)
+    assert again == [normalize_os(t, d) for t, d in SAMPLES]
+    assert single == normalize_os(UNAME, OSREL)
+
+
+def test_writes_are_batched(tmp_path) -> None:
+    db = tmp_path / "results.sqlite"
+    store = SQLiteCache(db, batch_size=3)
+    for text, data in SAMPLES[:2]:
+        store(text, data)
+
+    def committed() -> int:
+        with sqlite3.connect(db) as conn:
+            return conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    assert committed() == 0
+    store(*SAMPLES[2])
+    assert committed() == 3
+    store(*SAMPLES[3])
+    store.close()
+    assert committed() == 4
+
+
+def test_stale_stamp_invalidates_entries(tmp_path) -> None:
+    db = tmp_path / "results.sqlite"
+    with SQLiteCache(db) as store:
+        store(UNAME, OSREL)
+        assert len(store) == 1
+
+    with sqlite3.connect(db) as conn:
+        conn.execute("UPDATE meta SET value = 'old-version:deadbeef' WHERE name = 'stamp'")
+
+    with SQLiteCache(db) as store:
+        assert len(store) == 0
+        store(UNAME, OSREL)
+        assert store.misses == 1
+
+
+def test_mmap_cache_round_trip(tmp_path) -> None:
+    path = tmp_path / "results.osnm"
+    corpus = [*SAMPLES, SAMPLES[0], None, ("Darwin 24.0.0 arm64", None)]
+    assert build_mmap_cache(path, corpus) == len(SAMPLES) + 1
+
+    with MmapCache(path) as table:
+        assert not table.stale
+        assert len(table) == len(SAMPLES) + 1
+        for text, data in SAMPLES:
+            assert (text, data) in table
+            assert table.get(text, data) == normalize_os(text, data)
+        assert table.get("FreeBSD 13.2-RELEASE") is None
+        assert table("FreeBSD 13.2-RELEASE").product == "FreeBSD"
+        assert (table.hits, table.misses) == (0, 1)
+
+        # Each lookup decodes a fresh object
+        a = table(UNAME, OSREL)
+        a.evidence["mutated"] = True
+        assert "mutated" not in table(UNAME, OSREL).evidence
+
+
+def test_mmap_cache_shared_across_processes(tmp_path) -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    path = tmp_path / "results.osnm"
+    build_mmap_cache(path, SAMPLES)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        texts, datas = zip(*SAMPLES[:2], strict=True)
+        products = list(pool.map(_lookup_product, [str(path)] * 2, texts, datas))
+    assert products == ["Windows 11", "Ubuntu"]
+
+
+def _lookup_product(path: str, text: str, data: dict | None) -> str | None:
+    with MmapCache(path) as table:
+        hit = table.get(text, data)
+        return hit.product if hit else None
+
+
+def test_mmap_cache_stale_stamp_is_ignored(tmp_path, monkeypatch) -> None:
+    import os_normalizer.store as store
+
+    path = tmp_path / "results.osnm"
+    build_mmap_cache(path, SAMPLES)
+    monkeypatch.setattr(store, "library_version", lambda: "999.0")
+    with MmapCache(path) as table:
+        assert table.stale
+        assert table.get(UNAME, OSREL) is None
+
+
+def test_mmap_cache_rejects_foreign_files(tmp_path) -> None:
+    path = tmp_path / "bogus.osnm"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        MmapCache(path)
+
+
+@pytest.mark.parametrize("keep", [0, 10, 40, 200])
+def test_mmap_cache_rejects_truncated_files(tmp_path, monkeypatch, keep) -> None:
+    import mmap
+
+    import os_normalizer.store as store
+
+    path = tmp_path / "results.osnm"
+    build_mmap_cache(path, SAMPLES)
+    path.write_bytes(path.read_bytes()[:keep])
+
+    opened: list[mmap.mmap] = []
+    real = mmap.mmap
+
+    def tracking(*args, **kwargs):
+        opened.append(real(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(store.mmap, "mmap", tracking)
+    with pytest.raises(ValueError):
+        MmapCache(path)
+    assert all(m.closed for m in opened)
+
+
+@pytest.fixture
+def fresh_fingerprint():
+    """Recompute knowledge_fingerprint() for the test and again once it is undone."""
+    knowledge_fingerprint.cache_clear()
+    yield
+    knowledge_fingerprint.cache_clear()
+
+
+def test_table_change_invalidates_stored_results(tmp_path, monkeypatch, fresh_fingerprint) -> None:
+    from os_normalizer import constants
+
+    db = tmp_path / "results.sqlite"
+    with SQLiteCache(db) as store:
+        store(UNAME, OSREL)
+    before = knowledge_fingerprint()
+
+    monkeypatch.setattr(constants, "MACOS_DARWIN_MAP", {**constants.MACOS_DARWIN_MAP, 99: "Future"})
+    knowledge_fingerprint.cache_clear()
+    assert knowledge_fingerprint() != before
+    with SQLiteCache(db) as store:
+        assert len(store) == 0
+
+
+@pytest.mark.parametrize("name", ["canonical.py", "options.py", "window.py", "parsers"])
+def test_fingerprint_covers_parsing_modules(monkeypatch, fresh_fingerprint, name) -> None:
+    import os_normalizer.store as store
+
+    before = knowledge_fingerprint()
+    monkeypatch.setattr(store, "_LOGIC_MODULES", tuple(m for m in _LOGIC_MODULES if m != name))
+    knowledge_fingerprint.cache_clear()
+    assert knowledge_fingerprint() != before
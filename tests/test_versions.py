@@ -0,0 +1,112 @@
+"""Tests for packed version keys."""
+
+import pytest
+
+from os_normalizer import OSData, normalize_os
+from os_normalizer.constants import OSFamily
+from os_normalizer.versions import KEY_BITS, version_key
+
+
+def _net(vendor: str, build: str, major: int, minor: int, patch: int | None = None) -> OSData:
+    return OSData(
+        family=OSFamily.NETWORK,
+        vendor=vendor,
+        version_major=major,
+        version_minor=minor,
+        version_patch=patch,
+        version_build=build,
+    )
+
+
+def _assert_ascending(items: list[OSData]) -> None:
+    keys = [version_key(p) for p in items]
+    assert keys == sorted(keys)
+    assert len(set(keys)) == len(keys)
+
+
+def test_junos_ordering() -> None:
+    builds = ["20.4R1", "20.4R3", "20.4R3.13", "20.4R3-S1", "20.4R3-S3", "20.4R3-S3.4", "20.4R10", "21.1R1"]
+    _assert_ascending([_net("Juniper", b, int(b[:2]), int(b[3])) for b in builds])
+
+
+def test_junos_beta_before_release() -> None:
+    _assert_ascending([_net("Juniper", "21.2B1", 21, 2), _net("Juniper", "21.2R1", 21, 2)])
+
+
+def test_cisco_ordering() -> None:
+    _assert_ascending(
+        [
+            _net("Cisco", "17.9.4", 17, 9, 4),
+            _net("Cisco", "17.9.4a", 17, 9, 4),
+            _net("Cisco", "17.9.4b", 17, 9, 4),
+            _net("Cisco", "17.9.5", 17, 9, 5),
+            _net("Cisco", "17.12.1", 17, 12, 1),
+        ]
+    )
+    _assert_ascending(
+        [
+            _net("Cisco", "15.2(4)E10", 15, 2, 4),
+            _net("Cisco", "15.2(7)E2", 15, 2, 7),
+            _net("Cisco", "15.2(7)E4", 15, 2, 7),
+            _net("Cisco", "15.2(7)E10", 15, 2, 7),
+        ]
+    )
+
+
+def test_vrp_ordering() -> None:
+    _assert_ascending(
+        [
+            _net("Huawei", "V200R019C10", 200, 19),
+            _net("Huawei", "V200R019C10SPC500", 200, 19),
+            _net("Huawei", "V200R019C10SPC500SPH003", 200, 19),
+            _net("Huawei", "V200R019C10SPC600", 200, 19),
+            _net("Huawei", "V200R019C20", 200, 19),
+            _net("Huawei", "V800R012C00SPC500", 800, 12),
+        ]
+    )
+
+
+def test_windows_orders_by_build_then_ubr() -> None:
+    _assert_ascending(
+        [
+            normalize_os("Microsoft Windows [Version 10.0.19045.5011]"),
+            normalize_os("Microsoft Windows [Version 10.0.22621.4317]"),
+            normalize_os("Microsoft Windows [Version 10.0.22631.3880]"),
+            normalize_os("Microsoft Windows [Version 10.0.22631.4317]"),
+        ]
+    )
+
+
+def test_missing_parts_sort_first() -> None:
+    assert version_key(OSData()) == 0
+    _assert_ascending(
+        [
+            OSData(family=OSFamily.MACOS, version_major=14),
+            OSData(family=OSFamily.MACOS, version_major=14, version_minor=0),
+            OSData(family=OSFamily.MACOS, version_major=14, version_minor=5),
+            OSData(family=OSFamily.MACOS, version_major=15),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "VMware ESXi 7.0.3 build-20328353",
+        "Huawei VRP V800R012C00SPC500 S5720-28X-SI-AC",
+        "Junos: 20.4R3-S3 jinstall-ex-4300-20.4R3-S3.tgz EX4300-48T",
+        "Windows NT 10.0 build 22631 Enterprise x64",
+        "HarmonyOS 5.0.0.107",
+    ],
+)
+def test_keys_fit_in_64_bits_and_match_frozen(text: str) -> None:
+    p = normalize_os(text)
+    key = p.version_key()
+    assert 0 < key < 1 << KEY_BITS
+    assert p.freeze().version_key() == key
+
+
+def test_oversized_components_saturate() -> None:
+    big = OSData(family=OSFamily.LINUX, version_major=10**9, version_minor=10**9)
+    assert version_key(big) < 1 << KEY_BITS
+    assert version_key(big) > version_key(OSData(family=OSFamily.LINUX, version_major=4000))
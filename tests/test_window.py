@@ -0,0 +1,120 @@
+"""Tests for input windowing and linear-time parsing of oversized inputs."""
+
+import time
+
+import pytest
+
+from os_normalizer import NormalizeOptions, normalize_os
+from os_normalizer.constants import OSFamily
+from os_normalizer.window import LINE_CONTEXT, relevant_region
+
+LOG = "".join(
+    f"2025-01-01 12:00:{i % 60:02d} app[{i}]: request handled in {i % 97} ms status=200\n" for i in range(3000)
+)
+BANNER = "Cisco IOS XE Software, Version 17.9.4a (Amsterdam) C9300-24T, universalk9"
+UNBOUNDED = NormalizeOptions(max_scan=None)
+
+
+def test_short_text_is_untouched() -> None:
+    assert relevant_region("Junos 20.4R3", OSFamily.NETWORK, 100) == "Junos 20.4R3"
+
+
+def test_region_keeps_anchor_lines_in_order() -> None:
+    text = "noise\n" * 50 + "Linux host 5.15.0 x86_64\n" + "noise\n" * 50 + "kernel: 5.15.0\n" + "noise\n" * 50
+    # Budget left after the anchor lines is filled from the head of the input
+    expected = "noise\n" * 10 + "Linux host 5.15.0 x86_64\nkernel: 5.15.0"
+    assert relevant_region(text, OSFamily.LINUX, 100) == expected
+
+
+def test_family_words_take_precedence_over_generic_ones() -> None:
+    text = "build 1\n" * 40 + "Darwin 24.6.0 arm64\n"
+    # Only room for one line: the family anchor wins although generic lines come first
+    assert relevant_region(text, OSFamily.MACOS, 20) == "Darwin 24.6.0 arm64"
+    assert relevant_region(text, OSFamily.MACOS, 28) == "build 1\nDarwin 24.6.0 arm64"
+
+
+def test_long_lines_keep_context_around_anchor() -> None:
+    text = "x" * 5000 + " junos 20.4R3 " + "y" * 5000
+    region = relevant_region(text, OSFamily.NETWORK, 4000)
+    assert len(region) <= 4000
+    # LINE_CONTEXT characters on each side of the anchor, after head filler
+    context = text[5001 - LINE_CONTEXT : 5006 + LINE_CONTEXT]
+    assert region.endswith("\n" + context)
+    assert region[: -len(context) - 1] == "x" * (4000 - len(context) - 1)
+
+
+def test_architecture_lines_are_kept() -> None:
+    filler = "".join(f"line {i}: lorem ipsum, warm alarm\n" for i in range(3000))
+    windows = "Microsoft Windows [Version 10.0.19045.3803]\n" + filler + "System Type: x64-based PC"
+    linux = "Linux host 5.15.0-122-generic\n" + filler + "Architecture: x86_64\n"
+    for text in (windows, linux):
+        p = normalize_os(text)
+        assert "windowed" in p.evidence
+        assert p.arch == "x86_64"
+        assert p.os_key == normalize_os(text, options=UNBOUNDED).os_key
+    # "arm" inside "warm"/"alarm" is not an architecture anchor
+    assert relevant_region("warm alarm\n" * 100 + "x86_64", None, 7) == "x86_64"
+
+
+def test_no_anchor_falls_back_to_head() -> None:
+    assert relevant_region("z" * 500, None, 10) == "z" * 10
+
+
+def test_banner_inside_large_log() -> None:
+    text = LOG + BANNER + "\n" + LOG
+    assert len(text) > 100_000
+    p = normalize_os(text, options=NormalizeOptions(max_scan=4096))
+    expected = normalize_os(BANNER)
+    for name in ("family", "vendor", "product", "version_build", "hw_model", "edition", "codename"):
+        assert getattr(p, name) == getattr(expected, name)
+    assert p.evidence["windowed"] is True
+    assert "windowed" not in normalize_os(text, options=UNBOUNDED).evidence
+    assert normalize_os(text, options=UNBOUNDED).version_build == "17.9.4a"
+
+
+def test_max_scan_validation() -> None:
+    with pytest.raises(ValueError):
+        NormalizeOptions(max_scan=0)
+
+
+def _best_time(text: str, options: NormalizeOptions) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        normalize_os(text, options=options)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# Inputs that used to drive unbounded lazy scans (KERNEL_RE, LINUX_VER_FALLBACK_RE, DARWIN_RE)
+# into quadratic time, plus one per parser family
+PATHOLOGICAL = {
+    "kernel words": lambda n: "linux " + "kernel " * (n // 7),
+    "linux words": lambda n: "linux " * (n // 6),
+    "darwin words": lambda n: "darwin " * (n // 7),
+    "windows builds": lambda n: "windows " + "build " * (n // 6),
+    "cisco": lambda n: "cisco " + "ios " * (n // 4),
+    "junos": lambda n: "junos " + "1.1R" * (n // 4),
+    "fortigate": lambda n: "fortigate " + "v1." * (n // 3),
+    "freebsd": lambda n: "freebsd " * (n // 8),
+    "esxi": lambda n: "vmware esxi " * (n // 12),
+    "sunos": lambda n: "sunos " * (n // 6),
+    "android": lambda n: "android " + "1." * (n // 2),
+    "log": lambda n: LOG[: n // 2] + "Linux host 5.15.0" + LOG[: n // 2],
+}
+
+
+@pytest.mark.parametrize("make", PATHOLOGICAL.values(), ids=PATHOLOGICAL.keys())
+def test_parsing_time_grows_linearly(make) -> None:
+    # 8x the input should cost ~8x (64x if quadratic); the bound leaves room for timer noise
+    small = _best_time(make(4_000), UNBOUNDED)
+    large = _best_time(make(32_000), UNBOUNDED)
+    assert large < 24 * max(small, 1e-4)
+
+
+def test_window_bounds_parsing_of_huge_inputs() -> None:
+    # Beyond max_scan only detection and the anchor scan grow with the input
+    make = PATHOLOGICAL["linux words"]
+    small = _best_time(make(200_000), NormalizeOptions())
+    large = _best_time(make(1_600_000), NormalizeOptions())
+    assert large < 24 * max(small, 1e-4)